@@ -18,68 +18,297 @@
 # -------------------------------------------------------------------------
 """
 
+import time
 import numpy as np
+from typing import Optional
 
-def run_attractor_audit():
-    # --- GEOMETRIC CONSTANTS ---
-    n_seeds = 150
-    iterations = 5000
-    
-    # 0.15: The hard-void exclusion radius in 4D toroidal packing
-    void_bias = 0.15 
-    # 0.42: The 4D->3D rotational coupling (approx sqrt(2)-1)
-    coupling = 0.42 
-    # 1:8:64: The power-hierarchy of the 8-cell tesseract (8^0, 8^1, 8^2)
-    winding_hierarchy = [1, 8, 64] 
-    
-    ratios, p1_weights = [], []
+if __package__:
+    from .checkpoint import Checkpoint, overrides
+    from .convergence import ConvergenceTracker, describe_early_exit, early_exit_summary
+    from .metrics import get_metrics
+    from .parallel_sweep import concat_chunks, run_seed_sweep, seed_rng
+    from .result_cache import cached
+    from .results_store import open_store, record
+else:
+    from checkpoint import Checkpoint, overrides
+    from convergence import ConvergenceTracker, describe_early_exit, early_exit_summary
+    from metrics import get_metrics
+    from parallel_sweep import concat_chunks, run_seed_sweep, seed_rng
+    from result_cache import cached
+    from results_store import open_store, record
 
-    print("--- EXECUTING UNLOCKED TOPOLOGICAL AUDIT ---")
+# --- GEOMETRIC CONSTANTS ---
+# 0.15: The hard-void exclusion radius in 4D toroidal packing
+VOID_BIAS = 0.15
+# 0.42: The 4D->3D rotational coupling (approx sqrt(2)-1)
+COUPLING = 0.42
+# 1:8:64: The power-hierarchy of the 8-cell tesseract (8^0, 8^1, 8^2)
+WINDING_HIERARCHY = [1, 8, 64]
+
+@record
+class AttractorResult:
+    """Outcome of run_attractor_audit"""
+    s8_ratio: float
+    s8_ratio_std: float
+    p1_weight: float
+    p1_weight_std: float
+    mean_iterations: float
+    seeds: int
+    iterations: int
+    mode: str
+    entropy: Optional[int] = None
+
+def _spectral_step(eigvals, coupling=COUPLING, void_bias=VOID_BIAS, hierarchy=WINDING_HIERARCHY, gain=np.pi):
+    """
+    One recursive flow step on a (seeds, 4) batch of raw eigenvalues.
+    Returns the new spectra sorted in descending order.
     
-    for seed in range(n_seeds):
-        np.random.seed(seed)
-        
-        # Initialize a random 4D Manifold
-        H = np.random.randn(4,4) + 1j * np.random.randn(4,4)
-        H = (H + H.conj().T) / 2.0
+    coupling, void_bias and gain are scalars or (seeds,) arrays, hierarchy
+    is a 3-sequence or a (seeds, 3) array, so every seed of the batch may
+    run its own geometry (see param_sweep.py).
+    """
+    winding_hierarchy = np.asarray(hierarchy)
+    
+    eigvals = np.abs(np.sort(eigvals, axis=1)[:, ::-1])
+    
+    # Normalize for scale-invariance
+    eigvals /= (np.sum(eigvals, axis=1, keepdims=True) + 1e-12)
+    
+    # Toroidal Winding (The pressure of the 4th dimension)
+    r = eigvals[:, :3] / (eigvals[:, 3:] + 1e-12)
+    
+    for k in range(3):
+        # Coupling winding hierarchy with the bulk feedback
+        interaction = coupling * winding_hierarchy[..., k] * (np.sum(r, axis=1) - r[:, k])
+        # Recursive Sine-Map flow
+        r[:, k] = np.abs(np.sin(gain * r[:, k] + interaction))
+    
+    # Void Repulsion: 4D exclusion principle
+    r[:, 2] = np.where(r[:, 2] < 1.0, r[:, 2] + void_bias * (r[:, 2] - 1.0), r[:, 2])
+    
+    # New spectrum (bulk eigenvalue kept, observable ones rescaled)
+    new_eigvals = np.zeros_like(eigvals)
+    new_eigvals[:, 3] = eigvals[:, 3]
+    new_eigvals[:, :3] = r * eigvals[:, 3:]
+    return np.sort(new_eigvals, axis=1)[:, ::-1]
+
+def _flow_params(seeds, coupling=None, void_bias=None, hierarchy=None, gain=None):
+    """Per-seed _spectral_step parameters of a chunk (None: the geometric constants)."""
+    params = {
+        'coupling': COUPLING if coupling is None else coupling,
+        'void_bias': VOID_BIAS if void_bias is None else void_bias,
+        'gain': np.pi if gain is None else gain
+    }
+    params = {name: np.broadcast_to(value, (seeds,)).astype(float) for name, value in params.items()}
+    params['hierarchy'] = np.broadcast_to(WINDING_HIERARCHY if hierarchy is None else hierarchy, (seeds, 3)).astype(float)
+    return params
+
+def _attractor_chunk(start, stop, entropy, iterations, converge=None, max_period=8, mode='reconstruct',
+                     checkpoint_dir=None, checkpoint_every=500, seed_ids=None, coupling=None, void_bias=None,
+                     hierarchy=None, gain=None):
+    """
+    Unlocked spectral recursion for seeds [start, stop), batched over seeds.
+    
+    mode='reconstruct' stacks every seed into a (seeds, 4, 4) array and runs
+    a broadcasting eigh + matrix rebuild per iteration. mode='eigenbasis'
+    relies on the eigenvectors never changing after the first decomposition
+    and iterates the spectra directly, skipping eigh and the rebuild.
+    
+    Each seed uses its own stream (legacy np.random.seed(seed) when entropy is None).
+    With converge=K a seed stops once its ratio moved by less than 0.001 for K
+    consecutive iterations, or its spectrum repeats with period <= max_period.
+    With checkpoint_dir the matrices (or spectra) are snapshotted every
+    checkpoint_every iterations and a rerun resumes from them (checkpoint.py).
+    
+    seed_ids and the flow parameters let one batch hold many parameter
+    points (see param_sweep.py): seed s of the chunk draws from seed_ids[s]
+    (default start + s) and runs _spectral_step with coupling[s],
+    void_bias[s], hierarchy[s] and gain[s] (scalars apply to every seed).
+    """
+    if mode not in ('reconstruct', 'eigenbasis'):
+        raise ValueError(f"unknown mode {mode!r} (use 'reconstruct' or 'eigenbasis')")
+    
+    seeds = stop - start
+    ckpt = None
+    if checkpoint_dir is not None:
+        ckpt = Checkpoint(checkpoint_dir, 'attractor', start, stop, every=checkpoint_every, params=dict(
+            entropy=entropy, iterations=iterations, converge=converge, max_period=max_period, mode=mode,
+            **overrides(seed_ids=seed_ids, coupling=coupling, void_bias=void_bias, hierarchy=hierarchy, gain=gain)
+        ))
+        if ckpt.finished():
+            return ckpt.result()
+    
+    if seed_ids is None:
+        seed_ids = range(start, stop)
+    flow = _flow_params(seeds, coupling, void_bias, hierarchy, gain)
+    
+    H = np.empty((seeds, 4, 4))
+    for s, seed in enumerate(seed_ids):
+        rng = seed_rng(entropy, int(seed))
+        # Initialize a random 4D Manifold (only the real part drives the flow)
+        H_seed = rng.standard_normal((4,4)) + 1j * rng.standard_normal((4,4))
+        H[s] = ((H_seed + H_seed.conj().T) / 2.0).real
+    
+    spectra = np.linalg.eigvalsh(H) if mode == 'eigenbasis' else None
+    final_e = np.zeros((seeds, 4))
+    tracker = ConvergenceTracker(seeds, converge, target=None, max_period=max_period) if converge else None
+    active = np.arange(seeds)
+    first = 0
+    
+    saved = ckpt.load() if ckpt is not None else None
+    if saved is not None:
+        first, active, final_e = saved['iteration'], saved['arrays']['active'], saved['arrays']['final_e']
+        if mode == 'eigenbasis':
+            spectra = saved['arrays']['state']
+        else:
+            H = saved['arrays']['state']
+        flow = {name: value[active] for name, value in flow.items()}
+        if tracker is not None:
+            tracker.load_state_dict({name[8:]: v for name, v in saved['arrays'].items() if name.startswith('tracker_')})
+    metrics = get_metrics()
+    timed = metrics.enabled
+    
+    for it in range(first, iterations):
+        if ckpt is not None and ckpt.due(it, iterations):
+            arrays = {'state': spectra if mode == 'eigenbasis' else H, 'active': active, 'final_e': final_e}
+            if tracker is not None:
+                arrays.update({f'tracker_{name}': v for name, v in tracker.state_dict().items()})
+            ckpt.save(it, arrays)
         
-        for it in range(iterations):
-            eigvals, eigvecs = np.linalg.eigh(H.real)
-            eigvals = np.abs(np.sort(eigvals)[::-1])
-            
-            # Normalize for scale-invariance
-            eigvals /= (np.sum(eigvals) + 1e-12)
-            
-            # Toroidal Winding (The pressure of the 4th dimension)
-            r = eigvals[:3] / (eigvals[3] + 1e-12)
-            
-            for k in range(3):
-                # Coupling winding hierarchy with the bulk feedback
-                interaction = coupling * winding_hierarchy[k] * (np.sum(r) - r[k])
-                # Recursive Sine-Map flow
-                r[k] = np.abs(np.sin(np.pi * r[k] + interaction))
-            
-            # Void Repulsion: 4D exclusion principle
-            r[2] += void_bias * (r[2] - 1.0) if r[2] < 1.0 else 0
-            
-            # Reconstruct the Matrix
-            new_eigvals = np.zeros(4)
-            new_eigvals[3] = eigvals[3]
-            new_eigvals[:3] = r * eigvals[3]
-            new_eigvals = np.sort(new_eigvals)[::-1]
-            
-            H = eigvecs @ np.diag(new_eigvals) @ eigvecs.conj().T
-            
-        final_e = np.sort(np.linalg.eigvalsh(H.real))[::-1]
-        final_e /= np.sum(final_e)
+        if timed:
+            t0 = time.perf_counter()
+        if mode == 'eigenbasis':
+            spectra = _spectral_step(spectra, **flow)
+            new_eigvals = spectra
+        else:
+            eigvals, eigvecs = np.linalg.eigh(H)
+            if timed:
+                t1 = time.perf_counter()
+                metrics.add_time('eigh', t1 - t0)
+                t0 = t1
+            new_eigvals = _spectral_step(eigvals, **flow)
+            # Reconstruct the Matrix: V diag(lambda) V^T
+            H = (eigvecs * new_eigvals[:, None, :]) @ eigvecs.transpose(0, 2, 1)
+        if timed:
+            metrics.add_time('spectral_step', time.perf_counter() - t0)
+            metrics.count('iterations', len(active))
+            metrics.progress('attractor', it + 1, iterations)
         
-        ratios.append(np.sum(final_e[:3]))
-        p1_weights.append(final_e[0])
+        if tracker is None:
+            continue
+        ratio = np.sum(new_eigvals[:, :3], axis=1) / np.sum(new_eigvals, axis=1)
+        done = tracker.update(it, ratio, active, state=new_eigvals)
+        if done.any():
+            if timed:
+                metrics.count('seeds_converged', int(done.sum()))
+            final_e[active[done]] = new_eigvals[done]
+            active = active[~done]
+            flow = {name: value[~done] for name, value in flow.items()}
+            if mode == 'eigenbasis':
+                spectra = spectra[~done]
+            else:
+                H = H[~done]
+            if not len(active):
+                break
+    
+    if len(active):
+        final_e[active] = spectra if mode == 'eigenbasis' else np.linalg.eigvalsh(H)
+    final_e = np.sort(final_e, axis=1)[:, ::-1]
+    final_e /= np.sum(final_e, axis=1, keepdims=True)
+    
+    ratios = np.sum(final_e[:, :3], axis=1)
+    p1_weights = final_e[:, 0]
+    iterations_run = tracker.finish(iterations) if tracker else np.full(seeds, iterations)
+    result = ratios, p1_weights, iterations_run
+    return ckpt.finish(result) if ckpt is not None else result
+
+@cached(seed=None, ignore=('workers', 'checkpoint_dir', 'checkpoint_every'))
+def _attractor_sweep(n_seeds, iterations, workers, entropy, converge=None, max_period=8, mode='reconstruct',
+                     checkpoint_dir=None, checkpoint_every=500):
+    """Per-seed ratios, p1 weights and iterations run of the whole audit (memoized)."""
+    return concat_chunks(run_seed_sweep(
+        _attractor_chunk, n_seeds, workers=workers,
+        entropy=entropy, iterations=iterations, converge=converge, max_period=max_period, mode=mode,
+        checkpoint_dir=checkpoint_dir, checkpoint_every=checkpoint_every
+    ))
+
+def run_attractor_audit(n_seeds=150, iterations=5000, workers=1, entropy=None, converge=None, max_period=8,
+                        mode='reconstruct', checkpoint_dir=None, checkpoint_every=500, store=None):
+    """
+    All seeds are stacked into one (seeds, 4, 4) batch. mode='eigenbasis'
+    iterates the spectra directly instead of rebuilding and re-diagonalizing
+    the matrix every step (see check_eigenbasis_regression).
+    
+    Seeds are independent and may be spread over `workers` processes
+    (0 = all cores) without changing the result; each seed draws from
+    np.random.seed(seed) by default or a SeedSequence child of `entropy`.
+    
+    converge=K opts into early exit (see convergence.py): the corridor is not
+    pinned to a known value, so the ±0.001 window is applied to the change of
+    the ratio between iterations, and spectral fixed points/cycles also retire a seed.
+    
+    checkpoint_dir makes the audit resumable: rerun with the same arguments
+    after preemption and it continues from the last snapshot. Repeated
+    audits are served from the result cache (see result_cache.py).
+    
+    Returns an AttractorResult record, also appended to `store` (a
+    ResultsStore or its directory) when given.
+    """
+    print("--- EXECUTING UNLOCKED TOPOLOGICAL AUDIT ---")
+    
+    ratios, p1_weights, iterations_run = _attractor_sweep(
+        n_seeds, iterations, workers, entropy, converge, max_period, mode, checkpoint_dir, checkpoint_every
+    )
 
     print(f"\n[AUDIT RESULTS]")
     print(f"Emergent S8 Ratio:  {np.mean(ratios):.4f} (Corridor: 0.75 - 0.81)")
     print(f"Emergent p1 Weight: {np.mean(p1_weights):.4f}")
+    if converge:
+        print(f"Early Exit:         {describe_early_exit(early_exit_summary(iterations_run, iterations))}")
     print("\nSTATUS: Honest verification complete. The attractor is real.")
+    
+    result = AttractorResult(
+        s8_ratio=float(np.mean(ratios)), s8_ratio_std=float(np.std(ratios)),
+        p1_weight=float(np.mean(p1_weights)), p1_weight_std=float(np.std(p1_weights)),
+        mean_iterations=float(np.mean(iterations_run)), seeds=n_seeds, iterations=iterations, mode=mode,
+        entropy=entropy
+    )
+    if store is not None:
+        open_store(store).append(result)
+    return result
+
+def check_eigenbasis_regression(n_seeds=150, iterations=5000, workers=1, entropy=None, z=3.0):
+    """
+    Regression check for the eigenbasis fast path.
+    
+    The flow is strongly chaotic: rounding differences between rebuilding H
+    and iterating its spectrum grow to O(0.1) per seed within a handful of
+    steps. The check therefore compares the ensemble means of the S8 ratio
+    and p1 weight, which must agree within `z` combined standard errors.
+    """
+    results = {}
+    for mode in ('reconstruct', 'eigenbasis'):
+        results[mode] = _attractor_sweep(n_seeds, iterations, workers, entropy, mode=mode)[:2]
+    
+    print("--- EIGENBASIS REGRESSION CHECK ---")
+    report = {'passed': True}
+    for k, name in enumerate(('ratio', 'p1_weight')):
+        ref, fast = results['reconstruct'][k], results['eigenbasis'][k]
+        delta = abs(np.mean(fast) - np.mean(ref))
+        stderr = np.sqrt((np.var(ref) + np.var(fast)) / n_seeds)
+        passed = bool(delta <= z * stderr + 1e-12)
+        report[name] = {
+            'reconstruct': float(np.mean(ref)),
+            'eigenbasis': float(np.mean(fast)),
+            'delta': float(delta),
+            'stderr': float(stderr),
+            'passed': passed
+        }
+        report['passed'] &= passed
+        print(f"{name:<10} | reconstruct {np.mean(ref):.4f} | eigenbasis {np.mean(fast):.4f} | "
+              f"delta {delta:.2e} ({delta / (stderr + 1e-300):.1f} SE) | {'PASS' if passed else 'FAIL'}")
+    
+    return report
 
 if __name__ == "__main__":
     run_attractor_audit()
@@ -7,17 +7,57 @@ Tests:
 2. Stability Window (fixed point is stable over time)
 3. Perturbation Resilience (recovers from external shocks)
 4. Scale Invariance (works across particle counts)
-5. Parameter Robustness (survives beta/epsilon variations)
+5. Parameter Robustness (survives beta/epsilon variations; see param_sweep.py)
 6. Null Hypothesis Test (compares to random expectation)
 """
 
+import functools
+import math
+import os
+import time
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import stats
-from dataclasses import dataclass
-from typing import Tuple, List
+from dataclasses import field, fields
+from typing import Callable, Tuple, List, Optional, Union
 
-@dataclass
+if __package__:
+    from .checkpoint import Checkpoint, overrides, run_entropy, run_setting
+    from .convergence import ConvergenceTracker, describe_early_exit, early_exit_summary
+    from .metrics import get_metrics
+    from .result_cache import MAX_ENTRY_BYTES, cached
+    from .results_store import ResultsStore, open_store, record, render_markdown
+    from .sequential import MIN_SEEDS, SequentialSampler, next_size, separation_stderr
+    from .parallel_sweep import default_workers, iter_seed_sweep, randint, resolve_entropy, seed_rng
+    from .sine_kernels import block_moments, evolve_moments, sine_step_moments, variance_ratio
+    from .trajectory_sinks import ReduceSink, TrajectorySink, TrajectorySummary, make_sink
+else:
+    from checkpoint import Checkpoint, overrides, run_entropy, run_setting
+    from convergence import ConvergenceTracker, describe_early_exit, early_exit_summary
+    from metrics import get_metrics
+    from result_cache import MAX_ENTRY_BYTES, cached
+    from results_store import ResultsStore, open_store, record, render_markdown
+    from sequential import MIN_SEEDS, SequentialSampler, next_size, separation_stderr
+    from parallel_sweep import default_workers, iter_seed_sweep, randint, resolve_entropy, seed_rng
+    from sine_kernels import block_moments, evolve_moments, sine_step_moments, variance_ratio
+    from trajectory_sinks import ReduceSink, TrajectorySink, TrajectorySummary, make_sink
+
+# Random stream ids (see parallel_sweep.seed_rng) so the tests never share draws
+FORTRESS_STREAM = 0
+NULL_STREAM = 1
+PERTURBATION_STREAM = 2
+SCALE_STREAM = 3
+NULL_CHISQUARE_STREAM = 4
+
+# How the null distribution is obtained (see test_null_hypothesis; the
+# Monte Carlo null only serves as a cross-check in check_null_distribution)
+NULL_METHODS = ('chisquare', 'exact')
+
+# How run_complete_fortress_suite renders the convergence plot
+PLOT_MODES = ('background', 'sync', 'defer')
+
+# Arguments that change how a sweep runs but not its result
+_SWEEP_OPTIONS = ('workers', 'checkpoint_dir', 'checkpoint_every', 'queue_dir')
+
+@record
 class FortressResults:
     """Complete validation results"""
     mean_ratio: float
@@ -27,92 +67,461 @@ class FortressResults:
     basin_size: float
     perturbation_recovery: float
     null_hypothesis_sigma: float
+    scale_invariance_std: float = 0.0
+    entropy: Optional[int] = None
+    trajectories: Optional[Union[np.ndarray, TrajectorySink]] = field(default=None, repr=False, metadata={'store': False})
+    
+    def markdown(self) -> str:
+        """The FORTRESS_RESULTS.md report."""
+        mean, std = self.mean_ratio, self.std_dev
+        return (
+            "# Fortress Verification Results\n\n"
+            "## Executive Summary\n\n"
+            f"**Measured S₈ Floor:** {mean:.8f} ± {std:.2e}\n\n"
+            f"**Theoretical Prediction:** 0.75000000\n\n"
+            f"**Deviation:** {abs(mean - 0.75):.2e} ({abs(mean-0.75)/0.75*100:.4f}%)\n\n"
+            "## Test Results\n\n"
+            "| Test | Result | Status |\n"
+            "|------|--------|--------|\n"
+            f"| Basin of Attraction | Converges from {self.basin_size:g}x imbalance | ✓ PASS |\n"
+            f"| Stability Window | Stable for >100 iterations | ✓ PASS |\n"
+            f"| Perturbation Recovery | {self.perturbation_recovery*100:.1f}% recovery | ✓ PASS |\n"
+            f"| Scale Invariance | Variance < {self.scale_invariance_std:.2e} | ✓ PASS |\n"
+            f"| Null Hypothesis | Rejected at {self.null_hypothesis_sigma:.1f}σ | ✓ PASS |\n"
+            "\n## Interpretation\n\n"
+            "The 0.75 ratio is a **robust topological attractor** of the 4D→3D projection "
+            "under recursive toroidal dynamics. This is not a numerical artifact or "
+            "lucky crossing, but a fundamental fixed point of the system.\n"
+        )
+
+@record
+class FortressTestResult:
+    """
+    Outcome of run_fortress_test. Behaves like the former return tuple
+    (mean_ratio, std_dev, trajectories) under unpacking, indexing, len()
+    and comparison with a tuple: mean, std, trajectories = run_fortress_test(...)
+    """
+    mean_ratio: float
+    std_dev: float
+    convergence_rate: float
+    converged: int
+    stability_passes: int
+    mean_stability_window: float
+    seeds: int
+    iterations: int
+    particles: int
+    max_imbalance: float
+    entropy: Optional[int] = None
+    trajectories: Optional[Union[np.ndarray, TrajectorySink]] = field(default=None, repr=False, metadata={'store': False})
+    
+    def _legacy(self) -> tuple:
+        return self.mean_ratio, self.std_dev, self.trajectories
+    
+    def __iter__(self):
+        return iter(self._legacy())
+    
+    def __len__(self):
+        return 3
+    
+    def __getitem__(self, index):
+        return self._legacy()[index]
+    
+    def __eq__(self, other):
+        if isinstance(other, tuple):
+            return self._legacy() == other
+        if type(other) is not type(self):
+            return NotImplemented
+        return [getattr(self, f.name) for f in fields(self)] == [getattr(other, f.name) for f in fields(other)]
+
+@record
+class SequentialFortressResult:
+    """Outcome of run_fortress_sequential"""
+    mean: float
+    std: float
+    sem: float
+    ci: np.ndarray
+    seeds: int
+    batches: int
+    resolved: bool
+    target_sem: float
+    entropy: Optional[int] = None
+
+def _available_memory() -> Optional[int]:
+    """Best-effort estimate of free physical memory in bytes (None if unknown)."""
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def _seed_chunk_size(
+    seeds: int,
+    particles: int,
+    max_batch_bytes: Optional[int] = None,
+    iterations: int = 0,
+    dtype=np.float64
+) -> int:
+    """
+    Number of seeds that fit in one (seeds, particles, 4) batch of `dtype`
+    plus its (seeds, iterations) float64 trajectory block.
+    
+    Without an explicit budget the batch may use a quarter of the free
+    physical memory (256 MiB if that cannot be determined).
+    """
+    if max_batch_bytes is None:
+        available = _available_memory()
+        max_batch_bytes = available // 4 if available else 256 * 2**20
+    per_seed = particles * 4 * np.dtype(dtype).itemsize + iterations * np.dtype(np.float64).itemsize
+    return int(min(seeds, max(1, max_batch_bytes // per_seed)))
+
+def _init_fortress_batch(batch: np.ndarray, max_imbalance: float, rngs: Optional[List] = None) -> None:
+    """
+    Fill a (seeds, particles, 4) batch with wildly imbalanced initial conditions.
+    
+    Draws are made seed by seed in the same order as the original per-seed
+    loop, either from the global random stream (rngs=None, so a batched run
+    consumes it identically) or from one independent stream per seed.
+    """
+    particles = batch.shape[1]
+    with get_metrics().timer('rng'):
+        for s in range(batch.shape[0]):
+            rng = np.random if rngs is None else rngs[s]
+            imbalance = rng.uniform(1.0, max_imbalance)
+            dim_to_spike = np.random.randint(0, 4) if rngs is None else randint(rng, 0, 4)
+            scales = np.ones(4)
+            scales[dim_to_spike] = imbalance
+            np.multiply(rng.normal(0, 1, (particles, 4)), scales, out=batch[s])
+
+def _evolve_fortress_batch(
+    batch: np.ndarray,
+    trajectories: np.ndarray,
+    converge: Optional[int] = None,
+    max_period: int = 0,
+    resume: Optional[dict] = None,
+    on_checkpoint: Optional[Callable] = None,
+    gain: Union[float, np.ndarray] = np.pi
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Apply the sine-map recursion to every seed of the batch in place.
+    
+    Each iteration is a single fused pass (sine_step_moments) that updates
+    the state and gathers the per-dimension moments for the trajectory.
+    
+    With converge=K a seed retires once its ratio has stayed within ±0.001
+    of 0.75 for K consecutive iterations (or its moments repeat with period
+    <= max_period). Retired seeds are compacted out of the batch and keep
+    their last ratio for the rest of the trajectory.
+    
+    Args:
+        batch: (seeds, particles, 4) particle state, overwritten in place
+        trajectories: (seeds, iterations) output for the per-iteration ratio
+        converge: Stability window K for early exit (None runs every iteration)
+        max_period: Longest moment cycle treated as converged
+        resume: Checkpointed {'iteration', 'active', 'tracker'}; `batch` then
+                holds the state of the active seeds only
+        on_checkpoint: Called as on_checkpoint(iteration, batch, active, tracker)
+                       after every completed iteration
+        gain: Sine-map gain, a scalar or one value per seed
+    
+    Returns:
+        Final 3D/4D ratio per seed, iterations run per seed
+    """
+    seeds, iterations = trajectories.shape
+    if iterations == 0:
+        count, _, m2 = block_moments(batch)
+        return variance_ratio(count, m2), np.zeros(seeds, dtype=int)
+    per_seed_gain = np.ndim(gain) > 0
+    
+    tracker = None
+    if converge:
+        tracker = ConvergenceTracker(seeds, converge, target=0.75, max_period=max_period)
+    active = np.arange(seeds)
+    first = 0
+    if resume is not None:
+        first, active = resume['iteration'], resume['active']
+        batch = batch[:len(active)]
+        if per_seed_gain:
+            gain = np.asarray(gain)[active]
+        if tracker is not None:
+            tracker.load_state_dict(resume['tracker'])
+    metrics = get_metrics()
+    
+    for i in range(first, iterations):
+        # Apply sine-map recursion (toroidal dynamics) and compute 3D/4D ratio
+        count, mean, m2 = sine_step_moments(batch, gain=gain)
+        ratio = variance_ratio(count, m2)
+        trajectories[active, i] = ratio
+        if metrics.enabled:
+            metrics.count('iterations', len(active))
+            metrics.progress('fortress', i + 1, iterations)
+        
+        if tracker is not None:
+            done = tracker.update(i, ratio, active, state=np.concatenate([mean, m2], axis=1))
+            if done.any():
+                if metrics.enabled:
+                    metrics.count('seeds_converged', int(done.sum()))
+                # Freeze retired seeds and compact the survivors to the front
+                trajectories[active[done], i + 1:] = ratio[done, None]
+                active = active[~done]
+                batch[:len(active)] = batch[~done]
+                batch = batch[:len(active)]
+                if per_seed_gain:
+                    gain = gain[~done]
+                if not len(active):
+                    break
+        
+        if on_checkpoint is not None:
+            on_checkpoint(i + 1, batch, active, tracker)
+    
+    iterations_run = tracker.finish(iterations) if tracker else np.full(seeds, iterations)
+    return trajectories[:, -1].copy(), iterations_run
+
+def _evolve_single(
+    data: np.ndarray,
+    iterations: int,
+    converge: Optional[int] = None,
+    max_period: int = 0
+) -> Tuple[float, int]:
+    """
+    Evolve one (particles, 4) state in place.
+    
+    Returns:
+        final 3D/4D ratio, iterations actually run
+    """
+    if not converge:
+        _, _, m2 = evolve_moments(data, iterations)
+        return np.sum(m2[:3]) / np.sum(m2), iterations
     
+    ratio, iterations_run = _evolve_fortress_batch(data[None], np.zeros((1, iterations)), converge, max_period)
+    return ratio[0], int(iterations_run[0])
+
+def _max_stable_runs(trajectories: np.ndarray, window: int = 100, tolerance: float = 0.001) -> np.ndarray:
+    """Longest run per seed within ±tolerance of 0.75 over the last `window` iterations."""
+    stable_count = np.zeros(trajectories.shape[0], dtype=int)
+    max_stable_run = np.zeros(trajectories.shape[0], dtype=int)
+    
+    for val in trajectories[:, -window:].T:
+        stable_count = np.where(np.abs(val - 0.75) < tolerance, stable_count + 1, 0)
+        np.maximum(max_stable_run, stable_count, out=max_stable_run)
+    
+    return max_stable_run
+
+def _fortress_chunk(
+    start: int,
+    stop: int,
+    entropy: Optional[int],
+    iterations: int,
+    particles: int,
+    max_imbalance: float,
+    max_batch_bytes: Optional[int],
+    converge: Optional[int] = None,
+    max_period: int = 0,
+    checkpoint_dir: Optional[str] = None,
+    checkpoint_every: int = 50,
+    dtype: str = 'float64',
+    seed_ids: Optional[np.ndarray] = None,
+    gain: Optional[Union[float, np.ndarray]] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batched fortress evolution of seeds [start, stop) (one parallel sweep task).
+    
+    With checkpoint_dir the trajectories and per-seed results live in
+    memory-mapped files and the particle state, tracker and RNG state are
+    snapshotted every checkpoint_every iterations (see checkpoint.py).
+    
+    seed_ids and gain let one batch hold many parameter points (see
+    param_sweep.py): row s then draws from seed seed_ids[s] (instead of
+    start + s) and runs the map with gain[s] (default pi for every row).
+    
+    Returns:
+        final ratios (seeds,), trajectories (seeds, iterations), iterations run (seeds,)
+    """
+    seeds = stop - start
+    ckpt = None
+    if checkpoint_dir is not None:
+        ckpt = Checkpoint(checkpoint_dir, 'fortress', start, stop, every=checkpoint_every, params=dict(
+            entropy=entropy, iterations=iterations, particles=particles, max_imbalance=max_imbalance,
+            max_batch_bytes=max_batch_bytes, converge=converge, max_period=max_period, dtype=dtype,
+            **overrides(seed_ids=seed_ids, gain=gain)
+        ))
+        ratios = ckpt.array('ratios', (seeds,))
+        iterations_run = ckpt.array('iterations_run', (seeds,), dtype=np.int64)
+        convergence_trajectories = ckpt.array('trajectories', (seeds, iterations))
+        if ckpt.finished():
+            ckpt.result()
+            return np.array(ratios), np.array(convergence_trajectories), np.array(iterations_run)
+    else:
+        ratios = np.zeros(seeds)
+        iterations_run = np.zeros(seeds, dtype=int)
+        convergence_trajectories = np.zeros((seeds, iterations))
+    if seed_ids is None:
+        seed_ids = np.arange(start, stop)
+    if gain is None:
+        gain = np.pi
+    
+    chunk = _seed_chunk_size(seeds, particles, max_batch_bytes, iterations, dtype)
+    saved = ckpt.load() if ckpt is not None else None
+    if saved is not None:
+        chunk = saved['info']['chunk']  # free memory may differ on resume
+    batch = np.empty((chunk, particles, 4), dtype=dtype)
+    
+    for lo in range(0, seeds, chunk):
+        hi = min(lo + chunk, seeds)
+        if saved is not None and lo < saved['info']['lo']:
+            continue  # finished before the checkpoint
+        view = batch[:hi - lo]
+        
+        resume = None
+        if saved is not None and lo == saved['info']['lo']:
+            resume = {'iteration': saved['iteration'], 'active': saved['arrays']['active'],
+                      'tracker': {name[8:]: v for name, v in saved['arrays'].items() if name.startswith('tracker_')}}
+            view[:len(resume['active'])] = saved['arrays']['batch']
+            if entropy is None:
+                np.random.set_state(saved['rng'])
+        else:
+            rngs = None
+            if entropy is not None:
+                rngs = [seed_rng(entropy, int(seed), stream=FORTRESS_STREAM) for seed in seed_ids[lo:hi]]
+            
+            # ============================================
+            # 1. BASIN OF ATTRACTION TEST
+            # ============================================
+            # Wildly imbalanced initial conditions
+            _init_fortress_batch(view, max_imbalance, rngs)
+        
+        on_checkpoint = None
+        if ckpt is not None:
+            def on_checkpoint(i, state, active, tracker, lo=lo):
+                if ckpt.due(i, iterations):
+                    arrays = {'batch': state, 'active': active}
+                    if tracker is not None:
+                        arrays.update({f'tracker_{name}': v for name, v in tracker.state_dict().items()})
+                    ckpt.save(i, arrays, rng=np.random.get_state() if entropy is None else None, lo=lo, chunk=chunk)
+        
+        # ============================================
+        # 2. RECURSIVE TOROIDAL EVOLUTION (+ 4. FINAL PROJECTION)
+        # ============================================
+        ratios[lo:hi], iterations_run[lo:hi] = _evolve_fortress_batch(
+            view, convergence_trajectories[lo:hi], converge, max_period, resume, on_checkpoint,
+            gain=gain[lo:hi] if np.ndim(gain) else gain
+        )
+    
+    if ckpt is not None:
+        ckpt.finish(None, global_rng=entropy is None)
+        return np.array(ratios), np.array(convergence_trajectories), np.array(iterations_run)
+    return ratios, convergence_trajectories, iterations_run
+
+def _uncacheable_trajectories(params) -> bool:
+    """Sink objects, and full trajectory arrays too big to be worth a cache entry."""
+    sink = params['trajectory_sink']
+    if isinstance(sink, TrajectorySink):
+        return True
+    return sink != 'reduce' and params['seeds'] * params['iterations'] * 8 > MAX_ENTRY_BYTES
+
+@cached(ignore=_SWEEP_OPTIONS + ('max_batch_bytes',), bypass=_uncacheable_trajectories)
 def run_fortress_test(
     seeds: int = 100,
     iterations: int = 800,
     particles: int = 10000,
     stability_threshold: int = 10,
-    max_imbalance: float = 1000.0
-) -> Tuple[float, float, np.ndarray]:
+    max_imbalance: float = 1000.0,
+    max_batch_bytes: Optional[int] = None,
+    workers: int = 1,
+    entropy: Optional[int] = None,
+    converge: Optional[int] = None,
+    max_period: int = 8,
+    checkpoint_dir: Optional[str] = None,
+    checkpoint_every: int = 50,
+    trajectory_sink: Optional[Union[str, TrajectorySink]] = None,
+    dtype=np.float64,
+    queue_dir: Optional[str] = None
+) -> FortressTestResult:
     """
     FORTRESS TEST: Verifies 0.75 as a high-precision topological attractor.
     
+    All seeds are evolved together as one (seeds, particles, 4) tensor. When
+    that tensor would not fit in max_batch_bytes the seeds are processed in
+    chunks instead. With workers > 1 the seeds are spread over a process pool.
+    
+    Trajectories are streamed chunk by chunk into trajectory_sink (see
+    trajectory_sinks.py), so only one chunk is ever held as float64.
+    
     Args:
         seeds: Number of independent random initializations
         iterations: Recursive depth (must be >> stability_threshold)
         particles: Number of test particles in 4D space
         stability_threshold: Consecutive iterations ratio must stay within tolerance
         max_imbalance: Maximum initial variance imbalance (1x to max_imbalance)
+        max_batch_bytes: Memory budget for one batch (default: 1/4 of free RAM)
+        workers: Worker processes for the seed sweep (0 = all cores)
+        entropy: Root seed; each seed then gets its own SeedSequence stream and
+                 results are identical for any worker count. None with a
+                 single worker keeps the global np.random stream. Runs with
+                 an entropy are memoized (see result_cache.py).
+        converge: Opt-in early exit; retire a seed after this many consecutive
+                  iterations within ±0.001 of 0.75 (see convergence.py)
+        max_period: Longest state cycle that also retires a seed in that mode
+        checkpoint_dir: Checkpoint/resume directory; rerunning with the same
+                        arguments (and worker count) resumes where it stopped
+        checkpoint_every: Iterations between checkpoints
+        trajectory_sink: Where trajectories go: None (float64 array, the
+                         default), 'memory' (float32 array), 'reduce'
+                         (running statistics only) or a TrajectorySink
+                         such as MemmapSink(path)
+        dtype: Particle storage type; np.float32 halves memory and bandwidth
+               while moments are still accumulated in float64 (see
+               validate_precision before relying on it)
+        queue_dir: Shared work-queue directory; the seeds are cut into shards
+                   that `python . worker queue_dir` processes on any node
+                   compute (see work_queue.py), merged into the same result
     
     Returns:
-        mean_ratio, std_dev, convergence_trajectory
+        FortressTestResult; unpacks as mean_ratio, std_dev,
+        convergence_trajectory (the sink's result(): an array for
+        memory/memmap sinks, the sink itself for ReduceSink)
     """
-    ratios = []
-    convergence_trajectories = []
-    stability_windows = []
+    if entropy is None and (workers != 1 or queue_dir is not None):
+        entropy = run_entropy(checkpoint_dir, entropy)
     
-    for run in range(seeds):
-        # ============================================
-        # 1. BASIN OF ATTRACTION TEST
-        # ============================================
-        # Wildly imbalanced initial conditions
-        imbalance = np.random.uniform(1.0, max_imbalance)
-        dim_to_spike = np.random.randint(0, 4)
-        scales = np.ones(4)
-        scales[dim_to_spike] = imbalance
-        
-        # Initialize particles with imbalanced variance
-        data = np.random.normal(0, 1, (particles, 4)) * scales
-        
-        # Track convergence over time
-        trajectory = np.zeros(iterations)
-        
-        # ============================================
-        # 2. RECURSIVE TOROIDAL EVOLUTION
-        # ============================================
-        for i in range(iterations):
-            # Apply sine-map recursion (toroidal dynamics)
-            data = np.sin(data * np.pi)
-            
-            # Compute 3D/4D ratio at this iteration
-            current_vars = np.var(data, axis=0)
-            var_total = np.sum(current_vars)
-            var_observed = np.sum(current_vars[:3])
-            
-            if var_total > 1e-10:  # Avoid division by zero
-                trajectory[i] = var_observed / var_total
-            else:
-                trajectory[i] = 0.75  # Already converged
-        
-        convergence_trajectories.append(trajectory)
+    # Chunks sized so one chunk's particles and trajectories fit the budget
+    dtype = np.dtype(dtype).name
+    chunk_size = run_setting(checkpoint_dir, 'fortress_chunk_size',
+                             _seed_chunk_size(seeds, particles, max_batch_bytes, iterations, dtype))
+    if workers != 1:
+        chunk_size = min(chunk_size, -(-seeds // (4 * (workers or default_workers()))))
+    
+    sink = make_sink(trajectory_sink)
+    sink.open(seeds, iterations)
+    ratios = np.zeros(seeds)
+    iterations_run = np.zeros(seeds, dtype=int)
+    stability_windows = np.zeros(seeds, dtype=int)
+    
+    if queue_dir is None:
+        sweep = iter_seed_sweep
+    else:
+        if __package__:
+            from .work_queue import iter_queue_sweep
+        else:
+            from work_queue import iter_queue_sweep
+        sweep = functools.partial(iter_queue_sweep, queue_dir)
+    for start, stop, (chunk_ratios, chunk_trajectories, chunk_run) in sweep(
+        _fortress_chunk, seeds, workers=workers, chunk_size=chunk_size,
+        entropy=entropy, iterations=iterations, particles=particles,
+        max_imbalance=max_imbalance, max_batch_bytes=max_batch_bytes,
+        converge=converge, max_period=max_period,
+        checkpoint_dir=checkpoint_dir, checkpoint_every=checkpoint_every, dtype=dtype
+    ):
+        ratios[start:stop] = chunk_ratios
+        iterations_run[start:stop] = chunk_run
         
         # ============================================
         # 3. STABILITY WINDOW VERIFICATION
         # ============================================
         # Check if ratio stays within ±0.001 of 0.75 
         # for at least stability_threshold consecutive iterations
-        stable_count = 0
-        max_stable_run = 0
-        
-        for val in trajectory[-100:]:  # Check last 100 iterations
-            if abs(val - 0.75) < 0.001:
-                stable_count += 1
-                max_stable_run = max(max_stable_run, stable_count)
-            else:
-                stable_count = 0
-        
-        stability_windows.append(max_stable_run)
-        
-        # ============================================
-        # 4. FINAL PROJECTION
-        # ============================================
-        final_vars = np.var(data, axis=0)
-        var_total = np.sum(final_vars)
-        var_observed = np.sum(final_vars[:3])
-        
-        final_ratio = var_observed / var_total if var_total > 1e-10 else 0.75
-        ratios.append(final_ratio)
+        stability_windows[start:stop] = _max_stable_runs(chunk_trajectories)
+        sink.write(start, chunk_trajectories)
+        del chunk_trajectories
+    sink.close()
     
     # ============================================
     # 5. STATISTICAL VALIDATION
@@ -121,7 +530,7 @@ def run_fortress_test(
     std_dev = np.std(ratios)
     
     # Convergence rate: % of runs that stayed within 0.01 of 0.75
-    converged = np.sum(np.abs(np.array(ratios) - 0.75) < 0.01)
+    converged = np.sum(np.abs(ratios - 0.75) < 0.01)
     convergence_rate = converged / seeds
     
     print("=" * 80)
@@ -133,43 +542,112 @@ def run_fortress_test(
     print(f"Target (Theory):      0.75000000")
     print(f"Deviation from 0.75:  {abs(mean_ratio - 0.75):.2e}")
     print(f"Stability Windows:    {np.mean(stability_windows):.1f} iterations (avg)")
+    if converge:
+        print(f"Early Exit:           {describe_early_exit(early_exit_summary(iterations_run, iterations))}")
+    print("=" * 80)
+    
+    return FortressTestResult(
+        mean_ratio=float(mean_ratio), std_dev=float(std_dev), convergence_rate=float(convergence_rate),
+        converged=int(converged), stability_passes=int(np.sum(stability_windows >= stability_threshold)),
+        mean_stability_window=float(np.mean(stability_windows)), seeds=seeds, iterations=iterations,
+        particles=particles, max_imbalance=max_imbalance, entropy=entropy, trajectories=sink.result()
+    )
+
+@cached(ignore=('workers',))
+def run_fortress_sequential(
+    target_sem: float = 1e-4,
+    max_seeds: int = 1000,
+    iterations: int = 800,
+    particles: int = 10000,
+    max_imbalance: float = 1000.0,
+    workers: int = 1,
+    entropy: Optional[int] = None,
+    converge: Optional[int] = None,
+    max_period: int = 8,
+    dtype=np.float64,
+    batch: int = MIN_SEEDS,
+    z: float = 1.96
+) -> SequentialFortressResult:
+    """
+    SEQUENTIAL FORTRESS TEST: adds seed batches until the standard error of
+    the mean ratio reaches target_sem (or max_seeds are used).
+    
+    Seed i is the same seed as in run_fortress_test (same entropy), so the
+    result equals a fixed run over the first `seeds` seeds; the variance of
+    the final ratio decides how many that is (see sequential.py).
+    
+    Returns:
+        SequentialFortressResult
+    """
+    if entropy is None and workers != 1:
+        entropy = resolve_entropy(entropy)
+    dtype = np.dtype(dtype).name
+    
+    sampler = SequentialSampler(
+        _fortress_chunk, pick=lambda result: result[0], workers=workers,
+        chunk_size=max_seeds if workers == 1 else None,
+        entropy=entropy, iterations=iterations, particles=particles, max_imbalance=max_imbalance,
+        max_batch_bytes=None, converge=converge, max_period=max_period, dtype=dtype
+    )
+    sampler.grow_to(min(max(batch, 2), max_seeds))
+    while sampler.sem > target_sem and sampler.n < max_seeds:
+        sampler.grow_to(next_size(sampler.n, sampler.seeds_for(target_sem), max_seeds, batch))
+    
+    resolved = sampler.sem <= target_sem
+    low, high = sampler.ci(z)
+    
+    print("=" * 80)
+    print("SEQUENTIAL FORTRESS TEST RESULTS")
+    print("=" * 80)
+    print(f"Mean S8 Floor:        {sampler.mean:.8f}")
+    print(f"Standard Deviation:   {sampler.std:.2e}")
+    print(f"Standard Error:       {sampler.sem:.2e} (target {target_sem:.0e})")
+    print(f"Confidence Interval:  [{low:.8f}, {high:.8f}] (z = {z:g})")
+    print(f"Seeds Used:           {sampler.n} of {max_seeds} ({sampler.batches} batches)")
+    print(f"Status:               {'✓ RESOLVED' if resolved else '⚠ BUDGET EXHAUSTED before the target precision'}")
     print("=" * 80)
     
-    return mean_ratio, std_dev, np.array(convergence_trajectories)
+    return SequentialFortressResult(
+        mean=sampler.mean, std=sampler.std, sem=sampler.sem, ci=np.array([low, high]), seeds=sampler.n,
+        batches=sampler.batches, resolved=bool(resolved), target_sem=target_sem, entropy=entropy
+    )
 
+@cached()
 def test_perturbation_resilience(
     base_iterations: int = 500,
     perturbation_strength: float = 10.0,
-    particles: int = 10000
+    particles: int = 10000,
+    converge: Optional[int] = None,
+    max_period: int = 8,
+    dtype=np.float64,
+    entropy: Optional[int] = None
 ) -> float:
     """
     Test 6: External Perturbation Recovery
     
     After convergence, apply a strong perturbation and verify 
     the system returns to 0.75 attractor.
+    
+    With converge=K each phase stops once the ratio has stayed within
+    ±0.001 of 0.75 for K consecutive iterations. dtype sets the particle
+    storage type (see run_fortress_test). With an entropy the draws come
+    from their own stream and the result is memoized.
     """
-    # Initialize and converge
-    data = np.random.normal(0, 1, (particles, 4))
+    rng = np.random if entropy is None else seed_rng(entropy, 0, stream=PERTURBATION_STREAM)
     
-    for i in range(base_iterations):
-        data = np.sin(data * np.pi)
+    # Initialize and converge (final step fused with the moment pass)
+    data = rng.normal(0, 1, (particles, 4)).astype(dtype, copy=False)
     
     # Measure pre-perturbation ratio
-    vars_before = np.var(data, axis=0)
-    ratio_before = np.sum(vars_before[:3]) / np.sum(vars_before)
+    ratio_before, run_before = _evolve_single(data, base_iterations, converge, max_period)
     
     # Apply random perturbation (kick one dimension hard)
     perturbation = np.zeros((particles, 4))
-    perturbation[:, np.random.randint(0, 4)] = np.random.normal(0, perturbation_strength, particles)
+    perturbation[:, randint(rng, 0, 4)] = rng.normal(0, perturbation_strength, particles)
     data += perturbation
     
-    # Evolve again
-    for i in range(base_iterations):
-        data = np.sin(data * np.pi)
-    
-    # Measure post-perturbation ratio
-    vars_after = np.var(data, axis=0)
-    ratio_after = np.sum(vars_after[:3]) / np.sum(vars_after)
+    # Evolve again, then measure post-perturbation ratio
+    ratio_after, run_after = _evolve_single(data, base_iterations, converge, max_period)
     
     recovery = 1.0 - abs(ratio_after - 0.75) / abs(ratio_before - 0.75 + 1e-10)
     
@@ -177,33 +655,62 @@ def test_perturbation_resilience(
     print(f"  Before: {ratio_before:.6f}")
     print(f"  After perturbation & recovery: {ratio_after:.6f}")
     print(f"  Recovery rate: {recovery*100:.1f}%")
+    if converge:
+        summary = early_exit_summary(np.array([run_before, run_after]), base_iterations)
+        print(f"  Early exit: {summary['iterations_run']}/{summary['iterations_budget']} iterations run")
     
     return recovery
 
+@cached(ignore=('workers',))
 def test_scale_invariance(
     particle_counts: List[int] = [100, 1000, 10000, 100000],
-    iterations: int = 500
+    iterations: int = 500,
+    converge: Optional[int] = None,
+    max_period: int = 8,
+    dtype=np.float64,
+    entropy: Optional[int] = None,
+    shared_min_particles: Optional[int] = None,
+    workers: int = 1
 ) -> np.ndarray:
     """
     Test 7: Scale Invariance
     
     Verify 0.75 emerges regardless of particle count (N).
     Tests if result is a finite-size artifact.
+    
+    With converge=K each N stops once its ratio has stayed within ±0.001
+    of 0.75 for K consecutive iterations. dtype sets the particle storage
+    type (see run_fortress_test). With an entropy the draws come from their
+    own stream and the result is memoized.
+    
+    Counts of at least shared_min_particles (e.g. 10^8, which no single
+    process should copy around) run as one shared-memory state stepped by
+    `workers` processes (0 = all cores; see shared_state.py). Their initial
+    state comes from per-slab streams of `entropy`, so it differs from the
+    in-process draw but does not depend on the worker count.
     """
+    rng = np.random if entropy is None else seed_rng(entropy, 0, stream=SCALE_STREAM)
     ratios = []
+    if shared_min_particles is not None:
+        if __package__:
+            from .shared_state import evolve_shared
+        else:
+            from shared_state import evolve_shared
+        shared_entropy = resolve_entropy(entropy)
     
     print("\nSCALE INVARIANCE TEST:")
     for N in particle_counts:
-        data = np.random.normal(0, 1, (N, 4))
-        
-        for i in range(iterations):
-            data = np.sin(data * np.pi)
-        
-        vars_final = np.var(data, axis=0)
-        ratio = np.sum(vars_final[:3]) / np.sum(vars_final)
+        if shared_min_particles is not None and N >= shared_min_particles:
+            ratio, iterations_run = evolve_shared(N, iterations, workers, shared_entropy, converge, max_period, dtype)
+        else:
+            data = rng.normal(0, 1, (N, 4)).astype(dtype, copy=False)
+            ratio, iterations_run = _evolve_single(data, iterations, converge, max_period)
         ratios.append(ratio)
         
-        print(f"  N = {N:6d} particles → ratio = {ratio:.8f}")
+        if converge:
+            print(f"  N = {N:6d} particles → ratio = {ratio:.8f} ({iterations_run}/{iterations} iterations)")
+        else:
+            print(f"  N = {N:6d} particles → ratio = {ratio:.8f}")
     
     # Check if all within 0.001 of each other
     variance_across_scales = np.std(ratios)
@@ -211,10 +718,138 @@ def test_scale_invariance(
     
     return np.array(ratios)
 
+def _null_chunk(start: int, stop: int, entropy: Optional[int], particles: int) -> np.ndarray:
+    """
+    Monte Carlo null-hypothesis ratios (no recursion) of seeds [start, stop):
+    particles x 4 normal draws per seed. Only check_null_distribution uses
+    it, to cross-check the chi-square and exact nulls.
+    """
+    null_ratios = np.zeros(stop - start)
+    
+    for s in range(stop - start):
+        # Random 4D data, no evolution
+        rng = np.random if entropy is None else seed_rng(entropy, start + s, stream=NULL_STREAM)
+        data = rng.normal(0, 1, (particles, 4))
+        _, _, m2 = block_moments(data)
+        null_ratios[s] = np.sum(m2[:3]) / np.sum(m2)
+    
+    return null_ratios
+
+def null_ratio_moments(particles: int, observed: int = 3, dims: int = 4) -> Tuple[float, float]:
+    """
+    Exact mean and std of the null variance ratio.
+    
+    For i.i.d. Gaussian particles each dimension's M2 is sigma^2 chi^2(n-1)
+    and the dimensions are independent, so the ratio of `observed` of the
+    `dims` sums is Beta(observed k / 2, (dims - observed) k / 2), k = n - 1.
+    For 3 of 4: mean 3/4, variance 3 / (16 (2n - 1)).
+    """
+    k = particles - 1
+    a, b = observed * k / 2, (dims - observed) * k / 2
+    return a / (a + b), math.sqrt(a * b / ((a + b) ** 2 * (a + b + 1)))
+
+def _null_chisquare_chunk(start: int, stop: int, entropy: Optional[int], particles: int) -> np.ndarray:
+    """
+    Null ratios of seeds [start, stop) from the per-dimension M2 drawn
+    directly as chi^2(particles - 1): one vectorized draw instead of
+    particles x 4 normals per seed. One stream per chunk (legacy global
+    stream when entropy is None).
+    """
+    rng = np.random if entropy is None else seed_rng(entropy, start, stream=NULL_CHISQUARE_STREAM)
+    m2 = rng.chisquare(particles - 1, size=(stop - start, 4))
+    return m2[:, :3].sum(axis=1) / m2.sum(axis=1)
+
+class _ExactNull:
+    """Exact null moments with the SequentialSampler interface (no sampling error)."""
+    
+    def __init__(self, particles: int):
+        self.mean, self.std = null_ratio_moments(particles)
+        self.sem = 0.0
+        self.n = math.inf
+
+def check_null_distribution(seeds: int = 1000, particles: int = 10000, entropy: Optional[int] = None, z: float = 3.0) -> dict:
+    """
+    Cross-check of the null engines: Monte Carlo (normal draws) and
+    chi-square sample means and stds against the exact Beta moments, each
+    within `z` standard errors (SE(std) ~ std / sqrt(2 (n - 1))).
+    """
+    exact_mean, exact_std = null_ratio_moments(particles)
+    samples = {
+        'montecarlo': _null_chunk(0, seeds, entropy, particles),
+        'chisquare': _null_chisquare_chunk(0, seeds, entropy, particles)
+    }
+    
+    print(f"\nNULL DISTRIBUTION CHECK ({seeds} seeds, {particles} particles):")
+    print(f"  exact       | mean {exact_mean:.6f} | std {exact_std:.6f}")
+    report = {'exact': {'mean': exact_mean, 'std': exact_std}, 'passed': True}
+    for method, ratios in samples.items():
+        mean, std = float(np.mean(ratios)), float(np.std(ratios))
+        mean_z = abs(mean - exact_mean) / (exact_std / math.sqrt(seeds))
+        std_z = abs(std - exact_std) / (exact_std / math.sqrt(2 * (seeds - 1)))
+        passed = bool(mean_z <= z and std_z <= z)
+        report[method] = {'mean': mean, 'std': std, 'mean_z': mean_z, 'std_z': std_z, 'passed': passed}
+        report['passed'] &= passed
+        print(f"  {method:<11} | mean {mean:.6f} ({mean_z:.1f} SE) | std {std:.6f} ({std_z:.1f} SE) | "
+              f"{'✓ PASS' if passed else '⚠ FAIL'}")
+    return report
+
+def _sequential_null_samples(
+    max_seeds: int,
+    iterations: int,
+    particles: int,
+    workers: int,
+    entropy: int,
+    target_sigma_se: float,
+    batch: int,
+    null_method: str = 'chisquare'
+) -> Tuple[SequentialSampler, SequentialSampler]:
+    """
+    Grow the fortress sample until the separation's standard error reaches
+    the target. The chi-square null costs microseconds and is drawn in full
+    up front; the exact null has no sampling error.
+    """
+    chunk_size = max_seeds if workers == 1 else None
+    if null_method == 'exact':
+        null = _ExactNull(particles)
+    else:
+        null = SequentialSampler(_null_chisquare_chunk, chunk_size=max_seeds, entropy=entropy, particles=particles)
+        null.grow_to(max_seeds)
+    observed = SequentialSampler(
+        _fortress_chunk, pick=lambda result: result[0], workers=workers, chunk_size=chunk_size,
+        entropy=entropy, iterations=iterations, particles=particles, max_imbalance=1000.0, max_batch_bytes=None
+    )
+    observed.grow_to(min(max(batch, 2), max_seeds))
+    
+    while True:
+        separation = abs(observed.mean - null.mean) / null.std
+        if separation_stderr(separation, observed.sem, null.sem, null.std, null.n) <= target_sigma_se:
+            break
+        # Variance of S contributed by each sample, and the size that would bring it to target^2 / 2
+        observed_part = observed.sem ** 2 / null.std ** 2
+        null_part = null.sem ** 2 / null.std ** 2 + separation ** 2 / (2 * (null.n - 1))
+        half = target_sigma_se ** 2 / 2
+        grow_observed = observed.n < max_seeds and (observed_part >= null_part or null.n >= max_seeds)
+        if grow_observed:
+            observed.grow_to(next_size(observed.n, math.ceil(observed.n * observed_part / half), max_seeds, batch))
+        elif null.n < max_seeds:
+            null.grow_to(next_size(null.n, math.ceil(null.n * null_part / half), max_seeds, batch))
+        else:
+            break  # budget exhausted
+    return null, observed
+
+@cached(ignore=_SWEEP_OPTIONS)
 def test_null_hypothesis(
     seeds: int = 1000,
     iterations: int = 500,
-    particles: int = 10000
+    particles: int = 10000,
+    workers: int = 1,
+    entropy: Optional[int] = None,
+    checkpoint_dir: Optional[str] = None,
+    checkpoint_every: int = 50,
+    target_sigma_se: Optional[float] = None,
+    batch: int = MIN_SEEDS,
+    z: float = 1.96,
+    null_method: str = 'chisquare'
 ) -> float:
     """
     Test 8: Null Hypothesis Rejection
@@ -222,35 +857,72 @@ def test_null_hypothesis(
     Compare observed 0.75 convergence to what we'd expect 
     if dimensions were truly independent (null: ratio = 0.75 by chance).
     
+    Both the null and the fortress seeds are swept across `workers`
+    processes; see run_fortress_test for the meaning of `entropy` and
+    the checkpoint arguments.
+    
+    With target_sigma_se the test is sequential: `seeds` becomes the budget
+    of each sample, and null or fortress seeds are added in batches (to
+    whichever sample dominates the error) until the standard error of the
+    separation is at most target_sigma_se. It draws its own entropy when
+    none is given and does not checkpoint.
+    
+    null_method selects the null distribution:
+        'chisquare'   per-dimension M2 drawn as chi^2(particles - 1), all
+                      seeds in one vectorized draw (default)
+        'exact'       exact Beta moments, no sampling (null_ratio_moments)
+    Both replace the original particles x 4 normal draws per seed, which
+    follow the same distribution; check_null_distribution cross-checks the
+    three.
+    
     Returns: Number of standard deviations from null expectation
     """
     # Under null hypothesis: if 4 dimensions are independent with equal variance,
     # the 3/4 projection should yield exactly 0.75 only if variances are perfectly equal.
     # With finite sampling, we expect deviation.
     
-    # Simulate null: no recursion, just random sampling
-    null_ratios = []
-    
-    for _ in range(seeds):
-        # Random 4D data, no evolution
-        data = np.random.normal(0, 1, (particles, 4))
-        vars_null = np.var(data, axis=0)
-        ratio_null = np.sum(vars_null[:3]) / np.sum(vars_null)
-        null_ratios.append(ratio_null)
-    
-    null_mean = np.mean(null_ratios)
-    null_std = np.std(null_ratios)
+    if null_method not in NULL_METHODS:
+        raise ValueError(f"unknown null_method {null_method!r} (use one of {', '.join(NULL_METHODS)})")
     
-    # Now run actual fortress test
-    observed_mean, observed_std, _ = run_fortress_test(seeds=seeds, iterations=iterations, particles=particles)
+    if target_sigma_se is not None:
+        entropy = resolve_entropy(entropy)
+        null, observed = _sequential_null_samples(
+            seeds, iterations, particles, workers, entropy, target_sigma_se, batch, null_method
+        )
+        null_mean, null_std, null_n, null_sem = null.mean, null.std, null.n, null.sem
+        observed_mean, observed_std, observed_n = observed.mean, observed.std, observed.n
+    else:
+        if entropy is None and workers != 1:
+            entropy = run_entropy(checkpoint_dir, entropy)
+        
+        null_n = observed_n = seeds
+        if null_method == 'exact':
+            null_mean, null_std = null_ratio_moments(particles)
+            null_n, null_sem = math.inf, 0.0
+        else:
+            null_ratios = _null_chisquare_chunk(0, seeds, entropy, particles)
+            null_mean = np.mean(null_ratios)
+            null_std = np.std(null_ratios)
+            null_sem = np.std(null_ratios, ddof=1) / np.sqrt(seeds) if seeds > 1 else np.inf
+        
+        # Now run actual fortress test
+        observed_mean, observed_std, _ = run_fortress_test(
+            seeds=seeds, iterations=iterations, particles=particles, workers=workers, entropy=entropy,
+            checkpoint_dir=checkpoint_dir, checkpoint_every=checkpoint_every,
+            trajectory_sink=ReduceSink(sample=0)
+        )
     
     # How many sigma is observed from null?
     sigma_separation = abs(observed_mean - null_mean) / null_std
+    observed_sem = observed_std / np.sqrt(observed_n - 1) if observed_n > 1 else np.inf
+    sigma_se = separation_stderr(sigma_separation, observed_sem, null_sem, null_std, null_n)
     
     print(f"\nNULL HYPOTHESIS TEST:")
-    print(f"  Null expectation (no recursion): {null_mean:.6f} ± {null_std:.6f}")
+    print(f"  Null expectation (no recursion): {null_mean:.6f} ± {null_std:.6f} ({null_method})")
     print(f"  Observed (with recursion):       {observed_mean:.6f} ± {observed_std:.6f}")
     print(f"  Separation: {sigma_separation:.1f}σ")
+    print(f"  Separation CI (z = {z:g}): [{sigma_separation - z * sigma_se:.2f}σ, {sigma_separation + z * sigma_se:.2f}σ]"
+          f" from {'exact null' if null_n == math.inf else f'{null_n} null'} / {observed_n} fortress seeds")
     
     if sigma_separation > 5:
         print(f"  ✓ NULL HYPOTHESIS REJECTED at >{sigma_separation:.0f}σ confidence")
@@ -259,105 +931,204 @@ def test_null_hypothesis(
     
     return sigma_separation
 
-def visualize_convergence(trajectories: np.ndarray, save_path: str = 'convergence.png'):
+def validate_precision(
+    seeds: int = 100,
+    iterations: int = 800,
+    particles: int = 10000,
+    max_imbalance: float = 1000.0,
+    workers: int = 1,
+    entropy: Optional[int] = None,
+    z: float = 3.0
+) -> dict:
+    """
+    Precision validation: float32 versus float64 particle storage.
+
+    Runs the fortress test twice from identical initial conditions (same
+    per-seed streams) and compares the final ratios. The sine map is
+    chaotic, so individual particles decorrelate between precisions; what
+    must agree is the ratio statistics. The 0.75 conclusion holds for
+    float32 when the paired mean shift is below z standard errors and both
+    precisions agree on whether the mean lies within 0.01 of 0.75.
+
+    Returns:
+        Report dict (means, per-seed differences, timings, 'conclusion_holds')
+    """
+    entropy = resolve_entropy(entropy)
+    final = {}
+    elapsed = {}
+
+    for dtype in ('float64', 'float32'):
+        sink = ReduceSink(sample=0)
+        started = time.perf_counter()
+        run_fortress_test(
+            seeds=seeds, iterations=iterations, particles=particles, max_imbalance=max_imbalance,
+            workers=workers, entropy=entropy, trajectory_sink=sink, dtype=dtype
+        )
+        elapsed[dtype] = time.perf_counter() - started
+        final[dtype] = sink.final.copy()
+
+    r64, r32 = final['float64'], final['float32']
+    diff = r32 - r64
+    shift = float(np.mean(diff))
+    shift_se = float(np.std(diff, ddof=1) / np.sqrt(seeds)) if seeds > 1 else 0.0
+    shift_sigma = abs(shift) / shift_se if shift_se > 0 else (0.0 if shift == 0 else np.inf)
+    near_64 = abs(np.mean(r64) - 0.75) < 0.01
+    near_32 = abs(np.mean(r32) - 0.75) < 0.01
+
+    report = {
+        'seeds': seeds,
+        'entropy': entropy,
+        'mean_float64': float(np.mean(r64)),
+        'mean_float32': float(np.mean(r32)),
+        'std_float64': float(np.std(r64)),
+        'std_float32': float(np.std(r32)),
+        'mean_shift': shift,
+        'mean_shift_sigma': float(shift_sigma),
+        'max_abs_diff': float(np.max(np.abs(diff))),
+        'median_abs_diff': float(np.median(np.abs(diff))),
+        'seconds_float64': elapsed['float64'],
+        'seconds_float32': elapsed['float32'],
+        'conclusion_holds': bool(shift_sigma < z and near_64 == near_32)
+    }
+
+    print(f"\nPRECISION VALIDATION (float32 storage vs float64, {seeds} seeds, entropy={entropy}):")
+    print(f"  float64: {report['mean_float64']:.8f} ± {report['std_float64']:.2e}  ({elapsed['float64']:.2f}s)")
+    print(f"  float32: {report['mean_float32']:.8f} ± {report['std_float32']:.2e}  ({elapsed['float32']:.2f}s)")
+    print(f"  Paired mean shift: {shift:.2e} ({shift_sigma:.1f}σ)")
+    print(f"  Per-seed |Δ|: median {report['median_abs_diff']:.2e}, max {report['max_abs_diff']:.2e}")
+
+    if report['conclusion_holds']:
+        print(f"  ✓ 0.75 conclusion unchanged in float32")
+    else:
+        print(f"  ⚠ float32 changes the result; keep float64")
+
+    return report
+
+def visualize_convergence(
+    trajectories: Union[np.ndarray, TrajectorySink, TrajectorySummary, 'PlotData'],
+    save_path: str = 'convergence.png',
+    dpi: int = 300,
+    points: Optional[int] = None,
+    background: bool = False
+):
     """
     Generate publication-quality convergence visualization
+    
+    Accepts a trajectory array (in memory or memmapped), any trajectory
+    sink, a TrajectorySummary or already reduced PlotData. Everything is
+    reduced to about `points` values per line first (default PLOT_POINTS,
+    see plotting.py), so the drawing cost does not grow with the sweep.
+    
+    Returns:
+        the Figure, or with background=True a Future that resolves to
+        save_path once the background render process has written it
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-    
-    # Plot 1: Individual trajectories
-    for traj in trajectories[:50]:  # Plot first 50
-        ax1.plot(traj, alpha=0.1, color='blue', linewidth=0.5)
-    
-    # Mean trajectory
-    mean_traj = np.mean(trajectories, axis=0)
-    ax1.plot(mean_traj, color='red', linewidth=2, label='Mean')
-    ax1.axhline(y=0.75, color='black', linestyle='--', linewidth=1, label='Theoretical (0.75)')
-    
-    ax1.set_xlabel('Iteration', fontsize=12)
-    ax1.set_ylabel('3D/4D Variance Ratio', fontsize=12)
-    ax1.set_title('Convergence to 0.75 Attractor', fontsize=14, fontweight='bold')
-    ax1.legend()
-    ax1.grid(alpha=0.3)
-    ax1.set_ylim([0.65, 0.85])
-    
-    # Plot 2: Distribution at final iteration
-    final_values = trajectories[:, -1]
-    ax2.hist(final_values, bins=50, color='blue', alpha=0.7, edgecolor='black')
-    ax2.axvline(x=0.75, color='red', linestyle='--', linewidth=2, label='Theory (0.75)')
-    ax2.axvline(x=np.mean(final_values), color='green', linestyle='-', linewidth=2, label=f'Observed ({np.mean(final_values):.4f})')
-    
-    ax2.set_xlabel('Final 3D/4D Ratio', fontsize=12)
-    ax2.set_ylabel('Frequency', fontsize=12)
-    ax2.set_title('Distribution After Convergence', fontsize=14, fontweight='bold')
-    ax2.legend()
-    ax2.grid(alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if __package__:
+        from .plotting import PLOT_POINTS, PlotData, convergence_plot_data, render_async, render_convergence
+    else:
+        from plotting import PLOT_POINTS, PlotData, convergence_plot_data, render_async, render_convergence
+    data = trajectories if isinstance(trajectories, PlotData) else convergence_plot_data(trajectories, points or PLOT_POINTS)
+    if background:
+        return render_async(data, save_path, dpi)
+    
+    fig = render_convergence(data, save_path, dpi)
     print(f"\n✓ Convergence plot saved to {save_path}")
     
     return fig
 
-def run_complete_fortress_suite():
+def run_complete_fortress_suite(
+    entropy: Optional[int] = None,
+    store: Optional[Union[str, ResultsStore]] = None,
+    report: Optional[str] = 'FORTRESS_RESULTS.md',
+    plot: Optional[str] = 'convergence.png',
+    plot_mode: str = 'background'
+) -> FortressResults:
     """
     Execute all verification tests and generate report
+    
+    With an entropy every test draws from its own reproducible stream, so
+    repeated suite runs are served from the result cache.
+    
+    The results are returned as a FortressResults record, appended to
+    `store` if one is given (see results_store.py), and rendered to the
+    markdown `report` (None skips the file).
+    
+    The convergence plot is reduced to PlotData right after the fortress
+    test and saved next to `plot` as .npz. plot_mode 'background' renders
+    it in a separate process while the remaining tests run (the suite only
+    waits for it at the end), 'sync' renders it in place and 'defer' only
+    writes the .npz for a later `python . plot` step. plot=None skips it.
     """
     print("\n" + "="*80)
     print(" " * 20 + "COMPLETE FORTRESS VERIFICATION SUITE")
     print("="*80 + "\n")
     
     # Test 1-5: Main fortress test
-    mean, std, trajectories = run_fortress_test(
+    fortress = run_fortress_test(
         seeds=100,
         iterations=800,
         particles=10000,
-        max_imbalance=1000.0
+        max_imbalance=1000.0,
+        entropy=entropy
     )
     
-    # Test 6: Perturbation resilience
-    recovery = test_perturbation_resilience()
-    
-    # Test 7: Scale invariance
-    scale_ratios = test_scale_invariance()
-    
-    # Test 8: Null hypothesis
-    null_sigma = test_null_hypothesis(seeds=1000)
-    
-    # Visualization
-    visualize_convergence(trajectories)
+    # Visualization: reduce now, draw off the critical path
+    if plot_mode not in PLOT_MODES:
+        raise ValueError(f"unknown plot_mode: {plot_mode!r} (expected one of {PLOT_MODES})")
+    plot_future = None
+    if plot is not None:
+        if __package__:
+            from .plotting import convergence_plot_data, save_plot_data, shutdown_renderer
+        else:
+            from plotting import convergence_plot_data, save_plot_data, shutdown_renderer
+        plot_data = convergence_plot_data(fortress.trajectories)
+        save_plot_data(plot_data, os.path.splitext(plot)[0] + '.npz')
+        if plot_mode == 'background':
+            plot_future = visualize_convergence(plot_data, plot, background=True)
+        elif plot_mode == 'sync':
+            visualize_convergence(plot_data, plot)
+        else:
+            print(f"\n✓ Plot data saved to {os.path.splitext(plot)[0]}.npz (render with: python . plot)")
     
-    # Generate markdown report
-    with open('FORTRESS_RESULTS.md', 'w') as f:
-        f.write("# Fortress Verification Results\n\n")
-        f.write("## Executive Summary\n\n")
-        f.write(f"**Measured S₈ Floor:** {mean:.8f} ± {std:.2e}\n\n")
-        f.write(f"**Theoretical Prediction:** 0.75000000\n\n")
-        f.write(f"**Deviation:** {abs(mean - 0.75):.2e} ({abs(mean-0.75)/0.75*100:.4f}%)\n\n")
+    # The background renderer is stopped even if a later test fails
+    try:
+        # Test 6: Perturbation resilience
+        recovery = test_perturbation_resilience(entropy=entropy)
         
-        f.write("## Test Results\n\n")
-        f.write("| Test | Result | Status |\n")
-        f.write("|------|--------|--------|\n")
-        f.write(f"| Basin of Attraction | Converges from {1000}x imbalance | ✓ PASS |\n")
-        f.write(f"| Stability Window | Stable for >100 iterations | ✓ PASS |\n")
-        f.write(f"| Perturbation Recovery | {recovery*100:.1f}% recovery | ✓ PASS |\n")
-        f.write(f"| Scale Invariance | Variance < {np.std(scale_ratios):.2e} | ✓ PASS |\n")
-        f.write(f"| Null Hypothesis | Rejected at {null_sigma:.1f}σ | ✓ PASS |\n")
+        # Test 7: Scale invariance
+        scale_ratios = test_scale_invariance(entropy=entropy)
         
-        f.write("\n## Interpretation\n\n")
-        f.write("The 0.75 ratio is a **robust topological attractor** of the 4D→3D projection ")
-        f.write("under recursive toroidal dynamics. This is not a numerical artifact or ")
-        f.write("lucky crossing, but a fundamental fixed point of the system.\n")
-    
-    print("\n✓ Complete report saved to FORTRESS_RESULTS.md")
-    
-    return {
-        'mean': mean,
-        'std': std,
-        'recovery': recovery,
-        'null_sigma': null_sigma,
-        'trajectories': trajectories
-    }
+        # Test 8: Null hypothesis
+        null_sigma = test_null_hypothesis(seeds=1000, entropy=entropy)
+        
+        results = FortressResults(
+            mean_ratio=fortress.mean_ratio,
+            std_dev=fortress.std_dev,
+            convergence_rate=fortress.convergence_rate,
+            stability_passes=fortress.stability_passes,
+            basin_size=fortress.max_imbalance,
+            perturbation_recovery=float(recovery),
+            null_hypothesis_sigma=float(null_sigma),
+            scale_invariance_std=float(np.std(scale_ratios)),
+            entropy=entropy,
+            trajectories=fortress.trajectories
+        )
+        if store is not None:
+            open_store(store).append(results)
+        
+        # Generate markdown report
+        if report is not None:
+            with open(report, 'w') as f:
+                f.write(render_markdown(results))
+            print(f"\n✓ Complete report saved to {report}")
+        
+        if plot_future is not None:
+            print(f"\n✓ Convergence plot saved to {plot_future.result()}")
+    finally:
+        if plot_future is not None:
+            shutdown_renderer()
+    
+    return results
 
 # Execute
 if __name__ == "__main__":
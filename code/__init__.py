@@ -0,0 +1,97 @@
+"""
+BARE-URFE ENGINES
+
+Importable as the `urfe` package (pyproject.toml maps it onto this
+directory) while every module still runs as a plain script:
+
+    import urfe
+    urfe.run_fortress_test(seeds=20, entropy=1)
+    urfe.goldilocks_audit.run_goldilocks_audit()
+
+    python -m urfe fortress --seeds 20      (see cli.py)
+
+Nothing is imported up front: submodules, and the entry points re-exported
+below, load on first attribute access, and matplotlib / numba only load
+when a plot or the compiled backend is actually requested. Importing the
+package therefore costs next to nothing and runs no simulation.
+
+The engine modules import their siblings relative to the package when
+loaded as urfe (`from .checkpoint import ...`) and by flat name when run as
+scripts, so sys.path is left alone and no engine module can shadow an
+installed package of the same name. Names stored on disk (result records,
+queued sweeps) leave out the package prefix and resolve in either mode.
+"""
+
+import importlib
+
+__version__ = '5.1'
+
+_MODULES = (
+    'UNIVERSAL_RECURSION_ENGINE', 'TOROIDAL_S8_ATTRACTOR', 'bare_urfe', 'bare_urfe_sub_planck_mirror',
+    'benchmark', 'checkpoint', 'cli', 'convergence', 'goldilocks_audit', 'jobs', 'mcp_server', 'metrics', 'orbit_solver',
+    'param_sweep', 'parallel_sweep', 'plotting', 'result_cache', 'results_store', 'sequential', 'shared_state',
+    'sine_kernels', 'trajectory_sinks', 'work_queue'
+)
+
+_EXPORTS = {
+    'run_fortress_test': 'UNIVERSAL_RECURSION_ENGINE',
+    'run_fortress_sequential': 'UNIVERSAL_RECURSION_ENGINE',
+    'null_ratio_moments': 'UNIVERSAL_RECURSION_ENGINE',
+    'check_null_distribution': 'UNIVERSAL_RECURSION_ENGINE',
+    'run_complete_fortress_suite': 'UNIVERSAL_RECURSION_ENGINE',
+    'validate_precision': 'UNIVERSAL_RECURSION_ENGINE',
+    'visualize_convergence': 'UNIVERSAL_RECURSION_ENGINE',
+    'run_goldilocks_audit': 'goldilocks_audit',
+    'run_attractor_audit': 'TOROIDAL_S8_ATTRACTOR',
+    'check_eigenbasis_regression': 'TOROIDAL_S8_ATTRACTOR',
+    'prove_equalization': 'bare_urfe',
+    'classify_sine_map': 'bare_urfe',
+    'mirror_attractor': 'bare_urfe_sub_planck_mirror',
+    'mirror_scale_grid': 'bare_urfe_sub_planck_mirror',
+    'find_orbit': 'orbit_solver',
+    'Orbit': 'orbit_solver',
+    'ConvergenceTracker': 'convergence',
+    'Recorder': 'metrics',
+    'instrument': 'metrics',
+    'ResultCache': 'result_cache',
+    'set_cache': 'result_cache',
+    'run_benchmarks': 'benchmark',
+    'submit_fortress': 'jobs',
+    'submit_goldilocks': 'jobs',
+    'submit_mirror_audit': 'jobs',
+    'run_parameter_sweep': 'param_sweep',
+    'parameter_grid': 'param_sweep',
+    'latin_hypercube': 'param_sweep',
+    'load_table': 'param_sweep',
+    'SharedParticles': 'shared_state',
+    'evolve_shared': 'shared_state',
+    'ResultsStore': 'results_store',
+    'render_markdown': 'results_store',
+    'render_json': 'results_store',
+    'FortressResults': 'UNIVERSAL_RECURSION_ENGINE',
+    'FortressTestResult': 'UNIVERSAL_RECURSION_ENGINE',
+    'SequentialFortressResult': 'UNIVERSAL_RECURSION_ENGINE',
+    'GoldilocksResult': 'goldilocks_audit',
+    'AttractorResult': 'TOROIDAL_S8_ATTRACTOR',
+    'MirrorAuditResult': 'bare_urfe_sub_planck_mirror',
+    'convergence_plot_data': 'plotting',
+    'render_convergence': 'plotting',
+    'load_plot_data': 'plotting',
+    'WorkQueue': 'work_queue',
+    'run_worker': 'work_queue'
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    elif name in _MODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES) | set(_EXPORTS))
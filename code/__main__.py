@@ -0,0 +1,10 @@
+"""python -m urfe (or python code/): see cli.py."""
+
+import sys
+
+if __package__:
+    from .cli import main
+else:
+    from cli import main
+
+sys.exit(main())
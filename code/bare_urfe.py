@@ -1,23 +1,34 @@
+import math
 import numpy as np
 
-def prove_equalization(iterations=500, particles=10000):
+if __package__:
+    from .orbit_solver import Orbit, find_orbit
+    from .sine_kernels import block_moments, evolve_moments
+else:
+    from orbit_solver import Orbit, find_orbit
+    from sine_kernels import block_moments, evolve_moments
+
+def prove_equalization(iterations=500, particles=10000, dtype=np.float64):
     """
     STABILITY TEST:
     Demonstrates that a 4D recursive map equalizes variance across dimensions.
     The 0.75 ratio follows from 3D observation of this 4D equalized system.
+    
+    dtype=np.float32 stores the particles in single precision (half the
+    memory traffic); variances are still accumulated in float64.
     """
     # 1. Start with an imbalanced 4D Universe (Dim 4 has 100x variance)
     scales = np.array([1.0, 1.0, 1.0, 10.0]) 
-    data = np.random.normal(0, 1, (particles, 4)) * scales
+    data = (np.random.normal(0, 1, (particles, 4)) * scales).astype(dtype, copy=False)
     
-    print(f"Initial 4D Variances: {np.var(data, axis=0)}")
+    count, _, m2 = block_moments(data)
+    print(f"Initial 4D Variances: {m2 / count}")
 
     # 2. Apply Recursive Toroidal Dynamics (Evolution of 3s)
-    for _ in range(iterations):
-        data = np.sin(data * np.pi)
-
     # 3. Measure final state: Dimensions are now equalized.
-    final_vars = np.var(data, axis=0)
+    #    (the last step is fused with the variance pass)
+    count, _, m2 = evolve_moments(data, iterations)
+    final_vars = m2 / count
     print(f"Final 4D Variances: {final_vars}")
 
     # 4. Result: Any 3D slice of this equalized 4D system yields 75%
@@ -26,6 +37,23 @@ def prove_equalization(iterations=500, particles=10000):
     
     return var_observed / var_total
 
+def classify_sine_map(x0=0.3, max_steps=500) -> Orbit:
+    """
+    Attractor of the per-particle map x -> sin(pi x) (see orbit_solver).
+
+    The map has no stable fixed point or cycle (lambda ~ ln 2 > 0), so the
+    equalization in prove_equalization is a property of its invariant
+    density and cannot be shortcut by solving for an orbit.
+    """
+    return find_orbit(
+        lambda x: math.sin(math.pi * x),
+        lambda x: math.pi * math.cos(math.pi * x),
+        x0, max_steps=max_steps, tail=max_steps // 2
+    )
+
 # Run the proof
-ratio = prove_equalization()
-print(f"\nEmergent S8 Floor: {ratio:.4f}")
+if __name__ == "__main__":
+    ratio = prove_equalization()
+    print(f"\nEmergent S8 Floor: {ratio:.4f}")
+    orbit = classify_sine_map()
+    print(f"Sine-map regime: {orbit.regime} (Lyapunov exponent {orbit.lyapunov:.3f})")
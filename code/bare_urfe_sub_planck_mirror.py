@@ -1,4 +1,38 @@
+import importlib.util
+import math
 import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+
+if __package__:
+    from .orbit_solver import Orbit, find_orbit
+    from .parallel_sweep import concat_chunks, run_seed_sweep
+    from .result_cache import cached
+    from .results_store import open_store, record
+else:
+    from orbit_solver import Orbit, find_orbit
+    from parallel_sweep import concat_chunks, run_seed_sweep
+    from result_cache import cached
+    from results_store import open_store, record
+
+# Optional compiled backend, imported on first use (NumPy is used without it)
+numba = None
+
+# Grid points evolved together (a few float64 arrays of this length stay in L2)
+GRID_BLOCK = 16384
+
+# Agreement required between the compiled and NumPy backends
+BACKEND_TOLERANCE = 1e-12
+
+# Scales of the audit: from cosmological to sub-Planck
+AUDIT_SCALES = [
+    100000.0,    # Macroscopic / Cosmological
+    100.0,       # Atomic scale
+    2.0,         # Near Planck
+    1.0,         # Exact Planck Boundary (The Mirror)
+    0.5,         # Sub-Planck
+    0.01,        # Deep Sub-Planck
+    0.00001      # Extreme Sub-Planck (Where standard math breaks)
+]
 
 def bare_urfe_sub_planck_mirror(scale_L, iterations=2000, trace_floor=0.75, matter_bias=0.03):
     """
@@ -37,7 +71,317 @@ def bare_urfe_sub_planck_mirror(scale_L, iterations=2000, trace_floor=0.75, matt
     attractor_states = history[-500:]
     return np.mean(attractor_states), np.max(attractor_states), np.std(attractor_states)
 
-def execute_audit():
+def mirror_map(
+    scale_L: float,
+    trace_floor: float = 0.75,
+    matter_bias: float = 0.03
+) -> Tuple[Callable[[float], float], Callable[[float], float]]:
+    """
+    One step of the mirror recursion and its derivative, as scalar functions.
+
+    The reflection flips the sign of the slope; the |sin| fold contributes
+    sign(sin) (the derivative is taken from the side the state lies on).
+    """
+    phase = np.pi * (scale_L + (1.0 / scale_L))
+    lower = 1.0 - trace_floor
+
+    def step(state: float) -> float:
+        state = trace_floor * abs(math.sin(phase * state + matter_bias))
+        return 1.0 - state if state < lower else state
+
+    def slope(state: float) -> float:
+        u = phase * state + matter_bias
+        sin_u = math.sin(u)
+        d = trace_floor * phase * math.cos(u) * (1.0 if sin_u >= 0 else -1.0)
+        return -d if trace_floor * abs(sin_u) < lower else d
+
+    return step, slope
+
+def mirror_attractor(
+    scale_L: float,
+    iterations: int = 2000,
+    trace_floor: float = 0.75,
+    matter_bias: float = 0.03,
+    tail: int = 500,
+    decimals: int = 12
+) -> Orbit:
+    """
+    Attractor of the mirror recursion at one scale (see orbit_solver).
+
+    Stable fixed points and cycles are found with Brent cycle detection
+    and Newton refinement in tens of steps, and their mean/max/std are
+    taken over one exact period. Orbits with no cycle within `iterations`
+    steps get the brute-force tail statistics of bare_urfe_sub_planck_mirror
+    and are labelled chaotic when their Lyapunov exponent is positive.
+    """
+    step, slope = mirror_map(scale_L, trace_floor, matter_bias)
+    return find_orbit(step, slope, trace_floor, decimals=decimals, max_steps=iterations, tail=tail)
+
+def _mirror_block(
+    start: int,
+    stop: int,
+    scale_L: np.ndarray,
+    trace_floor: np.ndarray,
+    matter_bias: np.ndarray,
+    iterations: int,
+    tail: int
+) -> np.ndarray:
+    """
+    Mirror recursion of grid points [start, stop), one GRID_BLOCK at a time.
+
+    Returns:
+        (stop - start, 3) array of tail mean, max and std
+    """
+    out = np.empty((stop - start, 3))
+    tail = max(1, min(tail, iterations))
+
+    for lo in range(start, stop, GRID_BLOCK):
+        hi = min(lo + GRID_BLOCK, stop)
+        floor = trace_floor[lo:hi]
+        bias = matter_bias[lo:hi]
+        lower = 1.0 - floor
+
+        # T-Duality Phase Wrapping
+        phase = np.pi * (scale_L[lo:hi] + (1.0 / scale_L[lo:hi]))
+
+        state = floor.copy()
+        count = 0
+        mean = np.zeros(hi - lo)
+        m2 = np.zeros(hi - lo)
+        peak = np.full(hi - lo, -np.inf)
+        delta = np.empty(hi - lo)
+
+        for i in range(iterations):
+            # Recursive Sine-Map with Trace Invariant Clamp
+            np.multiply(phase, state, out=state)
+            state += bias
+            np.sin(state, out=state)
+            np.abs(state, out=state)
+            np.multiply(floor, state, out=state)
+
+            # Bulk Reflection: np.where(state < 1 - floor, 1 - state, state), in place
+            np.subtract(1.0, state, out=state, where=state < lower)
+
+            # Welford tail statistics instead of a stored history
+            if i >= iterations - tail:
+                count += 1
+                np.subtract(state, mean, out=delta)
+                mean += delta / count
+                m2 += delta * (state - mean)
+                np.maximum(peak, state, out=peak)
+
+        out[lo - start:hi - start, 0] = mean
+        out[lo - start:hi - start, 1] = peak
+        out[lo - start:hi - start, 2] = np.sqrt(m2 / count)
+
+    return out
+
+def _mirror_loop(scale_L, trace_floor, matter_bias, iterations, tail, out):
+    """
+    Scalar mirror recursion per grid point (compiled by numba, prange over points).
+
+    Same operation order as _mirror_block, with the recurrence as a tight
+    native loop instead of one array pass per operation.
+    """
+    for k in numba.prange(scale_L.shape[0]):
+        floor = trace_floor[k]
+        bias = matter_bias[k]
+        lower = 1.0 - floor
+        phase = np.pi * (scale_L[k] + (1.0 / scale_L[k]))
+
+        state = floor
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        peak = -np.inf
+        for i in range(iterations):
+            state = floor * abs(math.sin(phase * state + bias))
+            if state < lower:
+                state = 1.0 - state
+            if i >= iterations - tail:
+                count += 1
+                delta = state - mean
+                mean += delta / count
+                m2 += delta * (state - mean)
+                peak = max(peak, state)
+
+        out[k, 0] = mean
+        out[k, 1] = peak
+        out[k, 2] = math.sqrt(m2 / count)
+
+_compiled_loop = None
+
+def _numba_available() -> bool:
+    """Whether numba is installed, without paying for its import."""
+    return numba is not None or importlib.util.find_spec('numba') is not None
+
+def _resolve_backend(params: Dict) -> Dict:
+    """mirror_scale_grid arguments with backend='auto' replaced by the backend it selects."""
+    if params['backend'] == 'auto':
+        return dict(params, backend='numba' if _numba_available() else 'numpy')
+    return params
+
+def _import_numba():
+    global numba
+    if numba is None:
+        try:
+            import numba as module
+        except ImportError:
+            raise ImportError("the 'numba' backend requires numba (pip install numba)") from None
+        numba = module
+    return numba
+
+def _mirror_compiled(
+    scale_L: np.ndarray,
+    trace_floor: np.ndarray,
+    matter_bias: np.ndarray,
+    iterations: int,
+    tail: int,
+    workers: int = 0
+) -> np.ndarray:
+    """
+    Compiled backend of mirror_scale_grid (JIT-compiled on first use).
+
+    Runs on `workers` threads (0 = all of numba's threads); the caller's
+    thread count is restored afterwards.
+    """
+    global _compiled_loop
+    _import_numba()
+    if _compiled_loop is None:
+        _compiled_loop = numba.njit(parallel=True, cache=True)(_mirror_loop)
+
+    limit = numba.config.NUMBA_NUM_THREADS
+    previous = numba.get_num_threads()
+    numba.set_num_threads(min(workers, limit) if workers else limit)
+    try:
+        out = np.empty((scale_L.size, 3))
+        _compiled_loop(scale_L, trace_floor, matter_bias, iterations, max(1, min(tail, iterations)), out)
+    finally:
+        numba.set_num_threads(previous)
+    return out
+
+@cached(seed=None, ignore=('workers',), normalize=_resolve_backend)
+def mirror_scale_grid(
+    scale_L,
+    trace_floor=0.75,
+    matter_bias=0.03,
+    iterations: int = 2000,
+    tail: int = 500,
+    outer: bool = False,
+    workers: int = 1,
+    backend: str = 'numpy'
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized bare_urfe_sub_planck_mirror over many parameter points.
+
+    Every point is stepped together with array operations and only the tail
+    statistics are kept, so 10^6 scales (e.g. np.logspace(-6, 6, 10**6))
+    cost a few arrays of that length instead of 10^6 Python loops and
+    histories. The recursion is deterministic, so grids are memoized
+    (see result_cache.py).
+
+    Args:
+        scale_L: Observation scale(s) in Planck units
+        trace_floor: Trace invariant clamp(s)
+        matter_bias: Jitter(s)
+        iterations: Recursive depth
+        tail: Number of final iterations averaged (burn-in is discarded)
+        outer: Grid over every (scale_L, trace_floor, matter_bias) combination
+               (result shape (len(scale_L), len(trace_floor), len(matter_bias)))
+               instead of broadcasting the three against each other
+        workers: Worker processes for the grid (0 = all cores); threads
+                 for the numba backend
+        backend: 'numpy', 'numba' (compiled recurrence, prange over points;
+                 agrees with numpy to BACKEND_TOLERANCE except where the
+                 chaotic recurrence amplifies an ulp, see check_backends)
+                 or 'auto' (numba when installed, else numpy)
+
+    Returns:
+        {'scale_L', 'trace_floor', 'matter_bias', 'mean', 'max', 'std'},
+        all arrays of the grid shape
+    """
+    params = [np.atleast_1d(np.asarray(v, dtype=np.float64)) for v in (scale_L, trace_floor, matter_bias)]
+    if outer:
+        params = np.meshgrid(*[p.ravel() for p in params], indexing='ij')
+    params = np.broadcast_arrays(*params)
+    shape = params[0].shape
+    flat = [np.ascontiguousarray(p).ravel() for p in params]
+
+    backend = _resolve_backend({'backend': backend})['backend']
+    if backend == 'numba':
+        stats = _mirror_compiled(*flat, iterations, tail, workers)
+    elif backend == 'numpy':
+        stats = concat_chunks(run_seed_sweep(
+            _mirror_block, flat[0].size, workers=workers,
+            chunk_size=flat[0].size if workers == 1 else None,
+            scale_L=flat[0], trace_floor=flat[1], matter_bias=flat[2],
+            iterations=iterations, tail=tail
+        ))
+    else:
+        raise ValueError(f"unknown backend: {backend!r}")
+
+    return {
+        'scale_L': params[0], 'trace_floor': params[1], 'matter_bias': params[2],
+        'mean': stats[:, 0].reshape(shape),
+        'max': stats[:, 1].reshape(shape),
+        'std': stats[:, 2].reshape(shape)
+    }
+
+def check_backends(
+    scale_L=np.logspace(-5, 5, 1001),
+    trace_floor=0.75,
+    matter_bias=0.03,
+    iterations: int = 2000,
+    tail: int = 500,
+    tolerance: float = BACKEND_TOLERANCE
+) -> Dict[str, float]:
+    """
+    Compare the numba backend against the NumPy reference.
+
+    Both backends perform the same IEEE operations in the same order, so
+    they agree exactly wherever the platform's vectorized and scalar sin
+    agree. Because the recurrence is chaotic for many scales, a single-ulp
+    difference in sin can grow into a different (statistically equivalent)
+    orbit. Such points are reported, not hidden.
+
+    Returns:
+        {'points', 'max_abs_diff', 'within_tolerance' (fraction), 'passed'}
+    """
+    reference = mirror_scale_grid.uncached(scale_L, trace_floor, matter_bias, iterations, tail, backend='numpy')
+    compiled = mirror_scale_grid.uncached(scale_L, trace_floor, matter_bias, iterations, tail, backend='numba')
+
+    diff = np.max([np.abs(reference[k] - compiled[k]) for k in ('mean', 'max', 'std')], axis=0)
+    report = {
+        'points': int(diff.size),
+        'max_abs_diff': float(np.max(diff)),
+        'within_tolerance': float(np.mean(diff <= tolerance)),
+        'passed': bool(np.all(diff <= tolerance))
+    }
+
+    print(f"\nBACKEND CHECK (numba vs numpy, {report['points']} points, {iterations} iterations):")
+    print(f"  Max |Δ|: {report['max_abs_diff']:.2e}")
+    print(f"  Within {tolerance:.0e}: {report['within_tolerance']*100:.2f}%")
+    print(f"  {'✓ PASS' if report['passed'] else '⚠ MISMATCH'}")
+    return report
+
+@record
+class MirrorAuditResult:
+    """Outcome of execute_audit (one entry per audited scale)"""
+    scale_L: np.ndarray
+    mean: np.ndarray
+    max: np.ndarray
+    std: np.ndarray
+    status: np.ndarray
+    sub_planck_stable: bool
+    mirror_mean: Optional[float] = None
+
+def execute_audit(store=None):
+    """
+    Sub-Planck mirror audit over AUDIT_SCALES.
+    
+    Returns a MirrorAuditResult record, also appended to `store` (a
+    ResultsStore or its directory) when given.
+    """
     print("=" * 85)
     print(" " * 20 + "BARE-URFE SUB-PLANCK MIRROR AUDIT")
     print("=" * 85)
@@ -45,20 +389,12 @@ def execute_audit():
     print("-" * 85)
     
     # Test scales: From Cosmological to Sub-Planck
-    test_scales = [
-        100000.0,    # Macroscopic / Cosmological
-        100.0,       # Atomic scale
-        2.0,         # Near Planck
-        1.0,         # Exact Planck Boundary (The Mirror)
-        0.5,         # Sub-Planck
-        0.01,        # Deep Sub-Planck
-        0.00001      # Extreme Sub-Planck (Where standard math breaks)
-    ]
+    test_scales = AUDIT_SCALES
     
     results = []
+    grid = mirror_scale_grid(test_scales)
     
-    for L in test_scales:
-        mean_val, max_val, std_val = bare_urfe_sub_planck_mirror(L)
+    for L, mean_val, max_val, std_val in zip(test_scales, grid['mean'], grid['max'], grid['std']):
         
         # Status classification
         if L == 1.0:
@@ -85,11 +421,19 @@ def execute_audit():
     
     print("=" * 85)
     
+    # Attractor classification (cycle detection + Lyapunov exponent)
+    print("\n🔁 ATTRACTOR REGIMES:")
+    for L in test_scales:
+        orbit = mirror_attractor(L)
+        period = f", period {orbit.period}" if orbit.period > 1 else ""
+        print(f" L = {L:<12g} {orbit.regime}{period} (λ = {orbit.lyapunov:+.3f}, {orbit.steps} steps)")
+    
     # Analysis
     print("\n📊 ANALYSIS:")
     
     # Check if sub-Planck scales remain stable
     sub_planck = [r for r in results if r['scale'] < 1.0]
+    sub_planck_stable = False
     if sub_planck:
         sub_planck_means = [r['mean'] for r in sub_planck]
         sub_planck_stable = all(0.70 <= m <= 0.85 for m in sub_planck_means)
@@ -116,6 +460,16 @@ def execute_audit():
         print(f" Deviation from floor: {deviation:.6f} ({deviation/0.75*100:.2f}%)")
     
     print("\n" + "=" * 85)
+    
+    result = MirrorAuditResult(
+        scale_L=np.array(test_scales, dtype=float), mean=np.asarray(grid['mean']), max=np.asarray(grid['max']),
+        std=np.asarray(grid['std']), status=np.array([r['status'] for r in results]),
+        sub_planck_stable=bool(sub_planck_stable),
+        mirror_mean=float(mirror_result['mean']) if mirror_result else None
+    )
+    if store is not None:
+        open_store(store).append(result)
+    return result
 
 if __name__ == "__main__":
     execute_audit()
@@ -0,0 +1,309 @@
+"""
+BENCHMARK SUITE
+
+Tracked throughput of every engine over parameterized problem sizes.
+
+    python benchmark.py run [--size small|medium|large] [--cases fortress,...] [-o bench.json]
+    python benchmark.py compare base.json new.json [--threshold 0.10]
+
+Each case runs in a fresh (spawned) process with the result cache off, so
+peak RSS belongs to that case alone and nothing is served from memory.
+A traced warm-up run measures allocations; wall time is the best of
+--repeat untraced runs. Reported per case:
+
+    throughput            work units per second (unit depends on the engine:
+                          particle-iterations, seed-iterations, scale-iterations)
+    seed_iterations_per_s seeds x iterations per second
+    peak_rss_mb           peak resident set size of the case process
+    peak_traced_mb        peak NumPy/Python allocation (tracemalloc)
+    iterations_to_convergence / time_to_convergence_s
+                          mean iterations (and the matching share of wall time)
+                          until a seed converged, where the engine defines it
+
+compare flags every case whose throughput dropped, or whose peak RSS
+grew, by more than the threshold, and exits with status 1 if any did.
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Problem sizes: small for CI smoke runs, large matches the scripts' defaults
+SIZES = {
+    'small': {
+        'fortress': dict(seeds=10, iterations=100, particles=2000),
+        'fortress_float32': dict(seeds=10, iterations=100, particles=2000, dtype='float32'),
+        'scale_invariance': dict(particle_counts=[100, 1000, 10000], iterations=100),
+        'goldilocks': dict(target_n=[3, 4, 5], seeds=4, iterations=100),
+        'attractor': dict(n_seeds=20, iterations=500),
+        'attractor_eigenbasis': dict(n_seeds=20, iterations=500, mode='eigenbasis'),
+        'mirror': dict(scales=20, iterations=2000),
+        'mirror_grid': dict(scales=10000, iterations=2000),
+        'mirror_attractor': dict(scales=200, iterations=2000),
+    },
+    'medium': {
+        'fortress': dict(seeds=50, iterations=400, particles=10000),
+        'fortress_float32': dict(seeds=50, iterations=400, particles=10000, dtype='float32'),
+        'scale_invariance': dict(particle_counts=[100, 1000, 10000, 100000], iterations=300),
+        'goldilocks': dict(target_n=[3, 4, 5], seeds=20, iterations=500),
+        'attractor': dict(n_seeds=75, iterations=2000),
+        'attractor_eigenbasis': dict(n_seeds=75, iterations=2000, mode='eigenbasis'),
+        'mirror': dict(scales=100, iterations=2000),
+        'mirror_grid': dict(scales=50000, iterations=2000),
+        'mirror_attractor': dict(scales=1000, iterations=2000),
+    },
+    'large': {
+        'fortress': dict(seeds=100, iterations=800, particles=10000),
+        'fortress_float32': dict(seeds=100, iterations=800, particles=10000, dtype='float32'),
+        'scale_invariance': dict(particle_counts=[100, 1000, 10000, 100000], iterations=500),
+        'goldilocks': dict(target_n=[3, 4, 5], seeds=50, iterations=1000),
+        'attractor': dict(n_seeds=150, iterations=5000),
+        'attractor_eigenbasis': dict(n_seeds=150, iterations=5000, mode='eigenbasis'),
+        'mirror': dict(scales=500, iterations=2000),
+        'mirror_grid': dict(scales=200000, iterations=2000),
+        'mirror_attractor': dict(scales=5000, iterations=2000),
+    },
+}
+
+# Fixed root seed so every run of a case does identical work
+ENTROPY = 20260101
+
+def _module(name: str):
+    """Import an engine module (relative to the package when loaded as urfe)."""
+    return importlib.import_module(f'.{name}', __package__) if __package__ else importlib.import_module(name)
+
+def _settle_iterations(trajectories: np.ndarray, target: float = 0.75, tolerance: float = 0.01) -> float:
+    """Mean iterations until a trajectory enters ±tolerance of target for good."""
+    outside = np.abs(np.asarray(trajectories) - target) >= tolerance
+    last_outside = np.where(outside.any(axis=1), outside.shape[1] - np.argmax(outside[:, ::-1], axis=1), 0)
+    return float(np.mean(last_outside))
+
+def _case_fortress(seeds, iterations, particles, dtype='float64', converge=None):
+    run_fortress_test = _module('UNIVERSAL_RECURSION_ENGINE').run_fortress_test
+    _, _, trajectories = run_fortress_test(
+        seeds=seeds, iterations=iterations, particles=particles, entropy=ENTROPY, dtype=dtype, converge=converge
+    )
+    return {
+        'units': seeds * particles * iterations, 'unit': 'particle-iterations',
+        'seed_iterations': seeds * iterations, 'iterations': iterations,
+        'iterations_to_convergence': _settle_iterations(trajectories)
+    }
+
+def _case_scale_invariance(particle_counts, iterations):
+    test_scale_invariance = _module('UNIVERSAL_RECURSION_ENGINE').test_scale_invariance
+    test_scale_invariance(particle_counts, iterations, entropy=ENTROPY)
+    return {
+        'units': sum(particle_counts) * iterations, 'unit': 'particle-iterations',
+        'seed_iterations': len(particle_counts) * iterations, 'iterations': iterations
+    }
+
+def _case_goldilocks(target_n, seeds, iterations, converge=None):
+    # The sweep behind run_goldilocks_audit (the wrapper only prints and exports JSON)
+    audit = _module('goldilocks_audit')
+    _, _, iterations_run = audit._goldilocks_sweep.uncached(
+        target_n, seeds, iterations, 1, ENTROPY, converge, 'jacobi', None, 50
+    )
+    return {
+        'units': seeds * sum(target_n) * audit.WIDTH * iterations, 'unit': 'element-iterations',
+        'seed_iterations': seeds * len(target_n) * iterations, 'iterations': iterations,
+        'iterations_to_convergence': float(np.mean(iterations_run)) if converge else None
+    }
+
+def _case_attractor(n_seeds, iterations, mode='reconstruct', converge=None):
+    # The sweep behind run_attractor_audit (the wrapper only prints)
+    _attractor_sweep = _module('TOROIDAL_S8_ATTRACTOR')._attractor_sweep
+    _, _, iterations_run = _attractor_sweep.uncached(n_seeds, iterations, 1, ENTROPY, converge, 8, mode)
+    return {
+        'units': n_seeds * iterations, 'unit': 'seed-iterations',
+        'seed_iterations': n_seeds * iterations, 'iterations': iterations,
+        'iterations_to_convergence': float(np.mean(iterations_run)) if converge else None
+    }
+
+def _case_mirror(scales, iterations):
+    bare_urfe_sub_planck_mirror = _module('bare_urfe_sub_planck_mirror').bare_urfe_sub_planck_mirror
+    for L in np.logspace(-5, 5, scales):
+        bare_urfe_sub_planck_mirror(L, iterations)
+    return {'units': scales * iterations, 'unit': 'scale-iterations',
+            'seed_iterations': scales * iterations, 'iterations': iterations}
+
+def _case_mirror_grid(scales, iterations, backend='numpy'):
+    mirror_scale_grid = _module('bare_urfe_sub_planck_mirror').mirror_scale_grid
+    mirror_scale_grid.uncached(np.logspace(-5, 5, scales), iterations=iterations, backend=backend)
+    return {'units': scales * iterations, 'unit': 'scale-iterations',
+            'seed_iterations': scales * iterations, 'iterations': iterations}
+
+def _case_mirror_attractor(scales, iterations):
+    mirror_attractor = _module('bare_urfe_sub_planck_mirror').mirror_attractor
+    steps = [mirror_attractor(L, iterations).steps for L in np.logspace(-5, 5, scales)]
+    # Work is counted as the brute-force budget the solver replaces
+    return {'units': scales * iterations, 'unit': 'scale-iterations',
+            'seed_iterations': scales * iterations, 'iterations': iterations,
+            'iterations_to_convergence': float(np.mean(steps))}
+
+CASES = {
+    'fortress': _case_fortress,
+    'fortress_float32': _case_fortress,
+    'scale_invariance': _case_scale_invariance,
+    'goldilocks': _case_goldilocks,
+    'attractor': _case_attractor,
+    'attractor_eigenbasis': _case_attractor,
+    'mirror': _case_mirror,
+    'mirror_grid': _case_mirror_grid,
+    'mirror_attractor': _case_mirror_attractor,
+}
+
+def _run_case(name: str, params: Dict[str, Any], repeat: int) -> Dict[str, Any]:
+    """Run one case in this (fresh) process: a traced warm-up, then `repeat` timed runs."""
+    _module('result_cache').set_cache(None)
+
+    walls = []
+    with tempfile.TemporaryDirectory() as scratch, open(os.devnull, 'w') as devnull:
+        os.chdir(scratch)  # engines that write reports do so here
+        with contextlib.redirect_stdout(devnull):
+            tracemalloc.start()
+            info = CASES[name](**params)
+            _, traced = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            for _ in range(max(1, repeat)):
+                started = time.perf_counter()
+                CASES[name](**params)
+                walls.append(time.perf_counter() - started)
+
+    wall = min(walls)
+    metrics = {
+        'params': params,
+        'wall_s': wall,
+        'wall_all_s': walls,
+        'unit': info['unit'],
+        'throughput': info['units'] / wall,
+        'seed_iterations_per_s': info['seed_iterations'] / wall,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        'peak_traced_mb': traced / 2**20,
+        'iterations_to_convergence': info.get('iterations_to_convergence'),
+        'time_to_convergence_s': None
+    }
+    if metrics['iterations_to_convergence'] is not None:
+        metrics['time_to_convergence_s'] = wall * metrics['iterations_to_convergence'] / info['iterations']
+    return metrics
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(size: str = 'small', cases: Optional[List[str]] = None, repeat: int = 3) -> Dict[str, Any]:
+    """Run the selected cases (default: all) at one problem size."""
+    selected = cases or list(SIZES[size])
+    report = {
+        'meta': {
+            'commit': _git_commit(),
+            'size': size,
+            'repeat': repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'cpus': os.cpu_count()
+        },
+        'results': {}
+    }
+
+    for name in selected:
+        # Spawned worker: clean interpreter, so peak RSS is this case's own
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+            metrics = pool.submit(_run_case, name, SIZES[size][name], repeat).result()
+        report['results'][name] = metrics
+        convergence = ''
+        if metrics['iterations_to_convergence'] is not None:
+            convergence = (f" | converged in {metrics['iterations_to_convergence']:.0f} it"
+                           f" ({metrics['time_to_convergence_s']:.3f}s)")
+        print(f"{name:<22} {metrics['wall_s']:8.3f}s | {metrics['throughput']:.3e} {metrics['unit']}/s | "
+              f"{metrics['seed_iterations_per_s']:.3e} seed-it/s | RSS {metrics['peak_rss_mb']:.0f} MB{convergence}")
+
+    return report
+
+def compare_reports(base: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.10) -> List[str]:
+    """
+    Cases that regressed by more than `threshold` (relative).
+
+    Returns:
+        One message per regression (throughput drop or peak RSS growth)
+    """
+    regressions = []
+    print(f"{'case':<22} {'base':>12} {'new':>12} {'change':>9}   peak RSS")
+    for name, old in base['results'].items():
+        if name not in new['results']:
+            continue
+        cur = new['results'][name]
+        speed = cur['throughput'] / old['throughput'] - 1.0
+        memory = cur['peak_rss_mb'] / old['peak_rss_mb'] - 1.0 if old['peak_rss_mb'] else 0.0
+        flags = []
+        if speed < -threshold:
+            flags.append('SLOWER')
+            regressions.append(f"{name}: throughput {speed*100:+.1f}%")
+        if memory > threshold:
+            flags.append('MORE MEMORY')
+            regressions.append(f"{name}: peak RSS {memory*100:+.1f}%")
+        print(f"{name:<22} {old['throughput']:12.3e} {cur['throughput']:12.3e} {speed*100:+8.1f}%   "
+              f"{old['peak_rss_mb']:.0f} -> {cur['peak_rss_mb']:.0f} MB {' '.join(flags)}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the benchmarks and save JSON')
+    run.add_argument('--size', choices=sorted(SIZES), default='small')
+    run.add_argument('--cases', help='comma-separated subset of: ' + ', '.join(CASES))
+    run.add_argument('--repeat', type=int, default=3)
+    run.add_argument('-o', '--output', default='benchmark_results.json')
+
+    compare = commands.add_parser('compare', help='flag regressions between two result files')
+    compare.add_argument('base')
+    compare.add_argument('new')
+    compare.add_argument('--threshold', type=float, default=0.10, help='relative tolerance (0.10 = 10%%)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        cases = args.cases.split(',') if args.cases else None
+        report = run_benchmarks(args.size, cases, args.repeat)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Benchmark results saved to {args.output}")
+        return 0
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    regressions = compare_reports(base, new, args.threshold)
+    if regressions:
+        print(f"\n⚠ {len(regressions)} regression(s) beyond {args.threshold*100:.0f}%:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print(f"\n✓ No regressions beyond {args.threshold*100:.0f}%")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
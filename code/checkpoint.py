@@ -0,0 +1,208 @@
+"""
+CHECKPOINT / RESUME FOR LONG AUDITS
+
+Each sweep task (one contiguous chunk of seeds, see parallel_sweep) owns a
+directory under the checkpoint root:
+
+    <root>/<engine>-<start>-<stop>/
+        meta.json          run parameters (a resume with different ones is refused)
+        <name>.npy         memory-mapped outputs written in place (trajectories, results)
+        state.json         commit marker: iteration + snapshot directory of the last checkpoint
+        snap-<n>/          particle state (.npy), RNG state (rng.pkl), tracker state
+        result.pkl         final task result once the chunk has finished
+
+Snapshots are written to a fresh directory and only become current once
+state.json is atomically replaced, so a preempted run always resumes from
+a complete checkpoint and reproduces the uninterrupted results exactly.
+Chunks are independent, so parallel sweeps checkpoint without coordination.
+"""
+
+import json
+import os
+import pickle
+import shutil
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+
+if __package__:
+    from .parallel_sweep import resolve_entropy
+else:
+    from parallel_sweep import resolve_entropy
+
+def _atomic_write(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def overrides(**values) -> Dict[str, Any]:
+    """
+    Optional task parameters that were actually given (None dropped), so
+    checkpoints of runs that do not use them keep their original meta.json.
+    """
+    return {name: value for name, value in values.items() if value is not None}
+
+def run_entropy(root: Optional[str], entropy: Optional[int]) -> int:
+    """
+    Root entropy of a resumable run. Fresh entropy drawn for the first
+    attempt is recorded under `root`, so a resumed run reuses the same streams.
+    """
+    if entropy is not None or root is None:
+        return resolve_entropy(entropy)
+    path = os.path.join(root, 'entropy.json')
+    if os.path.exists(path):
+        with open(path) as f:
+            return int(json.load(f)['entropy'])
+    os.makedirs(root, exist_ok=True)
+    entropy = resolve_entropy()
+    _atomic_write(path, json.dumps({'entropy': entropy}).encode())
+    return entropy
+
+def run_setting(root: Optional[str], name: str, value: Any) -> Any:
+    """
+    Run-level setting (e.g. a memory-derived chunk size) that must not
+    change between attempts: the first attempt's value is recorded under
+    `root` and returned on resume.
+    """
+    if root is None:
+        return value
+    path = os.path.join(root, 'run.json')
+    settings = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            settings = json.load(f)
+    if name in settings:
+        return settings[name]
+    os.makedirs(root, exist_ok=True)
+    settings[name] = _jsonable(value)
+    _atomic_write(path, json.dumps(settings, indent=2).encode())
+    return value
+
+class Checkpoint:
+    """
+    Checkpoint directory of one sweep task.
+
+    Args:
+        root: Checkpoint root shared by all tasks of a run
+        engine: Engine name (directory prefix)
+        start, stop: Seed range of the task
+        params: Parameters that must match on resume
+        every: Iterations between checkpoints
+    """
+
+    def __init__(self, root: str, engine: str, start: int, stop: int, params: Dict[str, Any], every: int = 50):
+        self.path = os.path.join(root, f"{engine}-{start}-{stop}")
+        self.every = max(1, int(every))
+        self._arrays = []
+        os.makedirs(self.path, exist_ok=True)
+
+        meta = {'engine': engine, 'start': start, 'stop': stop,
+                'params': {k: _jsonable(v) for k, v in params.items()}}
+        meta_path = os.path.join(self.path, 'meta.json')
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                stored = json.load(f)
+            if stored != json.loads(json.dumps(meta)):
+                raise ValueError(f"checkpoint {self.path} was written with different parameters: {stored['params']}")
+        else:
+            _atomic_write(meta_path, json.dumps(meta, indent=2).encode())
+
+    def due(self, iteration: int, iterations: int) -> bool:
+        """True if a checkpoint should be taken after `iteration` completed iterations."""
+        return iteration % self.every == 0 and 0 < iteration < iterations
+
+    def array(self, name: str, shape: Tuple[int, ...], dtype=np.float64) -> np.ndarray:
+        """Memory-mapped output array, reopened (not cleared) on resume."""
+        path = os.path.join(self.path, f"{name}.npy")
+        out = None
+        if os.path.exists(path):
+            out = np.load(path, mmap_mode='r+')
+            if out.shape != tuple(shape) or out.dtype != np.dtype(dtype):
+                out = None
+        if out is None:
+            out = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=tuple(shape))
+        self._arrays.append(out)
+        return out
+
+    def save(self, iteration: int, arrays: Dict[str, np.ndarray], rng: Any = None, **info) -> None:
+        """Snapshot state after `iteration` iterations and make it the resume point."""
+        for out in self._arrays:
+            out.flush()
+
+        previous = self._state()
+        snap = f"snap-{(previous['serial'] + 1) if previous else 0}"
+        snap_path = os.path.join(self.path, snap)
+        shutil.rmtree(snap_path, ignore_errors=True)
+        os.makedirs(snap_path)
+        for name, value in arrays.items():
+            if value is not None:
+                np.save(os.path.join(snap_path, f"{name}.npy"), value)
+        with open(os.path.join(snap_path, 'rng.pkl'), 'wb') as f:
+            pickle.dump(rng, f)
+
+        state = {'iteration': int(iteration), 'snapshot': snap,
+                 'serial': (previous['serial'] + 1) if previous else 0, 'info': _jsonable(info)}
+        _atomic_write(os.path.join(self.path, 'state.json'), json.dumps(state).encode())
+        if previous:
+            shutil.rmtree(os.path.join(self.path, previous['snapshot']), ignore_errors=True)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Last committed snapshot: {'iteration', 'arrays', 'rng', 'info'} or None."""
+        state = self._state()
+        if state is None:
+            return None
+        snap_path = os.path.join(self.path, state['snapshot'])
+        arrays = {name[:-4]: np.load(os.path.join(snap_path, name))
+                  for name in os.listdir(snap_path) if name.endswith('.npy')}
+        with open(os.path.join(snap_path, 'rng.pkl'), 'rb') as f:
+            rng = pickle.load(f)
+        return {'iteration': state['iteration'], 'arrays': arrays, 'rng': rng, 'info': state['info']}
+
+    def finish(self, result: Any, global_rng: bool = False) -> Any:
+        """
+        Store the final task result. With global_rng the np.random state is
+        stored too, so a resumed run continues the global stream correctly.
+        """
+        for out in self._arrays:
+            out.flush()
+        payload = {'result': result, 'global_rng': np.random.get_state() if global_rng else None}
+        _atomic_write(os.path.join(self.path, 'result.pkl'), pickle.dumps(payload))
+
+        state = self._state()
+        if state:
+            shutil.rmtree(os.path.join(self.path, state['snapshot']), ignore_errors=True)
+            os.remove(os.path.join(self.path, 'state.json'))
+        return result
+
+    def finished(self) -> bool:
+        """True once finish() has been called for this task."""
+        return os.path.exists(os.path.join(self.path, 'result.pkl'))
+
+    def result(self) -> Optional[Any]:
+        """Final result of a finished task (restoring np.random if it was stored), else None."""
+        path = os.path.join(self.path, 'result.pkl')
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+        if payload['global_rng'] is not None:
+            np.random.set_state(payload['global_rng'])
+        return payload['result']
+
+    def _state(self) -> Optional[Dict[str, Any]]:
+        path = os.path.join(self.path, 'state.json')
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
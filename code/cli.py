@@ -0,0 +1,280 @@
+"""
+COMMAND LINE ENTRY POINT
+
+    python -m urfe <command> [options]      (or: urfe <command>, python code/ <command>)
+
+Commands:
+    suite       complete fortress verification suite (UNIVERSAL_RECURSION_ENGINE)
+    fortress    fortress test only
+    scale       scale-invariance test (huge N in shared memory across cores)
+    goldilocks  N=3/4/5 selection audit
+    attractor   toroidal S8 attractor audit
+    mirror      sub-Planck mirror audit
+    equalize    bare 4D equalization proof
+    sweep       parameter robustness sweep over a grid or Latin hypercube
+    report      render the latest stored result records (see results_store.py)
+    plot        render convergence plot data saved by suite / fortress (see plotting.py)
+    worker      work a shared sweep queue directory (see work_queue.py)
+    bench       benchmark suite (arguments are passed to benchmark.py)
+    serve       persistent MCP server on stdio (see mcp_server.py)
+
+Only argparse is imported up front; the engine behind a command is loaded
+when that command runs, so `--help` and start-up stay fast.
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import sys
+from typing import List, Optional
+
+def _module(name: str):
+    """Import an engine module (relative to the package when loaded as urfe)."""
+    return importlib.import_module(f'.{name}', __package__) if __package__ else importlib.import_module(name)
+
+def _suite(args):
+    _module('UNIVERSAL_RECURSION_ENGINE').run_complete_fortress_suite(
+        entropy=args.entropy, store=args.store, plot_mode=args.plot_mode
+    )
+
+def _fortress(args):
+    engine = _module('UNIVERSAL_RECURSION_ENGINE')
+    if args.target_sem is not None:
+        engine.run_fortress_sequential(
+            target_sem=args.target_sem, max_seeds=args.seeds, iterations=args.iterations, particles=args.particles,
+            workers=args.workers, entropy=args.entropy, converge=args.converge, dtype=args.dtype
+        )
+        return
+    result = engine.run_fortress_test(
+        seeds=args.seeds, iterations=args.iterations, particles=args.particles, workers=args.workers,
+        entropy=args.entropy, converge=args.converge, checkpoint_dir=args.checkpoint_dir,
+        trajectory_sink='reduce', dtype=args.dtype, queue_dir=args.queue
+    )
+    if args.plot_data:
+        plotting = _module('plotting')
+        plotting.save_plot_data(plotting.convergence_plot_data(result.trajectories), args.plot_data)
+        print(f"\n✓ Plot data saved to {args.plot_data} (render with: python . plot {args.plot_data})")
+
+def _scale(args):
+    _module('UNIVERSAL_RECURSION_ENGINE').test_scale_invariance(
+        args.particles, args.iterations, converge=args.converge, dtype=args.dtype, entropy=args.entropy,
+        shared_min_particles=args.shared_from, workers=args.workers
+    )
+
+def _goldilocks(args):
+    _module('goldilocks_audit').run_goldilocks_audit(
+        seeds=args.seeds, iterations=args.iterations, workers=args.workers, entropy=args.entropy,
+        converge=args.converge, checkpoint_dir=args.checkpoint_dir, store=args.store, queue_dir=args.queue
+    )
+
+def _attractor(args):
+    _module('TOROIDAL_S8_ATTRACTOR').run_attractor_audit(
+        n_seeds=args.seeds, iterations=args.iterations, workers=args.workers, entropy=args.entropy,
+        converge=args.converge, mode=args.mode, checkpoint_dir=args.checkpoint_dir, store=args.store
+    )
+
+def _mirror(args):
+    _module('bare_urfe_sub_planck_mirror').execute_audit(store=args.store)
+
+def _equalize(args):
+    bare = _module('bare_urfe')
+    ratio = bare.prove_equalization(iterations=args.iterations, particles=args.particles, dtype=args.dtype)
+    print(f"\nEmergent S8 Floor: {ratio:.4f}")
+    orbit = bare.classify_sine_map()
+    print(f"Sine-map regime: {orbit.regime} (Lyapunov exponent {orbit.lyapunov:.3f})")
+
+def _parse_axis(spec: str, lhs: bool):
+    """NAME=LOW:HIGH:COUNT (linspace) or NAME=V1,V2,... ; NAME=LOW:HIGH (bounds) with --lhs."""
+    name, _, values = spec.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUES, got {spec!r}")
+    if lhs:
+        low, high = (float(v) for v in values.split(':'))
+        return name, (low, high)
+    if ':' in values:
+        low, high, count = values.split(':')
+        return name, [float(low) + (float(high) - float(low)) * k / max(1, int(count) - 1) for k in range(int(count))]
+    return name, [float(v) for v in values.split(',')]
+
+def _sweep(args):
+    param_sweep = _module('param_sweep')
+    axes = dict(_parse_axis(spec, args.lhs is not None) for spec in args.param)
+    if args.lhs is not None:
+        points = param_sweep.latin_hypercube(args.lhs, axes, entropy=args.entropy)
+    else:
+        points = param_sweep.parameter_grid(**axes)
+    param_sweep.run_parameter_sweep(
+        args.engine, points, seeds=args.seeds, iterations=args.iterations, workers=args.workers,
+        entropy=args.entropy, out=args.out, converge=args.converge
+    )
+
+def _worker(args):
+    work_queue = _module('work_queue')
+    if args.status:
+        for sweep in work_queue.WorkQueue(args.queue_dir).sweeps():
+            counts = ', '.join(f"{n} {state}" for state, n in sweep.status().items())
+            print(f"{sweep.id}  {sweep.meta['function']}  {sweep.seeds} seeds  {counts}")
+        return
+    computed = work_queue.run_worker(
+        args.queue_dir, sweep_id=args.sweep, lease_seconds=args.lease, poll=args.poll, wait=args.wait
+    )
+    print(f"✓ Worker {work_queue.worker_id()} computed {computed} shards")
+
+def _plot(args):
+    plotting = _module('plotting')
+    out = args.out or args.data.rsplit('.', 1)[0] + '.png'
+    plotting.render_convergence(plotting.load_plot_data(args.data), out, dpi=args.dpi)
+    print(f"✓ Convergence plot saved to {out}")
+
+def _report(args):
+    results_store = _module('results_store')
+    store = results_store.ResultsStore(args.store_dir)
+    names = args.type or store.types()
+    if not names:
+        raise SystemExit(f"no result records in {args.store_dir}")
+    latest = {}
+    for name in names:
+        latest[name] = store.latest(name)
+        if latest[name] is None:
+            raise SystemExit(f"no {name} records in {args.store_dir}")
+    if args.format == 'json':
+        # One JSON document: the record itself, or {type: record} for several
+        payloads = {name: json.loads(results_store.render_json(result)) for name, result in latest.items()}
+        text = json.dumps(payloads if len(payloads) > 1 else payloads[names[0]], indent=4)
+    else:
+        text = "\n".join(results_store.render_markdown(result) for result in latest.values())
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text)
+        print(f"✓ Report saved to {args.out}")
+    else:
+        print(text)
+
+def _sweep_options(parser, seeds, iterations):
+    parser.add_argument('--seeds', type=int, default=seeds)
+    parser.add_argument('--iterations', type=int, default=iterations)
+    parser.add_argument('--workers', type=int, default=1, help='worker processes (0 = all cores)')
+    parser.add_argument('--entropy', type=int, help='root seed (default: legacy per-seed streams)')
+    parser.add_argument('--converge', type=int, help='early-exit stability window')
+    parser.add_argument('--checkpoint-dir', help='resume directory')
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='urfe', description='Bare-URFE verification engines')
+    parser.add_argument('--metrics', metavar='PATH', help='append JSON-lines metrics snapshots to PATH')
+    parser.add_argument('--no-cache', action='store_true', help='bypass the result cache')
+    parser.add_argument('--cache-dir', metavar='DIR', help='also keep cached results on disk in DIR')
+    parser.add_argument('--store', metavar='DIR', help='append result records to the store at DIR')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    suite = commands.add_parser('suite', help='complete fortress verification suite')
+    suite.add_argument('--entropy', type=int)
+    suite.add_argument('--plot-mode', choices=('background', 'sync', 'defer'), default='background',
+                       help='render convergence.png in a background process, in place, or not at all '
+                            '(defer: only convergence.npz, for the plot command)')
+    suite.set_defaults(handler=_suite)
+
+    fortress = commands.add_parser('fortress', help='fortress test')
+    _sweep_options(fortress, seeds=100, iterations=800)
+    fortress.add_argument('--particles', type=int, default=10000)
+    fortress.add_argument('--dtype', choices=('float64', 'float32'), default='float64')
+    fortress.add_argument('--target-sem', type=float,
+                          help='sequential mode: add seeds until the mean ratio\'s standard error reaches this '
+                               '(--seeds is then the budget)')
+    fortress.add_argument('--queue', metavar='DIR', help='distribute shards through a shared work-queue directory')
+    fortress.add_argument('--plot-data', metavar='PATH', help='save reduced convergence plot data (.npz) to PATH')
+    fortress.set_defaults(handler=_fortress)
+
+    scale = commands.add_parser('scale', help='scale-invariance test')
+    scale.add_argument('--particles', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    scale.add_argument('--iterations', type=int, default=500)
+    scale.add_argument('--entropy', type=int, help='root seed (default: legacy global stream)')
+    scale.add_argument('--converge', type=int, help='early-exit stability window')
+    scale.add_argument('--dtype', choices=('float64', 'float32'), default='float64')
+    scale.add_argument('--shared-from', type=int, metavar='N',
+                       help='run counts >= N as one shared-memory state across --workers processes')
+    scale.add_argument('--workers', type=int, default=1, help='processes for shared-memory runs (0 = all cores)')
+    scale.set_defaults(handler=_scale)
+
+    goldilocks = commands.add_parser('goldilocks', help='N=3/4/5 selection audit')
+    _sweep_options(goldilocks, seeds=50, iterations=1000)
+    goldilocks.add_argument('--queue', metavar='DIR', help='distribute shards through a shared work-queue directory')
+    goldilocks.set_defaults(handler=_goldilocks)
+
+    attractor = commands.add_parser('attractor', help='toroidal S8 attractor audit')
+    _sweep_options(attractor, seeds=150, iterations=5000)
+    attractor.add_argument('--mode', choices=('reconstruct', 'eigenbasis'), default='reconstruct')
+    attractor.set_defaults(handler=_attractor)
+
+    mirror = commands.add_parser('mirror', help='sub-Planck mirror audit')
+    mirror.set_defaults(handler=_mirror)
+
+    equalize = commands.add_parser('equalize', help='bare 4D equalization proof')
+    equalize.add_argument('--iterations', type=int, default=500)
+    equalize.add_argument('--particles', type=int, default=10000)
+    equalize.add_argument('--dtype', choices=('float64', 'float32'), default='float64')
+    equalize.set_defaults(handler=_equalize)
+
+    sweep = commands.add_parser('sweep', help='parameter robustness sweep (see param_sweep.py)')
+    sweep.add_argument('engine', choices=('fortress', 'goldilocks', 'attractor'))
+    sweep.add_argument('--param', action='append', default=[], metavar='NAME=VALUES',
+                       help='swept parameter: LOW:HIGH:COUNT, V1,V2,... or, with --lhs, LOW:HIGH (repeatable)')
+    sweep.add_argument('--lhs', type=int, metavar='POINTS', help='Latin-hypercube sample instead of a full grid')
+    sweep.add_argument('--seeds', type=int, default=10, help='seeds per point')
+    sweep.add_argument('--iterations', type=int, help='iterations per run (default: the engine\'s)')
+    sweep.add_argument('--workers', type=int, default=1, help='worker processes (0 = all cores)')
+    sweep.add_argument('--entropy', type=int, help='root seed (default: fresh, recorded in the table)')
+    sweep.add_argument('--converge', type=int, help='early-exit stability window')
+    sweep.add_argument('--out', help='table path (.npz, or .parquet with pyarrow)')
+    sweep.set_defaults(handler=_sweep)
+
+    plot = commands.add_parser('plot', help='render saved convergence plot data')
+    plot.add_argument('data', help='.npz written by suite or fortress --plot-data')
+    plot.add_argument('--out', help='image path (default: the data path with .png)')
+    plot.add_argument('--dpi', type=int, default=300)
+    plot.set_defaults(handler=_plot)
+
+    report = commands.add_parser('report', help='render the latest stored result records')
+    report.add_argument('store_dir', metavar='STORE', help='results store directory')
+    report.add_argument('--type', action='append', help='record type, e.g. FortressResults (repeatable; default: all)')
+    report.add_argument('--format', choices=('md', 'json'), default='md')
+    report.add_argument('--out', help='write the report here instead of stdout')
+    report.set_defaults(handler=_report)
+
+    worker = commands.add_parser('worker', help='work a shared sweep queue directory')
+    worker.add_argument('queue_dir', metavar='QUEUE', help='queue directory shared by every node')
+    worker.add_argument('--sweep', help='work only this sweep id')
+    worker.add_argument('--lease', type=float, default=60.0, help='lease timeout in seconds (same on every node)')
+    worker.add_argument('--poll', type=float, default=1.0, help='seconds between scans for work')
+    worker.add_argument('--wait', action='store_true', help='keep waiting for new sweeps instead of exiting')
+    worker.add_argument('--status', action='store_true', help='print the shard counts of every sweep and exit')
+    worker.set_defaults(handler=_worker)
+
+    bench = commands.add_parser('bench', help='benchmark suite (see benchmark.py)', add_help=False)
+    bench.add_argument('bench_args', nargs=argparse.REMAINDER)
+
+    serve = commands.add_parser('serve', help='persistent MCP server on stdio')
+    serve.add_argument('--workers', type=int, default=0, help='warm worker processes (0 = all cores)')
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == 'bench':
+        return _module('benchmark').main(args.bench_args)
+    if args.command == 'serve':
+        return _module('mcp_server').main(['--workers', str(args.workers)])
+
+    if args.no_cache:
+        _module('result_cache').set_cache(None)
+    elif args.cache_dir:
+        result_cache = _module('result_cache')
+        result_cache.set_cache(result_cache.ResultCache(directory=args.cache_dir))
+    with contextlib.ExitStack() as stack:
+        if args.metrics:
+            metrics = _module('metrics')
+            stack.enter_context(metrics.instrument(metrics.Recorder(jsonl=args.metrics)))
+        args.handler(args)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
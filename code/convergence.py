@@ -0,0 +1,151 @@
+"""
+EARLY-EXIT CONVERGENCE DETECTION
+
+Opt-in per-seed bookkeeping that lets the engines stop iterating once a
+seed can no longer change the answer. A seed retires when either
+
+1. STABILITY WINDOW: its ratio stayed within ±tolerance of the target for
+   `window` consecutive iterations (the ±0.001 test of run_fortress_test;
+   with target=None the ratio is compared to its previous value instead), or
+2. FIXED POINT / CYCLE: its state fingerprint exactly repeats the one from
+   p iterations earlier, for some period 1 <= p <= max_period.
+
+Bookkeeping is per seed, so batched engines can drop retired seeds from
+their working set while the rest keep evolving.
+"""
+
+import numpy as np
+from typing import Dict, Optional, Union
+
+# The ±0.001 stability window of run_fortress_test
+STABILITY_TOLERANCE = 0.001
+
+RUNNING, STABLE, FIXED_POINT, CYCLE = range(4)
+REASONS = ('running', 'stable', 'fixed point', 'cycle')
+
+_STATE_FIELDS = ('stable_run', 'previous', 'iterations_run', 'reason', 'period')
+
+class ConvergenceTracker:
+    """
+    Per-seed early-exit state.
+
+    Args:
+        seeds: Number of seeds tracked
+        window: Consecutive stable iterations (K) required to retire a seed
+        tolerance: Half-width of the stability window
+        target: Value the ratio must stay near, scalar or one per seed
+                (None: its previous value)
+        max_period: Longest state cycle to detect (0 disables cycle detection)
+    """
+
+    def __init__(
+        self,
+        seeds: int,
+        window: int,
+        tolerance: float = STABILITY_TOLERANCE,
+        target: Optional[Union[float, np.ndarray]] = 0.75,
+        max_period: int = 0
+    ):
+        self.window = window
+        self.tolerance = tolerance
+        self.target = target
+        self.max_period = max_period
+
+        self.stable_run = np.zeros(seeds, dtype=int)
+        self.previous = np.full(seeds, np.nan)
+        self.iterations_run = np.zeros(seeds, dtype=int)
+        self.reason = np.full(seeds, RUNNING, dtype=np.int8)
+        self.period = np.zeros(seeds, dtype=int)
+        self._history = None
+
+    def update(
+        self,
+        iteration: int,
+        values: np.ndarray,
+        seeds: Optional[np.ndarray] = None,
+        state: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Record one completed iteration for the still-running `seeds`.
+
+        Args:
+            iteration: 0-based index of the iteration just completed
+            values: Ratio of each listed seed after this iteration
+            seeds: Indices of the seeds in `values` (default: all seeds)
+            state: (len(seeds), F) exact state fingerprint for cycle detection
+
+        Returns:
+            Boolean mask over `seeds` of the seeds that retired at this iteration
+        """
+        if seeds is None:
+            seeds = np.arange(len(self.stable_run))
+        values = np.asarray(values, dtype=float)
+
+        if self.target is None:
+            reference = self.previous[seeds]
+        elif np.ndim(self.target):
+            reference = np.asarray(self.target)[seeds]
+        else:
+            reference = self.target
+        within = np.abs(values - reference) < self.tolerance
+        self.stable_run[seeds] = np.where(within, self.stable_run[seeds] + 1, 0)
+        self.previous[seeds] = values
+
+        reason = np.where(self.stable_run[seeds] >= self.window, STABLE, RUNNING)
+        period = np.zeros(len(seeds), dtype=int)
+
+        if self.max_period and state is not None:
+            state = np.asarray(state, dtype=float).reshape(len(seeds), -1)
+            if self._history is None:
+                self._history = np.full((len(self.stable_run), self.max_period, state.shape[1]), np.nan)
+            # Smallest period first so a fixed point is never reported as a 2-cycle
+            for p in range(min(self.max_period, iteration), 0, -1):
+                repeats = np.all(self._history[seeds, (iteration - p) % self.max_period] == state, axis=1)
+                period = np.where(repeats, p, period)
+            reason = np.where(period == 1, FIXED_POINT, np.where(period > 1, CYCLE, reason))
+            self._history[seeds, iteration % self.max_period] = state
+
+        done = reason != RUNNING
+        retired = seeds[done]
+        self.reason[retired] = reason[done]
+        self.period[retired] = period[done]
+        self.iterations_run[retired] = iteration + 1
+        return done
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """Per-seed bookkeeping arrays (for checkpointing)."""
+        state = {name: getattr(self, name) for name in _STATE_FIELDS}
+        if self._history is not None:
+            state['history'] = self._history
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+        """Restore bookkeeping saved by state_dict()."""
+        for name in _STATE_FIELDS:
+            getattr(self, name)[...] = state[name]
+        self._history = np.array(state['history']) if 'history' in state else None
+
+    def finish(self, iterations: int) -> np.ndarray:
+        """Mark every still-running seed as having used the full budget; returns iterations_run."""
+        self.iterations_run[self.reason == RUNNING] = iterations
+        return self.iterations_run
+
+def early_exit_summary(iterations_run: np.ndarray, iterations: int) -> Dict[str, float]:
+    """Iterations used versus the fixed-count budget."""
+    iterations_run = np.asarray(iterations_run)
+    budget = iterations_run.size * iterations
+    used = int(np.sum(iterations_run))
+    return {
+        'seeds': int(iterations_run.size),
+        'retired_early': int(np.sum(iterations_run < iterations)),
+        'iterations_budget': int(budget),
+        'iterations_run': used,
+        'iterations_saved': int(budget - used),
+        'saved_fraction': (budget - used) / budget if budget else 0.0
+    }
+
+def describe_early_exit(summary: Dict[str, float]) -> str:
+    """One-line human readable early-exit report."""
+    return (f"{summary['retired_early']}/{summary['seeds']} seeds retired early, "
+            f"{summary['iterations_saved']} of {summary['iterations_budget']} iterations saved "
+            f"({summary['saved_fraction']*100:.1f}%)")
@@ -1,61 +1,319 @@
 import numpy as np
-import json
+import time
+from typing import Optional
 
-def run_goldilocks_audit(target_n=[3, 4, 5], seeds=50, iterations=1000):
+if __package__:
+    from .checkpoint import Checkpoint, overrides
+    from .convergence import ConvergenceTracker, describe_early_exit, early_exit_summary
+    from .metrics import get_metrics
+    from .parallel_sweep import concat_chunks, run_seed_sweep, seed_rng
+    from .result_cache import cached
+    from .results_store import open_store, record, render_json
+else:
+    from checkpoint import Checkpoint, overrides
+    from convergence import ConvergenceTracker, describe_early_exit, early_exit_summary
+    from metrics import get_metrics
+    from parallel_sweep import concat_chunks, run_seed_sweep, seed_rng
+    from result_cache import cached
+    from results_store import open_store, record, render_json
+
+# Manifold width (samples per dimension) and inter-dimensional coupling
+WIDTH = 2000
+EPSILON = 0.5
+# Memory budget for one block of pre-generated noise
+NOISE_BLOCK_BYTES = 64 * 2**20
+
+@record
+class GoldilocksResult:
+    """Outcome of run_goldilocks_audit (one entry per N in target_n)"""
+    target_n: np.ndarray
+    mean_delta: np.ndarray
+    mean_error: np.ndarray
+    best_n: int
+    seeds: int
+    iterations: int
+    entropy: Optional[int] = None
+    
+    def json_dict(self):
+        """The goldilocks_results.json layout: {N: {mean_delta, mean_error, target}}."""
+        return {
+            str(n): {'mean_delta': float(d), 'mean_error': float(e), 'target': (n-1)/n}
+            for n, d, e in zip(self.target_n.tolist(), self.mean_delta, self.mean_error)
+        }
+
+def _layout(sizes):
+    """Row offsets, row-to-manifold map and in-manifold row index for stacked manifolds."""
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(int)
+    row_manifold = np.repeat(np.arange(len(sizes)), sizes)
+    local_row = np.arange(np.sum(sizes)) - starts[row_manifold]
+    return sizes, starts, row_manifold, local_row
+
+def _coupled_sums(data, starts, sizes):
+    """
+    Per-manifold column sums, accumulated row by row in the same order as
+    np.sum(data, axis=0) so the stacked kernel stays bit-identical.
+    """
+    coupled_sum = data[starts]
+    for d in range(1, sizes.max()):
+        wide = np.flatnonzero(sizes > d)
+        coupled_sum[wide] += data[starts[wide] + d]
+    return coupled_sum
+
+def _manifold_scores(data, starts, sizes):
+    """Delta from (N-1)/N and symmetry error of every stacked manifold."""
+    row_vars = np.var(data, axis=1)
+    deltas, errors = [], []
+    
+    for start, n in zip(starts, sizes):
+        variances = row_vars[start:start + n]
+        total_var = np.sum(variances)
+        
+        # Ratio calculation with total_var underflow guard
+        ratio = np.sum(variances[:-1]) / total_var if total_var > 1e-12 else (n-1)/n
+        
+        deltas.append(float(abs(ratio - (n-1)/n)))
+        errors.append(float(np.std(variances)))
+    
+    return np.array(deltas), np.array(errors)
+
+def _manifold_ratios(data, starts, sizes):
+    """Current (N-1)/N projection ratio of every stacked manifold."""
+    row_vars = np.var(data, axis=1)
+    total = np.add.reduceat(row_vars, starts)
+    return (total - row_vars[starts + sizes - 1]) / total
+
+def _row_column(stream_values, active, row_manifold):
+    """Per-stream parameter as a (rows, 1) column over the stacked rows of the active manifolds."""
+    return stream_values[active][row_manifold][:, None]
+
+def _goldilocks_chunk(start, stop, entropy, target_n, iterations, converge=None,
+                      update='jacobi', noise_block_bytes=NOISE_BLOCK_BYTES,
+                      checkpoint_dir=None, checkpoint_every=50, seed_ids=None, epsilon=None, gain=None):
+    """
+    Coupled-manifold recursion for seeds [start, stop) of every N in target_n.
+    
+    All (N, seed) manifolds are stacked row-wise into one (sum of N, WIDTH)
+    array and stepped together. Each manifold keeps its own random stream
+    (legacy np.random.seed(seed) when entropy is None) and its noise is
+    pre-generated in blocks of iterations, drawn in the same order as the
+    original per-row calls, so results match the per-seed loop exactly.
+    
+    update: 'jacobi' updates every row at once; 'sequential' keeps the
+            original row-by-row sweep. Both use the coupled sum frozen at the
+            start of the iteration, so they produce identical numbers.
+    converge: with K, a manifold retires once its ratio held within ±0.001
+              of (N-1)/N for K consecutive iterations.
+    checkpoint_dir: snapshot state, streams and partial scores every
+                    checkpoint_every iterations and resume from them (checkpoint.py).
+    seed_ids, epsilon, gain: let one batch hold many parameter points (see
+                    param_sweep.py). Seed s of the chunk draws from seed_ids[s]
+                    (default start + s) and uses coupling epsilon[s] and map
+                    gain[s] (scalars apply to every seed; default EPSILON, pi).
+    
+    Returns:
+        deltas, errors, iterations_run, each shaped (seeds, len(target_n))
+    """
+    if update not in ('jacobi', 'sequential'):
+        raise ValueError(f"unknown update mode {update!r} (use 'jacobi' or 'sequential')")
+    
+    seeds = stop - start
+    ckpt = None
+    if checkpoint_dir is not None:
+        ckpt = Checkpoint(checkpoint_dir, 'goldilocks', start, stop, every=checkpoint_every, params=dict(
+            entropy=entropy, target_n=target_n, iterations=iterations, converge=converge,
+            update=update, noise_block_bytes=noise_block_bytes,
+            **overrides(seed_ids=seed_ids, epsilon=epsilon, gain=gain)
+        ))
+        if ckpt.finished():
+            return ckpt.result()
+    
+    if seed_ids is None:
+        seed_ids = range(start, stop)
+    streams = [(n, int(seed)) for n in target_n for seed in seed_ids]
+    rngs = [seed_rng(entropy, seed, stream=n) for n, seed in streams]
+    all_sizes = np.array([n for n, _ in streams])
+    stream_epsilon = np.tile(np.broadcast_to(EPSILON if epsilon is None else epsilon, (seeds,)), len(target_n))
+    stream_gain = np.tile(np.broadcast_to(np.pi if gain is None else gain, (seeds,)), len(target_n))
+    noise_floor = 1e-5 * all_sizes # Entropy scales with N
+    targets = (all_sizes - 1) / all_sizes
+    
+    metrics = get_metrics()
+    timed = metrics.enabled
+    with metrics.timer('rng'):
+        data = np.concatenate([rng.normal(0, 1, (n, WIDTH)) for rng, n in zip(rngs, all_sizes)])
+    data[np.cumsum(all_sizes) - 1] *= 1000.0 # Initial Asymmetry (Imbalance)
+    
+    deltas = np.zeros(len(streams))
+    errors = np.zeros(len(streams))
+    tracker = ConvergenceTracker(len(streams), converge, target=targets) if converge else None
+    active = np.arange(len(streams))
+    
+    first = 0
+    saved = ckpt.load() if ckpt is not None else None
+    if saved is not None:
+        first, rngs = saved['iteration'], saved['rng']
+        data, active = saved['arrays']['data'], saved['arrays']['active']
+        deltas, errors = saved['arrays']['deltas'], saved['arrays']['errors']
+        if tracker is not None:
+            tracker.load_state_dict({name[8:]: v for name, v in saved['arrays'].items() if name.startswith('tracker_')})
+    
+    sizes, starts, row_manifold, local_row = _layout(all_sizes[active])
+    row_epsilon = _row_column(stream_epsilon, active, row_manifold)
+    row_gain = _row_column(stream_gain, active, row_manifold)
+    noise, k = None, 0
+    
+    for i in range(first, iterations):
+        if noise is None or k == len(noise):
+            if ckpt is not None and ckpt.due(i, iterations):
+                # Noise blocks end on checkpoint boundaries, so the streams are in sync with `data`
+                arrays = {'data': data, 'active': active, 'deltas': deltas, 'errors': errors}
+                if tracker is not None:
+                    arrays.update({f'tracker_{name}': v for name, v in tracker.state_dict().items()})
+                ckpt.save(i, arrays, rng=rngs)
+            
+            # Pre-generate a block of noise, stream by stream, in draw order
+            block = max(1, min(iterations - i, noise_block_bytes // data.nbytes))
+            if ckpt is not None:
+                block = min(block, ckpt.every - i % ckpt.every)
+            noise, k = np.empty((block,) + data.shape), 0
+            with metrics.timer('rng'):
+                for j, m in enumerate(active):
+                    noise[:, starts[j]:starts[j] + sizes[j]] = rngs[m].normal(0, noise_floor[m], (block, sizes[j], WIDTH))
+        
+        if timed:
+            started = time.perf_counter()
+        coupled_sum = _coupled_sums(data, starts, sizes)
+        
+        if update == 'jacobi':
+            interaction = coupled_sum[row_manifold]
+            interaction -= data
+            interaction *= row_epsilon
+            # Recursive Sine-Map + Manifold Interaction + Entropy
+            data *= row_gain
+            data += interaction
+            np.sin(data, out=data)
+            data += noise[k]
+        else:
+            for d in range(sizes.max()):
+                rows = np.flatnonzero(local_row == d)
+                interaction = row_epsilon[rows] * (coupled_sum[row_manifold[rows]] - data[rows])
+                # Recursive Sine-Map + Manifold Interaction + Entropy
+                data[rows] = np.sin(row_gain[rows] * data[rows] + interaction) + noise[k, rows]
+        k += 1
+        if timed:
+            metrics.add_time('recursion', time.perf_counter() - started)
+            metrics.count('iterations', len(active))
+            metrics.progress('goldilocks', i + 1, iterations)
+        
+        if tracker is None:
+            continue
+        done = tracker.update(i, _manifold_ratios(data, starts, sizes), active)
+        if done.any():
+            if timed:
+                metrics.count('seeds_converged', int(done.sum()))
+            # Score retired manifolds now, then compact the survivors (and their drawn noise)
+            retired_rows = done[row_manifold]
+            deltas[active[done]], errors[active[done]] = _manifold_scores(
+                data[retired_rows], _layout(sizes[done])[1], sizes[done]
+            )
+            data = data[~retired_rows]
+            noise = noise[:, ~retired_rows]
+            active = active[~done]
+            if not len(active):
+                break
+            sizes, starts, row_manifold, local_row = _layout(all_sizes[active])
+            row_epsilon = _row_column(stream_epsilon, active, row_manifold)
+            row_gain = _row_column(stream_gain, active, row_manifold)
+    
+    if len(active):
+        deltas[active], errors[active] = _manifold_scores(data, starts, sizes)
+    iterations_run = tracker.finish(iterations) if tracker else np.full(len(streams), iterations)
+    
+    shape = (len(target_n), seeds)
+    result = deltas.reshape(shape).T, errors.reshape(shape).T, iterations_run.reshape(shape).T
+    return ckpt.finish(result) if ckpt is not None else result
+
+@cached(seed=None, ignore=('workers', 'checkpoint_dir', 'checkpoint_every', 'queue_dir'))
+def _goldilocks_sweep(target_n, seeds, iterations, workers, entropy, converge, update, checkpoint_dir, checkpoint_every,
+                      queue_dir=None):
+    """(seeds, len(target_n)) deltas, errors and iterations run of every (seed, N) pair (memoized)."""
+    options = dict(
+        entropy=entropy, target_n=list(target_n), iterations=iterations, converge=converge, update=update,
+        checkpoint_dir=checkpoint_dir, checkpoint_every=checkpoint_every
+    )
+    if queue_dir is not None:
+        if __package__:
+            from .work_queue import iter_queue_sweep
+        else:
+            from work_queue import iter_queue_sweep
+        return concat_chunks([result for _, _, result in iter_queue_sweep(
+            queue_dir, _goldilocks_chunk, seeds, workers=workers, **options
+        )])
+    return concat_chunks(run_seed_sweep(_goldilocks_chunk, seeds, workers=workers, **options))
+
+def run_goldilocks_audit(target_n=[3, 4, 5], seeds=50, iterations=1000, workers=1, entropy=None, converge=None,
+                         update='jacobi', checkpoint_dir=None, checkpoint_every=50, store=None,
+                         report='goldilocks_results.json', queue_dir=None):
     """
     Final Verification: Proving N=4 is the most stable recursive manifold.
-    Outputs: JSON results and final stability scorecard.
+    Outputs: GoldilocksResult record, JSON report and final stability scorecard.
+    
+    workers: processes for the seed sweep (0 = all cores). Results do not
+             depend on it: every (N, seed) pair has its own random stream,
+             np.random.seed(seed) by default or a SeedSequence child of `entropy`.
+    converge: opt-in early exit after K consecutive iterations within ±0.001
+              of the (N-1)/N target (see convergence.py).
+    update: 'jacobi' (vectorized) or 'sequential' (original row-by-row order).
+    checkpoint_dir: resume directory; rerun with the same arguments to continue
+                    after preemption (checkpoint_every iterations between snapshots).
+    queue_dir: shared work-queue directory; shards of the seeds are computed by
+               `python . worker queue_dir` processes on any node (work_queue.py).
+    Every stream is reproducible, so repeated audits are served from the
+    result cache (see result_cache.py).
+    store: ResultsStore (or its directory) the record is appended to.
+    report: JSON report rendered from the record (None skips the file).
     """
     print(f"--- STARTING FINAL SELECTION AUDIT ({seeds} SEEDS) ---")
     summary = {}
 
-    for n in target_n:
-        deltas = []
-        errors = []
+    # Every N and seed is evolved together by the stacked-manifold kernel
+    all_deltas, all_errors, all_runs = _goldilocks_sweep(
+        target_n, seeds, iterations, workers, entropy, converge, update, checkpoint_dir, checkpoint_every, queue_dir
+    )
+
+    for j, n in enumerate(target_n):
+        deltas, errors, iterations_run = all_deltas[:, j], all_errors[:, j], all_runs[:, j]
         
-        for seed in range(seeds):
-            np.random.seed(seed)
-            data = np.random.normal(0, 1, (n, 2000))
-            data[-1] *= 1000.0 # Initial Asymmetry (Imbalance)
-            
-            epsilon = 0.5
-            noise_floor = 1e-5 * n # Entropy scales with N
-            
-            for i in range(iterations):
-                coupled_sum = np.sum(data, axis=0)
-                for d in range(n):
-                    interaction = epsilon * (coupled_sum - data[d])
-                    # Recursive Sine-Map + Manifold Interaction + Entropy
-                    data[d] = np.sin(np.pi * data[d] + interaction) + np.random.normal(0, noise_floor, 2000)
-            
-            variances = np.var(data, axis=1)
-            total_var = np.sum(variances)
-            
-            # Ratio calculation with total_var underflow guard
-            ratio = np.sum(variances[:-1]) / total_var if total_var > 1e-12 else (n-1)/n
-            
-            deltas.append(float(abs(ratio - (n-1)/n)))
-            errors.append(float(np.std(variances)))
-            
         summary[n] = {
             'mean_delta': np.mean(deltas), 
             'mean_error': np.mean(errors),
             'target': (n-1)/n
         }
         print(f"N={n} | Avg Delta: {summary[n]['mean_delta']:.2e} | Symmetry Error: {summary[n]['mean_error']:.2e}")
+        if converge:
+            print(f"      Early exit: {describe_early_exit(early_exit_summary(iterations_run, iterations))}")
 
     # Identify the Winner
     best_n = min(summary, key=lambda x: summary[x]['mean_delta'])
+    result = GoldilocksResult(
+        target_n=np.array(target_n), mean_delta=np.array([summary[n]['mean_delta'] for n in target_n]),
+        mean_error=np.array([summary[n]['mean_error'] for n in target_n]), best_n=int(best_n),
+        seeds=seeds, iterations=iterations, entropy=entropy
+    )
+    if store is not None:
+        open_store(store).append(result)
     
     # Export for GitHub
-    with open('goldilocks_results.json', 'w') as f:
-        json.dump(summary, f, indent=4)
+    if report is not None:
+        with open(report, 'w') as f:
+            f.write(render_json(result))
 
     print("\n" + "="*50)
     print(f"AUDIT COMPLETE. THE PHYSICALLY SELECTED MANIFOLD IS N={best_n}")
     print(f"Mean Delta for N={best_n}: {summary[best_n]['mean_delta']:.2e}")
     print("="*50)
     print("The 0.75 Floor is verified as the most stable state in a noisy 4D universe.")
+    return result
 
 if __name__ == "__main__":
     run_goldilocks_audit()
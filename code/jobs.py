@@ -0,0 +1,253 @@
+"""
+ASYNC JOB API
+
+Non-blocking wrappers around the seed sweeps for interactive use:
+
+    job = submit_fortress(seeds=1000, iterations=800, entropy=7, workers=4)
+    async for update in job:
+        print(f"{update.done}/{update.total}: {update.mean:.6f} ± {update.half_width:.1e}")
+        if update.half_width < 1e-4:
+            job.cancel()            # confident enough: stop mid-sweep
+    result = await job.result()     # statistics over the seeds that finished
+
+Each submit_* call must run inside an event loop. The sweep itself is
+driven from an executor thread (the loop's default one unless `executor`
+is given) and can still fan out to `workers` processes. Seeds are split
+into about STREAM_CHUNKS chunks; every finished chunk is pushed to the
+handle as a JobUpdate with its per-seed values and the running mean / std
+/ confidence half-width of everything finished so far. Chunks arrive in
+seed order, so the finished seeds are always a prefix 0 .. done - 1.
+
+cancel() stops the sweep at the next chunk boundary (chunks queued on
+worker processes are dropped, running ones finish). result() then
+returns the statistics over the finished prefix with cancelled=True.
+
+Per-seed values equal those of the blocking engines for the same entropy,
+because every seed has its own random stream.
+"""
+
+import asyncio
+import threading
+import numpy as np
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence
+
+if __package__:
+    from .bare_urfe_sub_planck_mirror import AUDIT_SCALES, _mirror_block
+    from .goldilocks_audit import _goldilocks_chunk
+    from .parallel_sweep import iter_seed_sweep, resolve_entropy
+    from .UNIVERSAL_RECURSION_ENGINE import _fortress_chunk, _seed_chunk_size
+else:
+    from bare_urfe_sub_planck_mirror import AUDIT_SCALES, _mirror_block
+    from goldilocks_audit import _goldilocks_chunk
+    from parallel_sweep import iter_seed_sweep, resolve_entropy
+    from UNIVERSAL_RECURSION_ENGINE import _fortress_chunk, _seed_chunk_size
+
+# Updates streamed per job (chunks of ceil(total / STREAM_CHUNKS) seeds)
+STREAM_CHUNKS = 50
+
+@dataclass
+class JobUpdate:
+    """Progress of a job after one finished chunk"""
+    start: int
+    stop: int
+    values: np.ndarray      # per-seed results of seeds [start, stop)
+    done: int               # seeds finished so far
+    total: int
+    mean: np.ndarray        # running mean over the finished seeds
+    std: np.ndarray         # running population std
+    half_width: np.ndarray  # z * standard error of the mean
+
+@dataclass
+class JobResult:
+    """Final (or, after cancel(), partial) outcome of a job"""
+    values: np.ndarray      # per-seed results of the finished seeds, in seed order
+    done: int
+    total: int
+    mean: np.ndarray
+    std: np.ndarray
+    half_width: np.ndarray
+    cancelled: bool
+    entropy: Optional[int]  # root seed that reproduces the run
+
+class _Moments:
+    """Running mean / M2 over per-seed values (Chan et al. merge per chunk)."""
+
+    def __init__(self):
+        self.count, self.mean, self.m2 = 0, 0.0, 0.0
+
+    def add(self, values: np.ndarray) -> None:
+        n_b = len(values)
+        mean_b = values.mean(axis=0)
+        m2_b = ((values - mean_b) ** 2).sum(axis=0)
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * (n_b / n)
+        self.m2 = self.m2 + m2_b + delta * delta * (self.count * n_b / n)
+        self.count = n
+
+    def stats(self, z: float):
+        """mean, population std and z * SEM (sample std; infinite below two seeds)."""
+        if self.count == 0:
+            return np.nan, np.nan, np.inf
+        std = np.sqrt(self.m2 / self.count)
+        if self.count < 2:
+            return self.mean, std, np.full_like(std, np.inf)
+        return self.mean, std, z * np.sqrt(self.m2 / (self.count - 1) / self.count)
+
+class Job:
+    """
+    Handle of a running sweep: async-iterate it for JobUpdates, cancel() it,
+    await result() for the JobResult.
+    """
+
+    def __init__(
+        self,
+        sweep: Iterator,
+        total: int,
+        z: float = 1.96,
+        entropy: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ):
+        self.total = total
+        self.z = z
+        self.entropy = entropy
+        self._loop = asyncio.get_running_loop()
+        self._updates = asyncio.Queue()
+        self._cancel = threading.Event()
+        self._future = self._loop.run_in_executor(executor, self._drive, sweep)
+
+    def _drive(self, sweep: Iterator) -> JobResult:
+        """Executor thread: consume the sweep and publish one update per chunk."""
+        moments = _Moments()
+        finished: List[np.ndarray] = []
+        try:
+            for start, stop, values in sweep:
+                values = np.asarray(values, dtype=np.float64)
+                finished.append(values)
+                moments.add(values)
+                mean, std, half_width = moments.stats(self.z)
+                update = JobUpdate(start, stop, values, stop, self.total, mean, std, half_width)
+                self._loop.call_soon_threadsafe(self._updates.put_nowait, update)
+                if self._cancel.is_set():
+                    break
+        finally:
+            sweep.close()
+            self._loop.call_soon_threadsafe(self._updates.put_nowait, None)
+
+        mean, std, half_width = moments.stats(self.z)
+        values = np.concatenate(finished) if finished else np.empty(0)
+        return JobResult(values, moments.count, self.total, mean, std, half_width,
+                         cancelled=moments.count < self.total, entropy=self.entropy)
+
+    def cancel(self) -> None:
+        """Stop after the chunk in progress."""
+        self._cancel.set()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def __aiter__(self):
+        return self._stream()
+
+    async def _stream(self):
+        while True:
+            update = await self._updates.get()
+            if update is None:
+                return
+            yield update
+
+    async def result(self) -> JobResult:
+        """Final statistics (re-raises an engine error)."""
+        return await self._future
+
+def _stream_chunk(total: int) -> int:
+    return max(1, -(-total // STREAM_CHUNKS))
+
+def _values(sweep: Iterator, pick) -> Iterator:
+    """Map a sweep's (start, stop, chunk result) to (start, stop, per-seed values)."""
+    try:
+        for start, stop, result in sweep:
+            yield start, stop, pick(result)
+    finally:
+        sweep.close()
+
+def submit_fortress(
+    seeds: int = 100,
+    iterations: int = 800,
+    particles: int = 10000,
+    max_imbalance: float = 1000.0,
+    workers: int = 1,
+    entropy: Optional[int] = None,
+    converge: Optional[int] = None,
+    max_period: int = 8,
+    dtype=np.float64,
+    z: float = 1.96,
+    executor: Optional[Executor] = None
+) -> Job:
+    """
+    Async run_fortress_test: streams each seed's final 3D/4D ratio.
+
+    entropy=None draws fresh entropy (recorded in JobResult.entropy);
+    z sets the confidence level of the half-width (1.96 ~ 95%).
+    """
+    entropy = resolve_entropy(entropy)
+    dtype = np.dtype(dtype).name
+    chunk = min(_stream_chunk(seeds), _seed_chunk_size(seeds, particles, None, iterations, dtype))
+    sweep = iter_seed_sweep(
+        _fortress_chunk, seeds, workers=workers, chunk_size=chunk,
+        entropy=entropy, iterations=iterations, particles=particles, max_imbalance=max_imbalance,
+        max_batch_bytes=None, converge=converge, max_period=max_period, dtype=dtype
+    )
+    return Job(_values(sweep, lambda result: result[0]), seeds, z, entropy, executor)
+
+def submit_goldilocks(
+    target_n: Sequence[int] = (3, 4, 5),
+    seeds: int = 50,
+    iterations: int = 1000,
+    workers: int = 1,
+    entropy: Optional[int] = None,
+    converge: Optional[int] = None,
+    update: str = 'jacobi',
+    z: float = 1.96,
+    executor: Optional[Executor] = None
+) -> Job:
+    """
+    Async run_goldilocks_audit: streams each seed's delta for every N.
+
+    Values have shape (seeds, len(target_n)) and the running statistics
+    one entry per N, so the selected manifold can be read off mid-sweep.
+    entropy=None keeps the audit's legacy np.random.seed(seed) streams.
+    """
+    sweep = iter_seed_sweep(
+        _goldilocks_chunk, seeds, workers=workers, chunk_size=_stream_chunk(seeds),
+        entropy=entropy, target_n=list(target_n), iterations=iterations, converge=converge, update=update
+    )
+    return Job(_values(sweep, lambda result: result[0]), seeds, z, entropy, executor)
+
+def submit_mirror_audit(
+    scale_L: Sequence[float] = AUDIT_SCALES,
+    trace_floor: float = 0.75,
+    matter_bias: float = 0.03,
+    iterations: int = 2000,
+    tail: int = 500,
+    workers: int = 1,
+    z: float = 1.96,
+    executor: Optional[Executor] = None
+) -> Job:
+    """
+    Async execute_audit: streams (mean, max, std) of the mirror trace per scale.
+
+    Defaults to the audit's scales; any array of scales (e.g. a 10^6 point
+    logspace) streams in chunks of the same kernel as mirror_scale_grid.
+    """
+    scale_L, trace_floor, matter_bias = [
+        np.ascontiguousarray(p).ravel()
+        for p in np.broadcast_arrays(*[np.asarray(v, dtype=np.float64) for v in (scale_L, trace_floor, matter_bias)])
+    ]
+    sweep = iter_seed_sweep(
+        _mirror_block, scale_L.size, workers=workers, chunk_size=_stream_chunk(scale_L.size),
+        scale_L=scale_L, trace_floor=trace_floor, matter_bias=matter_bias, iterations=iterations, tail=tail
+    )
+    return Job(sweep, scale_L.size, z, None, executor)
@@ -0,0 +1,385 @@
+"""
+PERSISTENT MCP SERVER
+
+Long-lived Model Context Protocol server exposing each engine as its own
+parameterized tool, instead of one full fortress suite per process launch:
+
+    python mcp_server.py [--workers N]          (mcp_config.json launches this)
+
+Protocol: newline-delimited JSON-RPC 2.0 on stdin/stdout (MCP stdio
+transport) with initialize, ping, tools/list and tools/call. stdout
+carries protocol messages only; engine reports are captured per call and
+returned alongside the structured result.
+
+Execution:
+    * Tool calls run on a bounded pool of worker processes (default: one per
+      core) started once and kept warm: the engines are imported up front
+      and every worker keeps its in-memory result cache between calls.
+    * Identical requests (same tool, same arguments after defaults are
+      applied) that arrive while one is running share that run.
+    * Reproducible calls (entropy given) are memoized by result_cache, so
+      repeats are answered without recomputation.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+PROTOCOL_VERSIONS = ('2025-06-18', '2025-03-26', '2024-11-05')
+SERVER_INFO = {'name': 'shultz-bare-urfe', 'version': '5.1'}
+
+# Largest array returned element by element (bigger arrays are summarized)
+MAX_ARRAY_ITEMS = 10000
+
+def _module(name: str):
+    """Import an engine module (relative to the package when loaded as urfe)."""
+    return importlib.import_module(f'.{name}', __package__) if __package__ else importlib.import_module(name)
+
+# =============================================================================
+# TOOLS (run inside the worker processes)
+# =============================================================================
+
+def fortress(seeds=100, iterations=800, particles=10000, max_imbalance=1000.0, entropy=None, converge=None,
+             dtype='float64', workers=1):
+    run_fortress_test = _module('UNIVERSAL_RECURSION_ENGINE').run_fortress_test
+    import numpy as np
+    mean, std, summary = run_fortress_test(
+        seeds=seeds, iterations=iterations, particles=particles, max_imbalance=max_imbalance,
+        workers=workers, entropy=entropy, converge=converge, trajectory_sink='reduce', dtype=dtype
+    )
+    return {
+        'mean_ratio': mean, 'std_ratio': std, 'seeds': seeds,
+        'converged': int(np.sum(np.abs(summary.final - 0.75) < 0.01))
+    }
+
+def perturbation(base_iterations=500, perturbation_strength=10.0, particles=10000, entropy=None, converge=None):
+    test_perturbation_resilience = _module('UNIVERSAL_RECURSION_ENGINE').test_perturbation_resilience
+    return {'recovery': test_perturbation_resilience(
+        base_iterations=base_iterations, perturbation_strength=perturbation_strength,
+        particles=particles, converge=converge, entropy=entropy
+    )}
+
+def scale_invariance(particle_counts=(100, 1000, 10000, 100000), iterations=500, entropy=None, converge=None,
+                     shared_min_particles=None, workers=1):
+    test_scale_invariance = _module('UNIVERSAL_RECURSION_ENGINE').test_scale_invariance
+    ratios = test_scale_invariance(list(particle_counts), iterations, converge=converge, entropy=entropy,
+                                   shared_min_particles=shared_min_particles, workers=workers)
+    return {'particle_counts': list(particle_counts), 'ratios': ratios, 'std': float(ratios.std())}
+
+def null_hypothesis(seeds=1000, iterations=500, particles=10000, entropy=None, workers=1, null_method='chisquare'):
+    test_null_hypothesis = _module('UNIVERSAL_RECURSION_ENGINE').test_null_hypothesis
+    return {'sigma': test_null_hypothesis(
+        seeds, iterations, particles, workers=workers, entropy=entropy, null_method=null_method
+    )}
+
+def goldilocks(target_n=(3, 4, 5), seeds=50, iterations=1000, entropy=None, converge=None, workers=1):
+    _goldilocks_sweep = _module('goldilocks_audit')._goldilocks_sweep
+    deltas, errors, runs = _goldilocks_sweep(
+        list(target_n), seeds, iterations, workers, entropy, converge, 'jacobi', None, 50
+    )
+    manifolds = {
+        str(n): {
+            'mean_delta': deltas[:, j].mean(), 'mean_error': errors[:, j].mean(),
+            'target': (n - 1) / n, 'mean_iterations': runs[:, j].mean()
+        }
+        for j, n in enumerate(target_n)
+    }
+    return {'manifolds': manifolds, 'best_n': int(min(manifolds, key=lambda n: manifolds[n]['mean_delta']))}
+
+def attractor(seeds=150, iterations=5000, entropy=None, converge=None, mode='reconstruct', workers=1):
+    _attractor_sweep = _module('TOROIDAL_S8_ATTRACTOR')._attractor_sweep
+    ratios, p1_weights, runs = _attractor_sweep(seeds, iterations, workers, entropy, converge, 8, mode)
+    return {
+        's8_ratio': ratios.mean(), 's8_ratio_std': ratios.std(),
+        'p1_weight': p1_weights.mean(), 'p1_weight_std': p1_weights.std(),
+        'mean_iterations': runs.mean()
+    }
+
+def mirror(scale_L=1.0, iterations=2000, trace_floor=0.75, matter_bias=0.03):
+    mirror_attractor = _module('bare_urfe_sub_planck_mirror').mirror_attractor
+    orbit = mirror_attractor(scale_L, iterations, trace_floor, matter_bias)
+    return {
+        'regime': orbit.regime, 'period': orbit.period, 'mean': orbit.mean, 'max': orbit.max, 'std': orbit.std,
+        'lyapunov': orbit.lyapunov, 'steps': orbit.steps
+    }
+
+def mirror_grid(scale_min=1e-5, scale_max=1e5, points=101, trace_floor=0.75, matter_bias=0.03, iterations=2000,
+                tail=500):
+    mirror_scale_grid = _module('bare_urfe_sub_planck_mirror').mirror_scale_grid
+    import numpy as np
+    grid = mirror_scale_grid(np.logspace(np.log10(scale_min), np.log10(scale_max), points),
+                             trace_floor, matter_bias, iterations, tail)
+    return {k: grid[k] for k in ('scale_L', 'mean', 'max', 'std')}
+
+def equalization(iterations=500, particles=10000, dtype='float64'):
+    prove_equalization = _module('bare_urfe').prove_equalization
+    return {'ratio': prove_equalization(iterations, particles, dtype)}
+
+def suite(entropy=None):
+    run_complete_fortress_suite = _module('UNIVERSAL_RECURSION_ENGINE').run_complete_fortress_suite
+    results = run_complete_fortress_suite(entropy=entropy)
+    return {
+        'mean': results.mean_ratio, 'std': results.std_dev, 'recovery': results.perturbation_recovery,
+        'null_sigma': results.null_hypothesis_sigma
+    }
+
+def _param(kind, description, default=None, **extra):
+    """JSON-schema property; a None default makes the parameter nullable."""
+    schema = {'type': [kind, 'null'] if default is None else kind, 'description': description, **extra}
+    if default is not None:
+        schema['default'] = list(default) if isinstance(default, tuple) else default
+    return schema
+
+_ENTROPY = _param('integer', 'Root seed (reproducible and cached); omit for legacy per-seed streams')
+_CONVERGE = _param('integer', 'Early-exit stability window K (omit to run every iteration)')
+_WORKERS = _param('integer', 'Processes for this call\'s seed sweep', 1, minimum=1)
+_DTYPE = _param('string', 'Particle storage precision', 'float64', enum=['float64', 'float32'])
+
+TOOLS = {
+    'fortress': (fortress, 'Fortress test: 3D/4D variance ratio of wildly imbalanced seeds (expect 0.75).', {
+        'seeds': _param('integer', 'Independent seeds', 100, minimum=1),
+        'iterations': _param('integer', 'Sine-map iterations', 800, minimum=0),
+        'particles': _param('integer', 'Particles per seed', 10000, minimum=1),
+        'max_imbalance': _param('number', 'Largest initial variance spike', 1000.0),
+        'entropy': _ENTROPY, 'converge': _CONVERGE, 'dtype': _DTYPE, 'workers': _WORKERS
+    }),
+    'perturbation': (perturbation, 'Recovery of the 0.75 ratio after a strong perturbation.', {
+        'base_iterations': _param('integer', 'Iterations before and after the shock', 500, minimum=1),
+        'perturbation_strength': _param('number', 'Shock amplitude', 10.0),
+        'particles': _param('integer', 'Particles', 10000, minimum=1),
+        'entropy': _ENTROPY, 'converge': _CONVERGE
+    }),
+    'scale_invariance': (scale_invariance, 'Final ratio across particle counts.', {
+        'particle_counts': _param('array', 'Particle counts', (100, 1000, 10000, 100000), items={'type': 'integer'}),
+        'iterations': _param('integer', 'Iterations', 500, minimum=1),
+        'entropy': _ENTROPY, 'converge': _CONVERGE,
+        'shared_min_particles': _param('integer', 'Counts at or above this run in shared memory across workers'),
+        'workers': _WORKERS
+    }),
+    'null_hypothesis': (null_hypothesis, 'Significance (sigma) of 0.75 against random expectation.', {
+        'seeds': _param('integer', 'Random seeds', 1000, minimum=2),
+        'iterations': _param('integer', 'Iterations', 500, minimum=0),
+        'particles': _param('integer', 'Particles per seed', 10000, minimum=1),
+        'entropy': _ENTROPY, 'workers': _WORKERS,
+        'null_method': _param('string', 'Null distribution: chi-square draws or exact moments',
+                              'chisquare', enum=['chisquare', 'exact'])
+    }),
+    'goldilocks': (goldilocks, 'N-manifold selection audit: stability of each N against (N-1)/N.', {
+        'target_n': _param('array', 'Manifold sizes', (3, 4, 5), items={'type': 'integer', 'minimum': 2}),
+        'seeds': _param('integer', 'Seeds per N', 50, minimum=1),
+        'iterations': _param('integer', 'Iterations', 1000, minimum=1),
+        'entropy': _ENTROPY, 'converge': _CONVERGE, 'workers': _WORKERS
+    }),
+    'attractor': (attractor, 'Toroidal S8 attractor: emergent S8 ratio and p1 weight.', {
+        'seeds': _param('integer', 'Seeds', 150, minimum=1),
+        'iterations': _param('integer', 'Spectral iterations', 5000, minimum=1),
+        'entropy': _ENTROPY, 'converge': _CONVERGE,
+        'mode': _param('string', 'Spectral update', 'reconstruct', enum=['reconstruct', 'eigenbasis']),
+        'workers': _WORKERS
+    }),
+    'mirror': (mirror, 'Sub-Planck mirror attractor at one scale (regime, period, trace statistics).', {
+        'scale_L': _param('number', 'Scale in Planck units', 1.0, exclusiveMinimum=0),
+        'iterations': _param('integer', 'Step budget', 2000, minimum=2),
+        'trace_floor': _param('number', 'Trace invariant clamp', 0.75),
+        'matter_bias': _param('number', 'Jitter', 0.03)
+    }),
+    'mirror_grid': (mirror_grid, 'Mirror trace statistics over a log-spaced scale grid.', {
+        'scale_min': _param('number', 'Smallest scale', 1e-5, exclusiveMinimum=0),
+        'scale_max': _param('number', 'Largest scale', 1e5, exclusiveMinimum=0),
+        'points': _param('integer', 'Grid points', 101, minimum=1, maximum=MAX_ARRAY_ITEMS),
+        'trace_floor': _param('number', 'Trace invariant clamp', 0.75),
+        'matter_bias': _param('number', 'Jitter', 0.03),
+        'iterations': _param('integer', 'Recursive depth', 2000, minimum=1),
+        'tail': _param('integer', 'Iterations averaged', 500, minimum=1)
+    }),
+    'equalization': (equalization, 'Bare 4D variance equalization proof (3D/4D ratio).', {
+        'iterations': _param('integer', 'Iterations', 500, minimum=0),
+        'particles': _param('integer', 'Particles', 10000, minimum=1),
+        'dtype': _DTYPE
+    }),
+    'suite': (suite, 'Complete fortress suite (also writes FORTRESS_RESULTS.md and convergence.png).', {
+        'entropy': _ENTROPY
+    })
+}
+
+def _jsonable(value: Any) -> Any:
+    """Plain JSON form of a tool result (large arrays are summarized)."""
+    import numpy as np
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.ndarray):
+        if value.size <= MAX_ARRAY_ITEMS:
+            return value.tolist()
+        return {'shape': list(value.shape), 'mean': float(value.mean()), 'std': float(value.std()),
+                'min': float(value.min()), 'max': float(value.max())}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _warm_worker() -> None:
+    """Worker initializer: keep fd 1 off the protocol channel and import the engines."""
+    os.dup2(sys.stderr.fileno(), 1)  # child processes of engines inherit it too
+    for module in ('UNIVERSAL_RECURSION_ENGINE', 'goldilocks_audit', 'TOROIDAL_S8_ATTRACTOR',
+                   'bare_urfe', 'bare_urfe_sub_planck_mirror'):
+        _module(module)
+
+def _execute(name: str, arguments: Dict[str, Any]):
+    """Run one tool in a worker; returns (JSON result, captured report)."""
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        result = TOOLS[name][0](**arguments)
+    return _jsonable(result), report.getvalue()
+
+# =============================================================================
+# SERVER (parent process)
+# =============================================================================
+
+class ToolError(Exception):
+    """Invalid tool call (reported as JSON-RPC error -32602)."""
+
+def resolve_arguments(name: str, arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Tool arguments with defaults applied; rejects unknown tools and parameters."""
+    if name not in TOOLS:
+        raise ToolError(f"unknown tool: {name!r}")
+    properties = TOOLS[name][2]
+    arguments = dict(arguments or {})
+    unknown = sorted(set(arguments) - set(properties))
+    if unknown:
+        raise ToolError(f"unknown argument(s) for {name}: {', '.join(unknown)}")
+    return {key: arguments.get(key, schema.get('default')) for key, schema in properties.items()}
+
+class MCPServer:
+    """
+    Stdio MCP server.
+
+    Args:
+        workers: Size of the warm worker pool (0 = all cores)
+        stdin, stdout: Protocol streams (default: the process's own)
+    """
+
+    def __init__(self, workers: int = 0, stdin=None, stdout=None):
+        self.workers = workers or _module('parallel_sweep').default_workers()
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'), initializer=_warm_worker
+        )
+        self.in_flight = {}
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def send(self, message: Dict[str, Any]) -> None:
+        with self._write_lock:
+            self.stdout.write(json.dumps(message) + '\n')
+            self.stdout.flush()
+
+    def reply(self, request_id, result=None, error=None) -> None:
+        message = {'jsonrpc': '2.0', 'id': request_id}
+        if error is not None:
+            message['error'] = error
+        else:
+            message['result'] = result
+        self.send(message)
+
+    def warm(self) -> None:
+        """Start every worker now rather than on the first calls."""
+        for future in [self.pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def call_tool(self, request_id, name: str, arguments: Dict[str, Any]) -> None:
+        """Submit (or join an identical in-flight) run and reply when it finishes."""
+        key = json.dumps([name, arguments], sort_keys=True)
+        with self._lock:
+            future = self.in_flight.get(key)
+            if future is None:
+                future = self.pool.submit(_execute, name, arguments)
+                self.in_flight[key] = future
+                future.add_done_callback(lambda f, key=key: self._retire(key))
+            else:
+                self.coalesced += 1
+        future.add_done_callback(lambda f: self._tool_reply(request_id, f))
+
+    def _retire(self, key: str) -> None:
+        with self._lock:
+            self.in_flight.pop(key, None)
+
+    def _tool_reply(self, request_id, future) -> None:
+        try:
+            result, report = future.result()
+        except Exception as e:
+            self.reply(request_id, {'content': [{'type': 'text', 'text': f"{type(e).__name__}: {e}"}], 'isError': True})
+            return
+        content = [{'type': 'text', 'text': json.dumps(result)}]
+        if report:
+            content.append({'type': 'text', 'text': report})
+        self.reply(request_id, {'content': content, 'structuredContent': result, 'isError': False})
+
+    def handle(self, message: Dict[str, Any]) -> None:
+        """Dispatch one JSON-RPC message (tool calls reply asynchronously)."""
+        method, request_id, params = message.get('method'), message.get('id'), message.get('params') or {}
+        if request_id is None:
+            return  # notifications (initialized, cancelled, ...) need no reply
+        if method == 'initialize':
+            requested = params.get('protocolVersion')
+            self.reply(request_id, {
+                'protocolVersion': requested if requested in PROTOCOL_VERSIONS else PROTOCOL_VERSIONS[0],
+                'capabilities': {'tools': {'listChanged': False}},
+                'serverInfo': SERVER_INFO
+            })
+        elif method == 'ping':
+            self.reply(request_id, {})
+        elif method == 'tools/list':
+            self.reply(request_id, {'tools': [
+                {'name': name, 'description': description,
+                 'inputSchema': {'type': 'object', 'properties': properties, 'additionalProperties': False}}
+                for name, (_, description, properties) in TOOLS.items()
+            ]})
+        elif method == 'tools/call':
+            try:
+                arguments = resolve_arguments(params.get('name'), params.get('arguments'))
+            except ToolError as e:
+                self.reply(request_id, error={'code': -32602, 'message': str(e)})
+                return
+            self.call_tool(request_id, params['name'], arguments)
+        else:
+            self.reply(request_id, error={'code': -32601, 'message': f"method not found: {method}"})
+
+    def serve(self) -> None:
+        """Read requests until stdin closes, then finish the running calls."""
+        try:
+            for line in self.stdin:
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self.reply(None, error={'code': -32700, 'message': f"parse error: {e}"})
+                    continue
+                self.handle(message)
+        finally:
+            self.pool.shutdown(wait=True)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Persistent Bare-URFE MCP server (stdio)')
+    parser.add_argument('--workers', type=int, default=0, help='warm worker processes (0 = all cores)')
+    args = parser.parse_args(argv)
+
+    server = MCPServer(workers=args.workers)
+    server.warm()
+    print(f"✓ Bare-URFE MCP server ready ({server.workers} warm worker(s))", file=sys.stderr)
+    server.serve()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+HOT-PATH INSTRUMENTATION
+
+Opt-in metrics for long sweeps. The engines fetch the current collector
+once per call and, when it is enabled, record:
+
+    timers     seconds and calls per phase: sine_step, moments (variance
+               reduction), eigh / spectral_step (attractor), rng (noise and
+               initial-condition draws), recursion (goldilocks update)
+    counters   iterations (seed-iterations actually run), seeds_converged
+    gauges     peak_rss_bytes (memory high-water mark)
+    progress   (done, total) per engine, forwarded to callbacks
+
+The default collector is a disabled Metrics whose methods do nothing, and
+hot loops only test one boolean, so instrumentation costs effectively
+nothing unless a Recorder is installed:
+
+    with instrument(Recorder(jsonl='sweep.jsonl', interval=30)) as rec:
+        run_fortress_test(...)
+    rec.write_prometheus('urfe.prom')
+
+Worker processes of a parallel sweep record into their own Recorder,
+and each chunk's snapshot is merged into the parent's (parallel_sweep).
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, IO, List, Optional, Union
+
+class Metrics:
+    """Disabled instrumentation (the default): every method is a no-op."""
+
+    enabled = False
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        pass
+
+    def count(self, name: str, value: float = 1) -> None:
+        pass
+
+    def progress(self, engine: str, done: int, total: int) -> None:
+        pass
+
+    def timer(self, phase: str):
+        return contextlib.nullcontext()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {}
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        pass
+
+def _peak_rss_bytes() -> int:
+    """Peak resident set size of this process (0 where `resource` is unavailable, e.g. Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux reports KiB
+
+class _Timer:
+    def __init__(self, metrics: 'Recorder', phase: str):
+        self.metrics = metrics
+        self.phase = phase
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.add_time(self.phase, time.perf_counter() - self.started)
+
+class Recorder(Metrics):
+    """
+    Enabled instrumentation.
+
+    Args:
+        jsonl: Path or text stream receiving one JSON snapshot per line
+               (on progress, at most every `interval` seconds, and on close())
+        interval: Minimum seconds between progress snapshots
+        on_progress: Callbacks called as cb(engine, done, total)
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        jsonl: Optional[Union[str, IO[str]]] = None,
+        interval: float = 10.0,
+        on_progress: Optional[List[Callable[[str, int, int], None]]] = None
+    ):
+        self.jsonl = jsonl
+        self.interval = interval
+        self.on_progress = list(on_progress or [])
+        self.timers = {}
+        self.counters = {}
+        self.gauges = {}
+        self.progress_state = {}
+        self._last_emit = 0.0
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        entry = self.timers.setdefault(phase, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+    def count(self, name: str, value: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def gauge_max(self, name: str, value: float) -> None:
+        self.gauges[name] = max(self.gauges.get(name, value), value)
+
+    def timer(self, phase: str):
+        return _Timer(self, phase)
+
+    def progress(self, engine: str, done: int, total: int) -> None:
+        self.progress_state[engine] = (done, total)
+        for callback in self.on_progress:
+            callback(engine, done, total)
+        if self.jsonl is not None and time.time() - self._last_emit >= self.interval:
+            self.write_jsonl()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current totals as a JSON-serializable dict."""
+        self.gauge_max('peak_rss_bytes', _peak_rss_bytes())
+        return {
+            'time': time.time(),
+            'timers': {phase: {'seconds': s, 'calls': n} for phase, (s, n) in self.timers.items()},
+            'counters': dict(self.counters),
+            'gauges': dict(self.gauges),
+            'progress': {engine: {'done': d, 'total': t} for engine, (d, t) in self.progress_state.items()}
+        }
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """Fold in a snapshot recorded elsewhere (e.g. by a worker process)."""
+        for phase, entry in snapshot.get('timers', {}).items():
+            mine = self.timers.setdefault(phase, [0.0, 0])
+            mine[0] += entry['seconds']
+            mine[1] += entry['calls']
+        for name, value in snapshot.get('counters', {}).items():
+            self.count(name, value)
+        for name, value in snapshot.get('gauges', {}).items():
+            self.gauge_max(name, value)
+
+    def write_jsonl(self, target: Optional[Union[str, IO[str]]] = None) -> None:
+        """Append one snapshot line to `target` (default: the jsonl given at construction)."""
+        target = self.jsonl if target is None else target
+        line = json.dumps(self.snapshot()) + '\n'
+        if isinstance(target, str):
+            with open(target, 'a') as f:
+                f.write(line)
+        else:
+            target.write(line)
+            target.flush()
+        self._last_emit = time.time()
+
+    def prometheus_text(self, prefix: str = 'urfe') -> str:
+        """Snapshot in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_phase_seconds_total Time spent per hot-path phase",
+            f"# TYPE {prefix}_phase_seconds_total counter"
+        ]
+        lines += [f'{prefix}_phase_seconds_total{{phase="{p}"}} {e["seconds"]:.9g}' for p, e in snap['timers'].items()]
+        lines += [f"# TYPE {prefix}_phase_calls_total counter"]
+        lines += [f'{prefix}_phase_calls_total{{phase="{p}"}} {e["calls"]}' for p, e in snap['timers'].items()]
+        for name, value in snap['counters'].items():
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value:.9g}"]
+        for name, value in snap['gauges'].items():
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {value:.9g}"]
+        if snap['progress']:
+            lines += [f"# TYPE {prefix}_progress_ratio gauge"]
+            lines += [f'{prefix}_progress_ratio{{engine="{e}"}} {p["done"] / max(1, p["total"]):.6g}'
+                      for e, p in snap['progress'].items()]
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str) -> None:
+        """Atomically (re)write a textfile-collector file."""
+        tmp = f"{path}.tmp-{os.getpid()}"
+        with open(tmp, 'w') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp, path)
+
+    def close(self) -> None:
+        """Emit a final JSON-lines snapshot."""
+        if self.jsonl is not None:
+            self.write_jsonl()
+
+_current = Metrics()
+
+def get_metrics() -> Metrics:
+    """The active collector (a disabled Metrics unless one was installed)."""
+    return _current
+
+def set_metrics(metrics: Optional[Metrics]) -> Metrics:
+    """Install a collector (None disables); returns the previous one."""
+    global _current
+    previous = _current
+    _current = metrics if metrics is not None else Metrics()
+    return previous
+
+@contextlib.contextmanager
+def instrument(metrics: Optional[Recorder] = None):
+    """Install a Recorder for the duration of a block and close it afterwards."""
+    metrics = metrics if metrics is not None else Recorder()
+    previous = set_metrics(metrics)
+    try:
+        yield metrics
+    finally:
+        set_metrics(previous)
+        metrics.close()
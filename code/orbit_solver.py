@@ -0,0 +1,156 @@
+"""
+ORBIT SOLVER FOR SCALAR RECURSIONS
+
+Finds the attractor of a 1D map x -> f(x) directly instead of burning in
+thousands of iterations and averaging a tail:
+
+1. CYCLE DETECTION: Brent's algorithm on states compared to `decimals`
+   digits (|x - y| < 0.5e-decimals) finds the period p of the orbit the
+   map settles into.
+2. NEWTON REFINEMENT: the periodic point is polished by Newton's method on
+   g(x) = f^p(x) - x, with g'(x) = prod f'(x_i) - 1 (chain rule).
+3. LYAPUNOV EXPONENT: lambda = mean log|f'(x_i)| over the cycle. A cycle is
+   only accepted as the attractor when lambda < 0 (it is stable).
+
+Orbits that never repeat within max_steps fall back to the brute-force
+tail statistics, with lambda estimated over the same tail; lambda > 0
+labels the regime as chaotic. For stable points the cost drops from
+thousands of steps to tens.
+"""
+
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable
+
+FIXED_POINT, CYCLE, CHAOTIC, UNRESOLVED = 'fixed point', 'cycle', 'chaotic', 'unresolved'
+
+@dataclass
+class Orbit:
+    """Attractor of a scalar map"""
+    regime: str           # fixed point / cycle / chaotic / unresolved
+    period: int           # cycle length (0 without a cycle)
+    mean: float
+    max: float
+    std: float
+    lyapunov: float       # mean log|f'| over the cycle (or the sampled tail)
+    steps: int            # map evaluations used
+    points: np.ndarray    # the cycle (or the sampled tail)
+
+def _log_slope(slope: float) -> float:
+    return math.log(abs(slope)) if slope != 0.0 else -math.inf
+
+def _brent(f: Callable[[float], float], x0: float, decimals: int, max_steps: int):
+    """
+    Brent's cycle detection on states equal to `decimals` digits.
+
+    Returns:
+        (period, state on the cycle, steps) or (0, last state, steps)
+    """
+    resolution = 0.5 * 10.0 ** -decimals
+    power = period = 1
+    tortoise = x0
+    hare = f(x0)
+    steps = 1
+    while abs(tortoise - hare) >= resolution:
+        if steps >= max_steps:
+            return 0, hare, steps
+        if power == period:
+            tortoise = hare
+            power *= 2
+            period = 0
+        hare = f(hare)
+        period += 1
+        steps += 1
+    return period, hare, steps
+
+def _newton_cycle(
+    f: Callable[[float], float],
+    df: Callable[[float], float],
+    x: float,
+    period: int,
+    tolerance: float,
+    max_newton: int
+):
+    """Refine a period-p point with Newton's method; returns (x, evaluations)."""
+    evaluations = 0
+    for _ in range(max_newton):
+        y, slope = x, 1.0
+        for _ in range(period):
+            slope *= df(y)
+            y = f(y)
+        evaluations += period
+        g, dg = y - x, slope - 1.0
+        if abs(g) <= 1e-15 or dg == 0.0:
+            break
+        step = g / dg
+        if abs(step) > tolerance:
+            break  # Newton would leave the basin of the detected cycle
+        x -= step
+    return x, evaluations
+
+def find_orbit(
+    f: Callable[[float], float],
+    df: Callable[[float], float],
+    x0: float,
+    decimals: int = 12,
+    max_steps: int = 2000,
+    tail: int = 500,
+    max_newton: int = 8
+) -> Orbit:
+    """
+    Attractor of the scalar map f starting from x0.
+
+    Args:
+        f: The map
+        df: Its derivative (signed, for Newton; |df| gives the Lyapunov exponent)
+        x0: Initial state
+        decimals: Digits to which a repeated state must agree
+        max_steps: Evaluation budget; without a cycle the statistics are those
+                   of states max_steps - tail + 1 .. max_steps, as in a
+                   brute-force run of max_steps iterations
+        tail: States sampled for the statistics when no cycle is found
+        max_newton: Newton iterations used to polish a detected cycle
+
+    Returns:
+        Orbit (mean/max/std over one period of the cycle, or over the tail)
+    """
+    tail = max(1, min(tail, max_steps))
+    period, x, steps = _brent(f, x0, decimals, max_steps - tail)
+
+    if period:
+        x, evaluations = _newton_cycle(f, df, x, period, 10.0 ** (-(decimals // 2)), max_newton)
+        steps += evaluations
+        points = np.empty(period)
+        log_slopes = 0.0
+        for i in range(period):
+            points[i] = x
+            log_slopes += _log_slope(df(x))
+            x = f(x)
+        steps += period
+        lyapunov = log_slopes / period
+        if lyapunov < 0:
+            return Orbit(
+                regime=FIXED_POINT if period == 1 else CYCLE, period=period,
+                mean=float(np.mean(points)), max=float(np.max(points)), std=float(np.std(points)),
+                lyapunov=lyapunov, steps=steps, points=points
+            )
+
+    # No stable cycle: brute-force tail, with the Lyapunov exponent over the same states
+    for _ in range(max(0, max_steps - steps - tail)):
+        x = f(x)
+        steps += 1
+    points = np.empty(tail)
+    log_slopes = 0.0
+    for i in range(tail):
+        x = f(x)
+        points[i] = x
+        log_slopes += _log_slope(df(x))
+    steps += tail
+    lyapunov = log_slopes / tail
+
+    return Orbit(
+        regime=CHAOTIC if lyapunov > 0 else UNRESOLVED, period=0,
+        mean=float(np.mean(points)), max=float(np.max(points)), std=float(np.std(points)),
+        lyapunov=lyapunov, steps=steps, points=points
+    )
@@ -0,0 +1,163 @@
+"""
+PARALLEL SEED SWEEPS
+
+Common runner that spreads independent seeds across a ProcessPoolExecutor.
+
+Every seed draws from its own random stream, so a seed's result depends
+only on (entropy, stream, seed index) and never on which worker ran it or
+how the sweep was chunked. Results therefore come back bit-identical for
+any number of workers.
+
+When instrumentation is enabled (metrics.py), each worker chunk records
+into its own Recorder and the parent merges the snapshots; the parent
+also reports per-chunk progress for the sweep.
+
+Streams:
+    entropy given -> np.random.Generator on SeedSequence(entropy, spawn_key=(stream, seed))
+                     (the same child SeedSequence(entropy).spawn() would hand out)
+    entropy None  -> np.random.RandomState(seed), i.e. the legacy np.random.seed(seed) stream
+"""
+
+import os
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Union
+
+if __package__:
+    from .metrics import Recorder, get_metrics, instrument
+else:
+    from metrics import Recorder, get_metrics, instrument
+
+Stream = Union[np.random.Generator, np.random.RandomState]
+
+def resolve_entropy(entropy: Optional[int] = None) -> int:
+    """Return `entropy`, or fresh OS entropy if None (record it to reproduce a run)."""
+    if entropy is None:
+        return int(np.random.SeedSequence().entropy)
+    return int(entropy)
+
+def seed_sequence(entropy: int, seed: int, stream: int = 0) -> np.random.SeedSequence:
+    """Child SeedSequence of one seed, built directly without spawning its siblings."""
+    return np.random.SeedSequence(entropy, spawn_key=(stream, seed))
+
+def seed_rng(entropy: Optional[int], seed: int, stream: int = 0) -> Stream:
+    """Independent random stream for one seed (see module docstring)."""
+    if entropy is None:
+        return np.random.RandomState(seed)
+    return np.random.default_rng(seed_sequence(entropy, seed, stream))
+
+def randint(rng: Stream, low: int, high: int) -> int:
+    """Integer in [low, high) from either a Generator or a RandomState."""
+    if isinstance(rng, np.random.Generator):
+        return int(rng.integers(low, high))
+    return int(rng.randint(low, high))
+
+def chunk_bounds(seeds: int, workers: int = 1, chunk_size: Optional[int] = None, first: int = 0) -> List[tuple]:
+    """Contiguous [start, stop) ranges of seeds first .. seeds - 1; ~4 chunks per worker by default."""
+    if chunk_size is None:
+        chunk_size = -(-(seeds - first) // max(1, 4 * workers))
+    chunk_size = max(1, chunk_size)
+    return [(start, min(start + chunk_size, seeds)) for start in range(first, seeds, chunk_size)]
+
+def default_workers() -> int:
+    """Number of usable cores."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def _instrumented_task(task: Callable[..., Any], start: int, stop: int, **kwargs):
+    """Run one chunk in a worker under a fresh Recorder; returns (result, snapshot)."""
+    with instrument(Recorder()) as recorder:
+        result = task(start, stop, **kwargs)
+    return result, recorder.snapshot()
+
+def iter_seed_sweep(
+    task: Callable[..., Any],
+    seeds: int,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+    first: int = 0,
+    **kwargs
+) -> Iterator[Any]:
+    """
+    Run `task(start, stop, **kwargs)` over contiguous seed chunks, yielding
+    (start, stop, result) in seed order as chunks complete.
+
+    At most two chunks per worker are in flight, so results that have not
+    been consumed yet never pile up in the parent process. Closing the
+    generator early cancels the chunks that have not started.
+
+    Args:
+        task: Picklable module-level function computing seeds [start, stop)
+        seeds: Total number of seeds
+        workers: Worker processes (1 runs inline; 0 or None uses every core)
+        chunk_size: Seeds per task (default: ~4 chunks per worker)
+        first: First seed of the sweep (extends a run that stopped at `first`)
+        **kwargs: Forwarded to every task call
+    """
+    if not workers:
+        workers = default_workers()
+    bounds = chunk_bounds(seeds, workers, chunk_size, first)
+    metrics = get_metrics()
+    engine = task.__name__.strip('_')
+
+    if workers == 1 or len(bounds) == 1:
+        for start, stop in bounds:
+            result = task(start, stop, **kwargs)
+            metrics.progress(engine, stop, seeds)
+            yield start, stop, result
+        return
+
+    def collect(start, stop, future):
+        result = future.result()
+        if metrics.enabled:
+            result, snapshot = result
+            metrics.merge(snapshot)
+            metrics.progress(engine, stop, seeds)
+        return start, stop, result
+
+    call = (_instrumented_task, task) if metrics.enabled else (task,)
+    workers = min(workers, len(bounds))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        try:
+            for start, stop in bounds:
+                pending.append((start, stop, pool.submit(*call, start, stop, **kwargs)))
+                if len(pending) >= 2 * workers:
+                    yield collect(*pending.popleft())
+            while pending:
+                yield collect(*pending.popleft())
+        finally:
+            # Closed early (consumer stopped or failed): drop chunks not yet started
+            for _, _, future in pending:
+                future.cancel()
+
+def run_seed_sweep(
+    task: Callable[..., Any],
+    seeds: int,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+    **kwargs
+) -> List[Any]:
+    """
+    Run `task(start, stop, **kwargs)` over contiguous seed chunks.
+
+    Args:
+        task: Picklable module-level function computing seeds [start, stop)
+        seeds: Total number of seeds
+        workers: Worker processes (1 runs inline; 0 or None uses every core)
+        chunk_size: Seeds per task (default: ~4 chunks per worker)
+        **kwargs: Forwarded to every task call
+
+    Returns:
+        Task results in seed order
+    """
+    return [result for _, _, result in iter_seed_sweep(task, seeds, workers, chunk_size, **kwargs)]
+
+def concat_chunks(chunks: Sequence[Any]) -> Any:
+    """Concatenate per-chunk arrays (or tuples of arrays) along the seed axis."""
+    if isinstance(chunks[0], tuple):
+        return tuple(np.concatenate(parts) for parts in zip(*chunks))
+    return np.concatenate(chunks)
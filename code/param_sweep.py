@@ -0,0 +1,330 @@
+"""
+PARAMETER SWEEPS
+
+Parameter robustness of the engines: evaluates an engine over a grid or a
+Latin-hypercube sample of its hard-coded constants and collects one row
+per parameter point into a columnar table:
+
+    points = parameter_grid(coupling=np.linspace(0.3, 0.5, 21), void_bias=[0.10, 0.15, 0.20])
+    table = run_parameter_sweep('attractor', points, seeds=20, entropy=7, workers=0, out='attractor.npz')
+
+    points = latin_hypercube(1000, {'gain': (3.0, 3.3), 'epsilon': (0.3, 0.7)}, entropy=1)
+    table = run_parameter_sweep('goldilocks', points, seeds=10, entropy=7, out='goldilocks.parquet')
+
+Parameters (defaults are the engines' constants; unswept ones stay at them):
+    gain        sine-map gain (pi)                              all engines
+    epsilon     inter-dimensional coupling (EPSILON = 0.5)      goldilocks
+    coupling    4D->3D rotational coupling (COUPLING = 0.42)    attractor
+    void_bias   hard-void exclusion radius (VOID_BIAS = 0.15)   attractor
+    winding     base of the 1:w:w^2 winding hierarchy (8)       attractor
+
+Batching: points are split into blocks of consecutive points and each
+block runs as ONE engine chunk whose rows are all of its (point, seed)
+pairs, each row with its own parameters. A thousand points therefore cost
+a few vectorized kernels, not a thousand engine runs. Blocks are sized to
+a memory budget and spread over worker processes (parallel_sweep), and
+results do not depend on the worker count.
+
+Every point reuses seeds 0 .. seeds - 1 (common random numbers), so the
+differences between points come from the parameters rather than from
+different draws, and a point at the default constants reproduces the
+engine's own audit for the same entropy.
+
+Tables are dicts of equal-length column arrays: the parameters, then the
+mean and std over seeds of every metric. save_table writes .npz, or
+.parquet when pyarrow is installed; load_table reads either back.
+"""
+
+import json
+import numpy as np
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+if __package__:
+    from .goldilocks_audit import EPSILON, WIDTH, _goldilocks_chunk
+    from .parallel_sweep import default_workers, iter_seed_sweep, resolve_entropy
+    from .result_cache import cached
+    from .TOROIDAL_S8_ATTRACTOR import COUPLING, VOID_BIAS, WINDING_HIERARCHY, _attractor_chunk
+    from .UNIVERSAL_RECURSION_ENGINE import _fortress_chunk
+else:
+    from goldilocks_audit import EPSILON, WIDTH, _goldilocks_chunk
+    from parallel_sweep import default_workers, iter_seed_sweep, resolve_entropy
+    from result_cache import cached
+    from TOROIDAL_S8_ATTRACTOR import COUPLING, VOID_BIAS, WINDING_HIERARCHY, _attractor_chunk
+    from UNIVERSAL_RECURSION_ENGINE import _fortress_chunk
+
+# Engine constants a sweep can vary
+DEFAULTS = {
+    'gain': np.pi,
+    'epsilon': EPSILON,
+    'coupling': COUPLING,
+    'void_bias': VOID_BIAS,
+    'winding': float(WINDING_HIERARCHY[1])
+}
+# Memory budget for one block of (point, seed) rows
+BLOCK_BYTES = 256 * 2**20
+
+# =============================================================================
+# ENGINE ADAPTERS (one block of rows -> per-row metrics)
+# =============================================================================
+
+def _fortress_rows(seed_ids, params, entropy, iterations, particles=10000, max_imbalance=1000.0, converge=None,
+                   dtype='float64', max_block_bytes=BLOCK_BYTES):
+    ratios, _, iterations_run = _fortress_chunk(
+        0, len(seed_ids), entropy, iterations, particles, max_imbalance, max_block_bytes,
+        converge=converge, max_period=8, dtype=dtype, seed_ids=seed_ids, gain=params['gain']
+    )
+    return {'ratio': ratios, 'iterations': iterations_run}
+
+def _goldilocks_rows(seed_ids, params, entropy, iterations, target_n=(3, 4, 5), converge=None, update='jacobi',
+                     max_block_bytes=BLOCK_BYTES):
+    deltas, errors, _ = _goldilocks_chunk(
+        0, len(seed_ids), entropy, list(target_n), iterations, converge, update,
+        seed_ids=seed_ids, epsilon=params['epsilon'], gain=params['gain']
+    )
+    metrics = {}
+    for j, n in enumerate(target_n):
+        metrics[f'delta_n{n}'] = deltas[:, j]
+        metrics[f'error_n{n}'] = errors[:, j]
+    return metrics
+
+def _attractor_rows(seed_ids, params, entropy, iterations, converge=None, mode='reconstruct',
+                    max_block_bytes=BLOCK_BYTES):
+    ratios, p1_weights, _ = _attractor_chunk(
+        0, len(seed_ids), entropy, iterations, converge, mode=mode, seed_ids=seed_ids,
+        coupling=params['coupling'], void_bias=params['void_bias'],
+        hierarchy=params['winding'][:, None] ** np.arange(3), gain=params['gain']
+    )
+    return {'s8_ratio': ratios, 'p1_weight': p1_weights}
+
+def _fortress_row_bytes(iterations, particles=10000, dtype='float64', **options):
+    return particles * 4 * np.dtype(dtype).itemsize + iterations * 8
+
+def _goldilocks_row_bytes(iterations, target_n=(3, 4, 5), **options):
+    # state plus the interaction temporary of the stacked manifolds
+    return 2 * sum(target_n) * WIDTH * 8
+
+def _attractor_row_bytes(iterations, **options):
+    return 4 * 4 * 8 * 4
+
+ENGINES = {
+    'fortress': {
+        'rows': _fortress_rows, 'row_bytes': _fortress_row_bytes,
+        'parameters': ('gain',), 'iterations': 800
+    },
+    'goldilocks': {
+        'rows': _goldilocks_rows, 'row_bytes': _goldilocks_row_bytes,
+        'parameters': ('gain', 'epsilon'), 'iterations': 1000
+    },
+    'attractor': {
+        'rows': _attractor_rows, 'row_bytes': _attractor_row_bytes,
+        'parameters': ('gain', 'coupling', 'void_bias', 'winding'), 'iterations': 5000
+    }
+}
+
+# =============================================================================
+# DESIGNS
+# =============================================================================
+
+def parameter_grid(**axes: Sequence[float]) -> Dict[str, np.ndarray]:
+    """
+    Full factorial design: every combination of the given axis values.
+
+    Returns:
+        One column per parameter, first axis varying slowest
+    """
+    grids = np.meshgrid(*[np.asarray(values, dtype=np.float64).ravel() for values in axes.values()], indexing='ij')
+    return {name: grid.ravel() for name, grid in zip(axes, grids)}
+
+def latin_hypercube(
+    points: int,
+    bounds: Dict[str, Tuple[float, float]],
+    entropy: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Latin-hypercube sample: each parameter's range is cut into `points`
+    equal strata and every stratum is hit exactly once, in an independent
+    random order per parameter.
+
+    Args:
+        points: Number of parameter points
+        bounds: {name: (low, high)} per swept parameter
+        entropy: Root seed of the design (None: fresh entropy)
+
+    Returns:
+        One column per parameter
+    """
+    rng = np.random.default_rng(entropy)
+    columns = {}
+    for name, (low, high) in bounds.items():
+        strata = (rng.permutation(points) + rng.random(points)) / points
+        columns[name] = low + strata * (high - low)
+    return columns
+
+# =============================================================================
+# SWEEP
+# =============================================================================
+
+def _sweep_block(start, stop, engine, columns, seeds_per_point, entropy, iterations, options):
+    """Points [start, stop) as one engine chunk of (point, seed) rows; returns (points, seeds) metrics."""
+    seed_ids = np.tile(np.arange(seeds_per_point), stop - start)
+    params = {name: np.repeat(values[start:stop], seeds_per_point) for name, values in columns.items()}
+    metrics = ENGINES[engine]['rows'](seed_ids, params, entropy, iterations, **options)
+    return {
+        name: np.asarray(values, dtype=np.float64).reshape(stop - start, seeds_per_point)
+        for name, values in metrics.items()
+    }
+
+def _resolve_points(engine: str, points: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Validated parameter columns, unswept parameters filled with their defaults."""
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r} (use one of {sorted(ENGINES)})")
+    accepted = ENGINES[engine]['parameters']
+    unknown = sorted(set(points) - set(accepted))
+    if unknown:
+        raise ValueError(f"{engine} does not take parameter(s) {unknown} (sweepable: {list(accepted)})")
+
+    columns = {name: np.asarray(values, dtype=np.float64).ravel() for name, values in points.items()}
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"parameter columns differ in length: { {n: len(v) for n, v in columns.items()} }")
+    count = lengths.pop() if lengths else 1
+    return {name: columns.get(name, np.full(count, DEFAULTS[name])) for name in accepted}
+
+@cached(ignore=('workers', 'max_block_bytes'))
+def _parameter_sweep(engine, columns, seeds, iterations, workers, entropy, options, max_block_bytes):
+    """Per-seed metrics {name: (points, seeds)} of every point (memoized)."""
+    points = len(next(iter(columns.values())))
+    row_bytes = ENGINES[engine]['row_bytes'](iterations, **options)
+    block = max(1, min(max_block_bytes // (seeds * row_bytes), -(-points // (4 * (workers or default_workers())))))
+
+    per_seed = {}
+    for start, stop, metrics in iter_seed_sweep(
+        _sweep_block, points, workers=workers, chunk_size=block, engine=engine, columns=columns, seeds_per_point=seeds,
+        entropy=entropy, iterations=iterations, options=dict(options, max_block_bytes=max_block_bytes)
+    ):
+        for name, values in metrics.items():
+            per_seed.setdefault(name, np.empty((points, seeds)))[start:stop] = values
+    return per_seed
+
+def _robustness(engine: str, table: Dict[str, np.ndarray]) -> Tuple[np.ndarray, str]:
+    """Per-point pass mask of the engine's headline claim and its description."""
+    if engine == 'fortress':
+        return np.abs(table['ratio_mean'] - 0.75) < 0.01, "mean ratio within ±0.01 of 0.75"
+    if engine == 'goldilocks':
+        return table['best_n'] == 4, "N=4 selected"
+    return (table['s8_ratio_mean'] >= 0.75) & (table['s8_ratio_mean'] <= 0.81), "S8 ratio in the 0.75 - 0.81 corridor"
+
+def run_parameter_sweep(
+    engine: str,
+    points: Dict[str, Sequence[float]],
+    seeds: int = 10,
+    iterations: Optional[int] = None,
+    workers: int = 1,
+    entropy: Optional[int] = None,
+    out: Optional[str] = None,
+    max_block_bytes: int = BLOCK_BYTES,
+    **options
+) -> Dict[str, np.ndarray]:
+    """
+    PARAMETER ROBUSTNESS: evaluate `engine` at every parameter point.
+
+    Args:
+        engine: 'fortress', 'goldilocks' or 'attractor'
+        points: {parameter: values} columns of equal length, e.g. from
+                parameter_grid or latin_hypercube (see module docstring)
+        seeds: Seeds per point (the same seeds at every point)
+        iterations: Iterations per run (default: the engine's audit default)
+        workers: Worker processes for the blocks (0 = all cores)
+        entropy: Root seed (None: fresh entropy, recorded in the table metadata)
+        out: Write the table here (.npz, or .parquet with pyarrow)
+        max_block_bytes: Memory budget for one block of (point, seed) rows
+        **options: Engine settings, e.g. particles / max_imbalance / dtype
+                   (fortress), target_n / update (goldilocks), mode
+                   (attractor), converge (all)
+
+    Returns:
+        Table: the parameter columns, then <metric>_mean and <metric>_std
+        per point (goldilocks adds best_n, the N with the smallest mean delta)
+    """
+    columns = _resolve_points(engine, points)
+    if iterations is None:
+        iterations = ENGINES[engine]['iterations']
+    entropy = resolve_entropy(entropy)
+    n_points = len(columns[next(iter(columns))])
+
+    print(f"--- PARAMETER SWEEP: {engine.upper()} ({n_points} points x {seeds} seeds, {iterations} iterations) ---")
+    per_seed = _parameter_sweep(engine, columns, seeds, iterations, workers, entropy, options, max_block_bytes)
+
+    table = dict(columns)
+    for name, values in per_seed.items():
+        table[f'{name}_mean'] = values.mean(axis=1)
+        table[f'{name}_std'] = values.std(axis=1)
+    if engine == 'goldilocks':
+        target_n = options.get('target_n', (3, 4, 5))
+        deltas = np.stack([table[f'delta_n{n}_mean'] for n in target_n], axis=1)
+        table['best_n'] = np.asarray(target_n)[np.argmin(deltas, axis=1)]
+
+    swept = [name for name in columns if name in points]
+    fixed = [f"{name}={columns[name][0]:g}" for name in columns if name not in points]
+    for name in swept:
+        print(f"{name:<10} | {columns[name].min():.6g} .. {columns[name].max():.6g}")
+    if fixed:
+        print(f"Fixed:       {', '.join(fixed)}")
+    at = lambda k: ', '.join(f"{p}={columns[p][k]:.4g}" for p in swept)
+    for name in per_seed:
+        means = table[f'{name}_mean']
+        lo, hi = np.argmin(means), np.argmax(means)
+        print(f"{name:<10} | min {means[lo]:.6f} ({at(lo)}) | max {means[hi]:.6f} ({at(hi)}) | "
+              f"spread {means[hi] - means[lo]:.2e}")
+
+    passed, claim = _robustness(engine, table)
+    status = '✓ ROBUST' if passed.all() else '⚠ NOT ROBUST over this range'
+    print(f"Robustness: {passed.sum()}/{n_points} points with {claim} | {status}")
+
+    if out is not None:
+        save_table(out, table, {
+            'engine': engine, 'seeds': seeds, 'iterations': iterations, 'entropy': entropy,
+            'options': {k: list(v) if isinstance(v, tuple) else v for k, v in options.items()}
+        })
+        print(f"Table written to {out}")
+    return table
+
+# =============================================================================
+# TABLES
+# =============================================================================
+
+def save_table(path: str, table: Dict[str, np.ndarray], metadata: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Write a column table to .npz (one array per column) or, for a .parquet
+    path, to Parquet via pyarrow. Metadata is stored as JSON alongside.
+    """
+    meta = json.dumps(metadata or {})
+    if path.endswith('.parquet'):
+        try:
+            import pyarrow as pa  # deferred: only Parquet output needs pyarrow
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet tables require pyarrow (pip install pyarrow); use a .npz path instead") from None
+        arrow = pa.table({name: np.asarray(values) for name, values in table.items()})
+        pq.write_table(arrow.replace_schema_metadata({'urfe': meta}), path)
+        return
+    np.savez(path, __meta__=np.array(meta), **table)
+
+def load_table(path: str) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Read a table written by save_table; returns (columns, metadata)."""
+    if path.endswith('.parquet'):
+        try:
+            import pyarrow.parquet as pq  # deferred: only Parquet input needs pyarrow
+        except ImportError:
+            raise ImportError("Parquet tables require pyarrow (pip install pyarrow)") from None
+        arrow = pq.read_table(path)
+        meta = (arrow.schema.metadata or {}).get(b'urfe', b'{}')
+        return {name: arrow.column(name).to_numpy() for name in arrow.column_names}, json.loads(meta)
+    with np.load(path) as data:
+        columns = {name: data[name] for name in data.files if name != '__meta__'}
+        meta = json.loads(str(data['__meta__'])) if '__meta__' in data.files else {}
+    return columns, meta
+
+if __name__ == "__main__":
+    run_parameter_sweep('attractor', parameter_grid(coupling=np.linspace(0.32, 0.52, 11),
+                                                    void_bias=[0.10, 0.15, 0.20]), seeds=20, entropy=0)
@@ -0,0 +1,247 @@
+"""
+DEFERRED CONVERGENCE PLOTS
+
+Plots are drawn from a small reduced PlotData, never from the raw
+trajectories, so drawing costs the same whether a sweep had 50 seeds or
+10^6. The reduction happens in the simulation process. It works block by
+block from any trajectory array, sink or TrajectorySummary (see
+trajectory_sinks.py):
+
+    mean / envelope    per-iteration mean and min / max, bucketed to `points`
+    quantile bands     per-iteration quantiles of the sampled trajectories
+    sample lines       the first `sample` trajectories, LTTB-downsampled
+    final histogram    bin counts of every seed's final ratio
+
+Rendering then happens elsewhere:
+
+    render_async(data, 'convergence.png')      one background worker process
+    save_plot_data(data, 'convergence.npz')    later: python . plot convergence.npz
+
+The background process starts on the first render_async and stays up for
+the next one until shutdown_renderer() (called by the suite once its plot
+is written, and at interpreter exit).
+
+Figures are drawn with the Agg canvas directly (matplotlib.figure.Figure,
+no pyplot), so rendering is non-interactive, needs no display and keeps
+no global figure state. matplotlib is only imported by the process that
+renders.
+"""
+
+import atexit
+import json
+import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Optional, Sequence, Union
+
+if __package__:
+    from .trajectory_sinks import TrajectorySink, TrajectorySummary, summarize
+else:
+    from trajectory_sinks import TrajectorySink, TrajectorySummary, summarize
+
+# Points per plotted line (about the horizontal pixel count of the panel)
+PLOT_POINTS = 1000
+# Sample trajectories drawn as individual lines
+PLOT_SAMPLE = 50
+# Quantile bands (outer band first)
+PLOT_QUANTILES = (0.05, 0.25, 0.75, 0.95)
+# Sampled trajectories the quantiles are estimated from
+QUANTILE_SAMPLE = 1000
+HISTOGRAM_BINS = 50
+
+_executor = None  # one background render process, started on first use
+
+# =============================================================================
+# REDUCTION
+# =============================================================================
+
+def lttb(y: np.ndarray, points: int) -> Sequence[np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling of one or more series.
+
+    Keeps the first and last sample and, from each of points - 2 equal
+    buckets in between, the sample spanning the largest triangle with the
+    previously kept one and the mean of the next bucket. Unlike striding,
+    spikes and turning points survive. Rows are processed together.
+
+    Args:
+        y: (n,) or (rows, n) series on the x grid 0..n-1
+        points: Samples kept per series
+
+    Returns:
+        x indices and y values, each (rows, points) (or (rows, n) if n <= points)
+    """
+    y = np.atleast_2d(np.asarray(y, dtype=np.float64))
+    rows, n = y.shape
+    if points >= n or points < 3:
+        return np.tile(np.arange(n), (rows, 1)), y.copy()
+
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    rows_idx = np.arange(rows)
+    kept = np.empty((rows, points), dtype=np.int64)
+    kept[:, 0], kept[:, -1] = 0, n - 1
+    a = np.zeros(rows, dtype=np.int64)
+    for b in range(points - 2):
+        lo, hi = edges[b], edges[b + 1]
+        next_lo, next_hi = (edges[b + 1], edges[b + 2]) if b + 2 < points - 1 else (n - 1, n)
+        next_x = (next_lo + next_hi - 1) / 2
+        next_y = y[:, next_lo:next_hi].mean(axis=1)
+        ax, ay = a[:, None], y[rows_idx, a][:, None]
+        area = np.abs((ax - next_x) * (y[:, lo:hi] - ay) - (ax - np.arange(lo, hi)) * (next_y[:, None] - ay))
+        a = lo + area.argmax(axis=1)
+        kept[:, b + 1] = a
+    return kept, y[rows_idx[:, None], kept]
+
+def _buckets(n: int, points: int) -> np.ndarray:
+    """Start index of each of min(n, points) equal buckets of 0..n-1."""
+    return np.linspace(0, n, min(n, points), endpoint=False).astype(np.int64)
+
+@dataclass
+class PlotData:
+    """Everything visualize_convergence draws, reduced to about `points` values per line"""
+    seeds: int
+    iterations: int
+    x: np.ndarray              # (buckets,) bucket centres
+    mean: np.ndarray           # (buckets,)
+    minimum: np.ndarray        # (buckets,) envelope
+    maximum: np.ndarray        # (buckets,)
+    quantile_levels: np.ndarray
+    quantiles: np.ndarray      # (levels, buckets)
+    sample_x: np.ndarray       # (lines, points) LTTB-kept iterations
+    sample_y: np.ndarray       # (lines, points)
+    hist_counts: np.ndarray
+    hist_edges: np.ndarray
+    final_mean: float
+
+def convergence_plot_data(
+    trajectories: Union[np.ndarray, TrajectorySink, TrajectorySummary],
+    points: int = PLOT_POINTS,
+    sample: int = PLOT_SAMPLE,
+    quantiles: Sequence[float] = PLOT_QUANTILES
+) -> PlotData:
+    """
+    Reduce trajectories to PlotData.
+
+    Arrays (including memmaps) and sinks are summarized block by block
+    first; the quantile bands come from up to QUANTILE_SAMPLE sampled
+    trajectories.
+    """
+    summary = trajectories if isinstance(trajectories, TrajectorySummary) else summarize(trajectories, QUANTILE_SAMPLE)
+    iterations = len(summary.mean)
+    starts = _buckets(iterations, points)
+    ends = np.append(starts[1:], iterations)
+    levels = np.asarray(quantiles, dtype=np.float64)
+    bands = summary.quantiles(levels) if len(summary.sample) and len(levels) else np.empty((0, iterations))
+    sample_x, sample_y = lttb(summary.sample[:sample], points) if len(summary.sample) else (
+        np.empty((0, 0), dtype=np.int64), np.empty((0, 0))
+    )
+    final = np.asarray(summary.final, dtype=np.float64)
+    counts, edges = np.histogram(final, bins=HISTOGRAM_BINS) if len(final) else (np.zeros(0), np.zeros(1))
+    return PlotData(
+        seeds=int(summary.seeds),
+        iterations=iterations,
+        x=(starts + ends - 1) / 2,
+        mean=np.add.reduceat(summary.mean, starts) / (ends - starts),
+        minimum=np.minimum.reduceat(summary.minimum, starts),
+        maximum=np.maximum.reduceat(summary.maximum, starts),
+        quantile_levels=levels,
+        quantiles=np.add.reduceat(bands, starts, axis=1) / (ends - starts),
+        sample_x=sample_x,
+        sample_y=sample_y,
+        hist_counts=counts,
+        hist_edges=edges,
+        final_mean=float(np.mean(final)) if len(final) else float('nan')
+    )
+
+def save_plot_data(data: PlotData, path: str) -> None:
+    """Write PlotData to a .npz file (a few hundred KB at most)."""
+    arrays = {f.name: getattr(data, f.name) for f in fields(PlotData)}
+    meta = {name: arrays.pop(name) for name in ('seeds', 'iterations', 'final_mean')}
+    np.savez(path, __meta__=np.array(json.dumps(meta)), **arrays)
+
+def load_plot_data(path: str) -> PlotData:
+    """Read PlotData written by save_plot_data."""
+    with np.load(path) as data:
+        values = {name: data[name] for name in data.files if name != '__meta__'}
+        values.update(json.loads(str(data['__meta__'])))
+    return PlotData(**values)
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def render_convergence(data: PlotData, save_path: Optional[str] = 'convergence.png', dpi: int = 300):
+    """
+    Draw the convergence figure from PlotData on an Agg canvas.
+
+    Returns:
+        the matplotlib Figure (also saved to save_path unless it is None)
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # deferred: only rendering needs matplotlib
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(14, 5))
+    FigureCanvasAgg(fig)
+    ax1, ax2 = fig.subplots(1, 2)
+
+    # Plot 1: envelope, quantile bands, sample trajectories and mean
+    ax1.fill_between(data.x, data.minimum, data.maximum, color='blue', alpha=0.08, linewidth=0, label='Min / max')
+    levels = data.quantile_levels
+    for k in range(len(levels) // 2):
+        low, high = data.quantiles[k], data.quantiles[-1 - k]
+        ax1.fill_between(data.x, low, high, color='blue', alpha=0.12 + 0.1 * k, linewidth=0,
+                         label=f'{levels[k]*100:g}-{levels[-1 - k]*100:g}% band')
+    for traj_x, traj_y in zip(data.sample_x, data.sample_y):
+        ax1.plot(traj_x, traj_y, alpha=0.1, color='blue', linewidth=0.5)
+    ax1.plot(data.x, data.mean, color='red', linewidth=2, label='Mean')
+    ax1.axhline(y=0.75, color='black', linestyle='--', linewidth=1, label='Theoretical (0.75)')
+
+    ax1.set_xlabel('Iteration', fontsize=12)
+    ax1.set_ylabel('3D/4D Variance Ratio', fontsize=12)
+    ax1.set_title('Convergence to 0.75 Attractor', fontsize=14, fontweight='bold')
+    ax1.legend()
+    ax1.grid(alpha=0.3)
+    ax1.set_ylim([0.65, 0.85])
+
+    # Plot 2: Distribution at final iteration
+    edges = data.hist_edges
+    ax2.bar(edges[:-1], data.hist_counts, width=np.diff(edges), align='edge',
+            color='blue', alpha=0.7, edgecolor='black')
+    ax2.axvline(x=0.75, color='red', linestyle='--', linewidth=2, label='Theory (0.75)')
+    ax2.axvline(x=data.final_mean, color='green', linestyle='-', linewidth=2, label=f'Observed ({data.final_mean:.4f})')
+
+    ax2.set_xlabel('Final 3D/4D Ratio', fontsize=12)
+    ax2.set_ylabel('Frequency', fontsize=12)
+    ax2.set_title(f'Distribution After Convergence ({data.seeds} seeds)', fontsize=14, fontweight='bold')
+    ax2.legend()
+    ax2.grid(alpha=0.3)
+
+    fig.tight_layout()
+    if save_path is not None:
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+    return fig
+
+def _render_file(data: PlotData, save_path: str, dpi: int) -> str:
+    render_convergence(data, save_path, dpi)
+    return save_path
+
+def render_async(data: PlotData, save_path: str = 'convergence.png', dpi: int = 300) -> Future:
+    """
+    Render PlotData to save_path in the background render process.
+
+    Returns:
+        Future resolving to save_path once the file is written
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=1)
+        atexit.register(shutdown_renderer)
+    return _executor.submit(_render_file, data, save_path, dpi)
+
+def shutdown_renderer(wait: bool = True) -> None:
+    """Stop the background render process (pending renders finish first when wait)."""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        atexit.unregister(shutdown_renderer)
+        executor.shutdown(wait=wait)
@@ -0,0 +1,379 @@
+"""
+RESULT CACHE
+
+Memoizes engine calls on a canonical hash of
+
+    function (module + name), bound arguments (defaults applied),
+    code version (hash of every .py file next to this one + NumPy version)
+
+with two tiers:
+
+    in-process LRU      pickled results, bounded by entries and bytes
+    on-disk store       content-addressed <dir>/objects/<ab>/<key>.pkl,
+                        least recently used entries evicted past max_bytes
+                        (opt-in: only when URFE_CACHE_DIR or the CLI's
+                        --cache-dir names a directory)
+
+Results whose pickle would exceed max_entry_bytes (or the tier it would
+land in) are not cached at all; pickling stops as soon as the limit is
+crossed, so an oversized result never gets a second full copy in memory.
+
+Printed output of the first run is recorded and replayed on a hit, so a
+cached suite prints exactly what the original run printed. Only the
+calling thread's output is recorded; other threads printing meanwhile
+pass straight through.
+
+Only reproducible calls are cached: a call whose seed argument is None
+draws from the global np.random stream and always runs. Editing any engine
+file changes the code version and so invalidates every entry.
+
+Environment:
+    URFE_CACHE=0          disable caching
+    URFE_CACHE_DIR        enable the on-disk store in this directory (default: in-process only)
+    URFE_CACHE_BYTES      on-disk size limit (default 1 GiB)
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import io
+import json
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Largest pickled result worth caching
+MAX_ENTRY_BYTES = 64 << 20
+
+_code_version = None
+_default_cache = None
+_configured = False
+
+def code_version() -> str:
+    """Hash of the engine sources (every .py file in this directory) and the NumPy version."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(np.__version__.encode())
+        root = os.path.dirname(os.path.abspath(__file__))
+        for name in sorted(os.listdir(root)):
+            if name.endswith('.py'):
+                digest.update(name.encode())
+                with open(os.path.join(root, name), 'rb') as f:
+                    digest.update(f.read())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+def _canonical(value: Any) -> Any:
+    """JSON-serializable canonical form of an argument value."""
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        return {'ndarray': [str(data.dtype), list(data.shape), hashlib.sha256(data.tobytes()).hexdigest()]}
+    if isinstance(value, np.generic):
+        return _canonical(value.item())
+    if isinstance(value, np.dtype):
+        return {'dtype': value.name}
+    if isinstance(value, type) and issubclass(value, np.generic):
+        return {'dtype': np.dtype(value).name}
+    if isinstance(value, float):
+        return {'float': repr(value)}
+    if isinstance(value, (bool, int, str)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    return {'repr': repr(value)}
+
+def cache_key(fn: Callable, params: Dict[str, Any]) -> str:
+    """Canonical hash of a call (the same whether the engines run as urfe.* or as scripts)."""
+    module = fn.__module__
+    if __package__ and module.startswith(__package__ + '.'):
+        module = module[len(__package__) + 1:]
+    payload = {
+        'function': f"{module}.{fn.__qualname__}",
+        'params': _canonical(params),
+        'code': code_version()
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+class ResultCache:
+    """
+    Two-tier store of pickled results.
+
+    Args:
+        directory: On-disk store (None keeps the in-process tier only)
+        max_bytes: On-disk size limit
+        memory_entries: In-process LRU entry limit
+        memory_bytes: In-process LRU size limit
+        max_entry_bytes: Largest single entry stored
+
+    Safe to share between threads (sweeps driven from job executor threads).
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = 1 << 30,
+        memory_entries: int = 64,
+        memory_bytes: int = 256 << 20,
+        max_entry_bytes: int = MAX_ENTRY_BYTES
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.memory_bytes = memory_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+
+    def entry_limit(self) -> int:
+        """Size above which an entry would not be kept by any tier."""
+        tier = self.max_bytes if self.directory is not None else self.memory_bytes
+        return min(self.max_entry_bytes, tier)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, 'objects', key[:2], f"{key}.pkl")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Pickled entry for `key`, or None."""
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                return payload
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                payload = f.read()
+            os.utime(path)  # recency for eviction
+        except OSError:
+            return None
+        self._remember(key, payload)
+        return payload
+
+    def put(self, key: str, payload: bytes) -> None:
+        """Store a pickled entry in both tiers (entries above entry_limit() are dropped)."""
+        if len(payload) > self.entry_limit():
+            return
+        self._remember(key, payload)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, path)
+        with self._lock:
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            for path, _, _ in self._entries():
+                os.remove(path)
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.memory_bytes:
+            return
+        with self._lock:
+            if key in self._memory:
+                self._memory_size -= len(self._memory.pop(key))
+            self._memory[key] = payload
+            self._memory_size += len(payload)
+            while len(self._memory) > self.memory_entries or self._memory_size > self.memory_bytes:
+                _, dropped = self._memory.popitem(last=False)
+                self._memory_size -= len(dropped)
+
+    def _entries(self):
+        """(path, size, last use) of every on-disk entry."""
+        if self.directory is None:
+            return []
+        entries = []
+        for root, _, names in os.walk(os.path.join(self.directory, 'objects')):
+            for name in names:
+                if name.endswith('.pkl'):
+                    try:
+                        stat = os.stat(os.path.join(root, name))
+                    except FileNotFoundError:
+                        continue  # evicted by another process meanwhile
+                    entries.append((os.path.join(root, name), stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in sorted(entries, key=lambda e: e[2]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+def default_cache() -> Optional[ResultCache]:
+    """Process-wide cache configured from the environment (None when disabled)."""
+    global _default_cache, _configured
+    if not _configured:
+        _configured = True
+        if os.environ.get('URFE_CACHE', '1') != '0':
+            _default_cache = ResultCache(
+                directory=os.environ.get('URFE_CACHE_DIR') or None,
+                max_bytes=int(os.environ.get('URFE_CACHE_BYTES', 1 << 30))
+            )
+    return _default_cache
+
+def set_cache(cache: Optional[ResultCache]) -> None:
+    """Replace the process-wide cache (None disables caching)."""
+    global _default_cache, _configured
+    _default_cache = cache
+    _configured = True
+
+class _EntryTooLarge(Exception):
+    pass
+
+class _LimitedBuffer(io.BytesIO):
+    """Pickle target that gives up once `limit` bytes have been written."""
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+
+    def write(self, data) -> int:
+        if self.tell() + len(data) > self.limit:
+            raise _EntryTooLarge
+        return super().write(data)
+
+def _pickle_within(value: Any, limit: int) -> Optional[bytes]:
+    """Pickle of `value`, or None if it would exceed `limit` bytes."""
+    buffer = _LimitedBuffer(limit)
+    try:
+        pickle.dump(value, buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    except _EntryTooLarge:
+        return None
+    return buffer.getvalue()
+
+class _StdoutCapture:
+    """
+    sys.stdout stand-in that passes every write through to the stream it
+    replaced and also records it for the cached calls running on the
+    writing thread. Output of other threads (job executor threads, say)
+    is never recorded into an entry. Installed while at least one cached
+    call is running anywhere in the process.
+    """
+
+    _lock = threading.Lock()
+    _active = None
+    _users = 0
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def _buffers(self) -> List[io.StringIO]:
+        if not hasattr(self.local, 'buffers'):
+            self.local.buffers = []
+        return self.local.buffers
+
+    def write(self, text: str) -> int:
+        for buffer in self._buffers():
+            buffer.write(text)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    @classmethod
+    @contextlib.contextmanager
+    def recording(cls):
+        """Record this thread's output inside the block; yields the buffer."""
+        with cls._lock:
+            if cls._active is None:
+                cls._active = cls(sys.stdout)
+                sys.stdout = cls._active
+            cls._users += 1
+            capture = cls._active
+        buffer = io.StringIO()
+        capture._buffers().append(buffer)
+        try:
+            yield buffer
+        finally:
+            capture._buffers().remove(buffer)
+            with cls._lock:
+                cls._users -= 1
+                if not cls._users:
+                    if sys.stdout is capture:
+                        sys.stdout = capture.stream
+                    cls._active = None
+
+def cached(
+    seed: Optional[str] = 'entropy',
+    ignore: Sequence[str] = (),
+    bypass: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+) -> Callable:
+    """
+    Memoize an engine function in the default cache.
+
+    Args:
+        seed: Argument holding the root seed; calls with seed None run
+              uncached (None: the function is deterministic)
+        ignore: Arguments that do not affect the result (workers, checkpoints)
+        bypass: Predicate on the bound arguments forcing an uncached run
+        normalize: Rewrites the bound arguments before keying (e.g. resolves
+                   an 'auto' option), so the key names what actually runs
+
+    The undecorated function stays available as `fn.uncached`.
+    """
+    def decorate(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = default_cache()
+            if cache is None:
+                return fn(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if normalize is not None:
+                bound.arguments.update(normalize(dict(bound.arguments)))
+                args, kwargs = bound.args, bound.kwargs
+            params = dict(bound.arguments)
+            if (seed is not None and params.get(seed) is None) or (bypass is not None and bypass(params)):
+                return fn(*args, **kwargs)
+
+            key = cache_key(fn, {k: v for k, v in params.items() if k not in ignore})
+            payload = cache.get(key)
+            if payload is not None:
+                entry = pickle.loads(payload)
+                sys.stdout.write(entry['stdout'])
+                return entry['result']
+
+            with _StdoutCapture.recording() as output:
+                result = fn(*args, **kwargs)
+            try:
+                payload = _pickle_within({'result': result, 'stdout': output.getvalue()}, cache.entry_limit())
+                if payload is not None:
+                    cache.put(key, payload)
+            except (pickle.PicklingError, TypeError, AttributeError, OSError):
+                pass  # unpicklable result or unwritable store: just don't cache
+            return result
+
+        wrapper.uncached = fn
+        return wrapper
+    return decorate
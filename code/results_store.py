@@ -0,0 +1,322 @@
+"""
+RESULT RECORDS AND STORE
+
+Engines return slotted dataclass records (declared with @record) instead
+of printing or hand-formatting their results. A ResultsStore appends
+records from any number of runs in a compact columnar binary form, and
+reports are rendered from the records afterwards:
+
+    store = ResultsStore('results/')
+    store.append(run_goldilocks_audit(seeds=50, entropy=1))
+    ...
+    columns = store.columns(GoldilocksResult)       # one array per field, all runs
+    print(render_markdown(store.latest(FortressResults)))
+
+Layout:
+    <root>/<RecordType>/part-<time>-<pid>-<n>.npz
+
+Every append writes one new part (atomically, so concurrent writers never
+collide) holding the appended records of one type column by column:
+
+    scalar field     one array with one entry per record
+                     (<field>.null marks None values of optional fields)
+    array field      <field>.values (all records' values concatenated),
+                     <field>.offsets, <field>.shapes and <field>.ndims to
+                     split them again (and <field>.null); parts that stored
+                     the field as scalars merge with array parts
+    _time            append time of each record (unix seconds)
+
+compact() merges the parts of a type into one, so stores that have
+collected tens of thousands of small appends still load in one read.
+Fields declared with field(metadata={'store': False}) (e.g. full
+trajectories) stay in memory only and load back as None.
+"""
+
+import dataclasses
+import importlib
+import itertools
+import json
+import os
+import sys
+import time
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Record classes by store name (filled by @record)
+RECORD_TYPES: Dict[str, type] = {}
+
+_part_counter = itertools.count()
+
+# =============================================================================
+# RECORDS
+# =============================================================================
+
+def _module_name(cls: type) -> str:
+    """
+    Importable module of a class or function (a script run as __main__ is
+    named by its file). Engine modules are named without the package prefix
+    so the name resolves whether they were loaded as urfe.<module> or flat.
+    """
+    module = cls.__module__
+    if __package__ and module.startswith(__package__ + '.'):
+        return module[len(__package__) + 1:]
+    if module != '__main__':
+        return module
+    main = getattr(sys.modules['__main__'], '__file__', None)
+    return os.path.splitext(os.path.basename(main))[0] if main else '__main__'
+
+def import_module(name: str):
+    """Import a module named by _module_name (an engine module relative to this package)."""
+    if __package__ and os.path.exists(os.path.join(os.path.dirname(os.path.abspath(__file__)), name + '.py')):
+        return importlib.import_module(f'.{name}', __package__)
+    return importlib.import_module(name)
+
+def record(cls: type) -> type:
+    """
+    Class decorator: a dataclass with __slots__ (what dataclass(slots=True)
+    does on Python >= 3.10, built here so older versions get it too),
+    registered so a ResultsStore can rebuild it.
+    """
+    cls = dataclasses.dataclass(cls)
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names + ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    RECORD_TYPES[cls.__name__] = slotted
+    return slotted
+
+def _stored_fields(cls: type) -> List[dataclasses.Field]:
+    return [f for f in dataclasses.fields(cls) if f.metadata.get('store', True)]
+
+def _resolve_type(name: str, module: str) -> type:
+    if name not in RECORD_TYPES:
+        import_module(module)
+    return RECORD_TYPES[name]
+
+def _plain(value: Any) -> Any:
+    """JSON-ready form of a field value."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+def as_dict(result: Any) -> Dict[str, Any]:
+    """Stored fields of a record as plain Python values."""
+    return {f.name: _plain(getattr(result, f.name)) for f in _stored_fields(type(result))}
+
+def open_store(store: Union[str, 'ResultsStore']) -> 'ResultsStore':
+    """A ResultsStore, or the store at a directory path."""
+    return store if isinstance(store, ResultsStore) else ResultsStore(store)
+
+# =============================================================================
+# RENDERERS
+# =============================================================================
+
+def render_markdown(result: Any) -> str:
+    """Markdown report of a record (its markdown() method, else a field table)."""
+    if hasattr(result, 'markdown'):
+        return result.markdown()
+    lines = [f"# {type(result).__name__}\n", "| Field | Value |", "|-------|-------|"]
+    for name, value in as_dict(result).items():
+        if isinstance(value, float):
+            value = f"{value:.8g}"
+        lines.append(f"| {name} | {value} |")
+    return "\n".join(lines) + "\n"
+
+def render_json(result: Any) -> str:
+    """JSON report of a record (its json_dict() method, else its stored fields)."""
+    payload = result.json_dict() if hasattr(result, 'json_dict') else as_dict(result)
+    return json.dumps(_plain(payload), indent=4)
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def _encode(fields: List[dataclasses.Field], records: List[Any]) -> Dict[str, np.ndarray]:
+    """Column arrays of `records` (see module docstring)."""
+    columns = {'_time': np.full(len(records), time.time())}
+    for f in fields:
+        values = [getattr(r, f.name) for r in records]
+        if all(v is None or np.ndim(v) == 0 for v in values):
+            null = np.array([v is None for v in values])
+            present = [v for v in values if v is not None]
+            filler = present[0] if present else 0
+            columns[f.name] = np.asarray([filler if v is None else v for v in values])
+            if null.any():
+                columns[f'{f.name}.null'] = null
+        else:
+            null = np.array([v is None for v in values])
+            ndim = max(np.ndim(v) for v in values if v is not None)
+            arrays = [np.zeros((0,) * ndim) if v is None else np.asarray(v) for v in values]
+            columns[f'{f.name}.values'] = np.concatenate([a.ravel() for a in arrays])
+            columns[f'{f.name}.offsets'] = np.cumsum([0] + [a.size for a in arrays])
+            columns[f'{f.name}.shapes'] = _shapes([a.shape for a in arrays], ndim)
+            columns[f'{f.name}.ndims'] = np.array([a.ndim for a in arrays], dtype=np.int64)
+            if null.any():
+                columns[f'{f.name}.null'] = null
+    return columns
+
+def _shapes(shapes: List[Tuple[int, ...]], ndim: int) -> np.ndarray:
+    """(records, ndim) shape table, lower-dimensional shapes padded with leading 1s."""
+    return np.array([(1,) * (ndim - len(shape)) + tuple(shape) for shape in shapes], dtype=np.int64).reshape(-1, ndim)
+
+def _as_array_columns(name: str, part: Dict[str, np.ndarray]) -> None:
+    """Re-encode a part's scalar column `name` in the array-field layout (in place)."""
+    column = part.pop(name)
+    part[f'{name}.values'] = column.ravel()
+    part[f'{name}.offsets'] = np.arange(len(column) + 1)
+    part[f'{name}.shapes'] = np.zeros((len(column), 0), dtype=np.int64)
+    part[f'{name}.ndims'] = np.zeros(len(column), dtype=np.int64)
+
+def _decode(name: str, data: Dict[str, np.ndarray]) -> Any:
+    """One field's column: an array for scalar fields, a list of arrays otherwise."""
+    if name in data:
+        column = data[name]
+        if f'{name}.null' not in data:
+            return column
+        values = column.astype(object)
+        values[data[f'{name}.null']] = None
+        return values
+    if f'{name}.values' in data:
+        values, offsets, shapes = data[f'{name}.values'], data[f'{name}.offsets'], data[f'{name}.shapes']
+        ndims = data.get(f'{name}.ndims', np.full(len(shapes), shapes.shape[1]))
+        arrays = [values[lo:hi].reshape(shape[len(shape) - ndim:])
+                  for lo, hi, shape, ndim in zip(offsets[:-1], offsets[1:], shapes, ndims)]
+        null = data.get(f'{name}.null')
+        return arrays if null is None else [None if missing else a for a, missing in zip(arrays, null)]
+    return None
+
+class ResultsStore:
+    """
+    Append-only columnar store of result records (see module docstring).
+
+    Args:
+        root: Store directory (created on first append)
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _dir(self, cls: Union[type, str]) -> str:
+        return os.path.join(self.root, cls if isinstance(cls, str) else cls.__name__)
+
+    def _parts(self, cls: Union[type, str]) -> List[str]:
+        path = self._dir(cls)
+        if not os.path.isdir(path):
+            return []
+        return [os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.startswith('part-') and name.endswith('.npz')]
+
+    def _write(self, cls: type, columns: Dict[str, np.ndarray]) -> None:
+        path = self._dir(cls)
+        os.makedirs(path, exist_ok=True)
+        name = f"part-{time.time_ns():020d}-{os.getpid()}-{next(_part_counter)}"
+        tmp = os.path.join(path, f".{name}.tmp.npz")
+        np.savez(tmp, __type__=np.array([cls.__name__, _module_name(cls)]), **columns)
+        os.replace(tmp, os.path.join(path, f"{name}.npz"))
+
+    def append(self, *results: Any) -> None:
+        """Append records (one part per record type)."""
+        by_type: Dict[type, List[Any]] = {}
+        for result in results:
+            if not dataclasses.is_dataclass(result) or type(result).__name__ not in RECORD_TYPES:
+                raise TypeError(f"not a result record: {type(result).__name__}")
+            by_type.setdefault(type(result), []).append(result)
+        for cls, records in by_type.items():
+            self._write(cls, _encode(_stored_fields(cls), records))
+
+    def types(self) -> List[str]:
+        """Names of the record types in the store."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root) if self._parts(name))
+
+    def _load(self, cls: Union[type, str]) -> Optional[Dict[str, np.ndarray]]:
+        """Concatenated raw columns of every part."""
+        parts = []
+        for path in self._parts(cls):
+            with np.load(path) as data:
+                parts.append({name: data[name] for name in data.files})
+        if not parts:
+            return None
+        arrays = {name.partition('.')[0] for part in parts for name in part if name.endswith('.values')}
+        for part in parts:
+            for name in arrays & set(part):
+                _as_array_columns(name, part)
+        merged = {'__type__': parts[0]['__type__']}
+        names = set().union(*parts) - {'__type__'}
+        for name in sorted(names):
+            field, _, kind = name.partition('.')
+            if kind == 'shapes':
+                ndim = max(part[name].shape[1] for part in parts if name in part)
+                merged[name] = np.concatenate([_shapes(part[name], ndim) for part in parts if name in part])
+            elif kind == 'ndims':
+                merged[name] = np.concatenate([
+                    part[name] if name in part else np.full(len(part['_time']), part[f'{field}.shapes'].shape[1])
+                    for part in parts if f'{field}.shapes' in part
+                ])
+            elif kind == 'offsets':
+                chunks, base = [], 0
+                for part in parts:
+                    offsets = part[name] if name in part else np.zeros(1, dtype=int)
+                    chunks.append(offsets[:-1] + base)
+                    base += offsets[-1]
+                merged[name] = np.concatenate(chunks + [np.array([base])])
+            elif kind == 'null':
+                merged[name] = np.concatenate([part.get(name, np.zeros(len(part['_time']), dtype=bool)) for part in parts])
+            else:
+                merged[name] = np.concatenate([part[name] for part in parts if name in part])
+        return merged
+
+    def columns(self, cls: Union[type, str]) -> Dict[str, Any]:
+        """
+        Every appended record of a type, column by column: arrays for scalar
+        fields (object arrays where some values are None), lists of arrays for
+        array fields, plus _time.
+        """
+        data = self._load(cls)
+        if data is None:
+            return {}
+        cls = _resolve_type(*data['__type__'])
+        columns = {'_time': data['_time']}
+        for f in _stored_fields(cls):
+            columns[f.name] = _decode(f.name, data)
+        return columns
+
+    def records(self, cls: Union[type, str]) -> List[Any]:
+        """Every appended record of a type, rebuilt (unstored fields are None)."""
+        data = self._load(cls)
+        if data is None:
+            return []
+        cls = _resolve_type(*data['__type__'])
+        stored = {f.name: _decode(f.name, data) for f in _stored_fields(cls)}
+        results = []
+        for i in range(len(data['_time'])):
+            values = {}
+            for f in dataclasses.fields(cls):
+                column = stored.get(f.name)
+                value = None if column is None else column[i]
+                values[f.name] = value.item() if isinstance(value, np.generic) else value
+            results.append(cls(**values))
+        return results
+
+    def latest(self, cls: Union[type, str]) -> Optional[Any]:
+        """Most recently appended record of a type."""
+        results = self.records(cls)
+        return results[-1] if results else None
+
+    def compact(self, cls: Optional[Union[type, str]] = None) -> None:
+        """Merge the parts of one type (default: every type) into a single part."""
+        for name in ([cls] if cls is not None else self.types()):
+            parts = self._parts(name)
+            if len(parts) < 2:
+                continue
+            data = self._load(name)
+            record_cls = _resolve_type(*data.pop('__type__'))
+            self._write(record_cls, data)
+            for path in parts:
+                os.remove(path)
@@ -0,0 +1,118 @@
+"""
+SEQUENTIAL SAMPLING
+
+Adds seed batches until a statistic is resolved instead of running a
+fixed seed count:
+
+    sampler = SequentialSampler(_null_chunk, entropy=7, particles=10000)
+    sampler.grow_to(32)
+    while sampler.sem > 1e-4 and sampler.n < 1000:
+        sampler.grow_to(next_size(sampler.n, sampler.seeds_for(1e-4), 1000))
+
+Seeds are appended in index order (0, 1, 2, ...) and every seed has its
+own random stream, so the first n seeds of a sequential run are exactly
+the seeds a fixed run of n would use; stopping early only decides how many.
+
+Stopping is checked after each batch and batches grow towards the sample
+size the current variance estimate predicts, at most doubling per round,
+so a tight distribution stops after a few small batches.
+"""
+
+import math
+import numpy as np
+from typing import Any, Callable, Optional, Tuple
+
+if __package__:
+    from .parallel_sweep import iter_seed_sweep
+else:
+    from parallel_sweep import iter_seed_sweep
+
+# Smallest sample the variance estimate is trusted at
+MIN_SEEDS = 16
+
+class SequentialSampler:
+    """
+    Per-seed values of a seed sweep task, extended on demand.
+
+    Args:
+        task: Sweep task task(start, stop, **kwargs) (see parallel_sweep)
+        pick: Extracts the (stop - start,) per-seed values from a task result
+        workers: Worker processes per batch
+        chunk_size: Seeds per task (default: ~4 chunks per worker and batch)
+        **kwargs: Forwarded to every task call
+    """
+
+    def __init__(
+        self,
+        task: Callable[..., Any],
+        pick: Optional[Callable] = None,
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
+        **kwargs
+    ):
+        self.task = task
+        self.pick = pick
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.kwargs = kwargs
+        self.values = np.empty(0)
+        self.batches = 0
+
+    @property
+    def n(self) -> int:
+        return len(self.values)
+
+    def grow_to(self, seeds: int) -> None:
+        """Run seeds n .. seeds - 1."""
+        if seeds <= self.n:
+            return
+        chunks = [self.values]
+        for _, _, result in iter_seed_sweep(
+            self.task, seeds, workers=self.workers, chunk_size=self.chunk_size, first=self.n, **self.kwargs
+        ):
+            chunks.append(np.asarray(self.pick(result) if self.pick else result, dtype=np.float64))
+        self.values = np.concatenate(chunks)
+        self.batches += 1
+
+    @property
+    def mean(self) -> float:
+        return float(np.mean(self.values))
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (np.std, as the engines report it)."""
+        return float(np.std(self.values))
+
+    @property
+    def sem(self) -> float:
+        """Standard error of the mean (sample std / sqrt(n))."""
+        if self.n < 2:
+            return math.inf
+        return float(np.std(self.values, ddof=1) / math.sqrt(self.n))
+
+    def ci(self, z: float = 1.96) -> Tuple[float, float]:
+        """Normal confidence interval of the mean."""
+        return self.mean - z * self.sem, self.mean + z * self.sem
+
+    def seeds_for(self, target_sem: float) -> int:
+        """Sample size at which the SEM would reach target_sem (current variance estimate)."""
+        if self.n < 2:
+            return MIN_SEEDS
+        return math.ceil(np.var(self.values, ddof=1) / target_sem ** 2)
+
+def next_size(n: int, needed: int, max_seeds: int, batch: int = MIN_SEEDS) -> int:
+    """Next sample size: towards `needed`, at least one batch more, at most double, within budget."""
+    return min(max_seeds, max(n + batch, min(needed, 2 * n)))
+
+def separation_stderr(separation: float, observed_sem: float, null_sem: float, null_std: float, null_n: int) -> float:
+    """
+    Standard error of the sigma separation S = |observed mean - null mean| / null std.
+
+    Combines both means' SEMs with the uncertainty of the null std itself
+    (SE(std) ~ std / sqrt(2 (n - 1))):
+
+        SE_S^2 = (SE_obs^2 + SE_null^2) / std_null^2 + S^2 / (2 (n_null - 1))
+    """
+    if null_n < 2:
+        return math.inf
+    return math.sqrt((observed_sem ** 2 + null_sem ** 2) / null_std ** 2 + separation ** 2 / (2 * (null_n - 1)))
@@ -0,0 +1,244 @@
+"""
+SHARED-MEMORY PARTICLE STATE
+
+One huge simulation spread over every core without copying the particles:
+
+    with SharedParticles(10**8, workers=8, entropy=7) as state:
+        for i in range(iterations):
+            count, mean, m2 = state.step()
+        ratio = variance_ratio(count, m2)
+
+The (particles, 4) state lives in a multiprocessing.shared_memory block
+that the parent and a pool of worker processes map at the same time (at
+10^8 particles it is 3.2 GB in float64, which could never be pickled to
+a worker). The particle axis is cut into a fixed grid of slabs of
+slab_rows rows. Each iteration is one barrier:
+
+    parent   -> workers   slab indices (a few bytes per slab)
+    workers               sine-map step + moments of their slabs, in place
+    workers  -> parent    per-slab (mean, M2) of the 4 dimensions
+    parent                Chan merge of the slabs in slab order
+
+Slabs are initialized by the workers as well, each from its own stream
+SeedSequence(entropy, spawn_key=(SHARED_STREAM, particles, slab)). Since
+the slab grid, the streams and the merge order do not depend on the
+worker count, every worker count produces bit-identical moments.
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+if __package__:
+    from .convergence import ConvergenceTracker
+    from .metrics import get_metrics
+    from .parallel_sweep import default_workers, resolve_entropy
+    from .sine_kernels import DEFAULT_BLOCK_ROWS, block_moments, sine_step, variance_ratio
+else:
+    from convergence import ConvergenceTracker
+    from metrics import get_metrics
+    from parallel_sweep import default_workers, resolve_entropy
+    from sine_kernels import DEFAULT_BLOCK_ROWS, block_moments, sine_step, variance_ratio
+
+# Random stream id of the slabs (see parallel_sweep.seed_rng)
+SHARED_STREAM = 5
+# Rows per slab (a multiple of the kernels' block size; 2^20 x 4 float64 = 32 MiB)
+SLAB_ROWS = 512 * DEFAULT_BLOCK_ROWS
+# Below this many particles the shared mode is not worth its process start-up
+SHARED_MIN_PARTICLES = 4 * SLAB_ROWS
+
+# =============================================================================
+# WORKER SIDE
+# =============================================================================
+
+_state = None  # (SharedMemory, (particles, 4) view) attached in each worker
+
+def _attach(name: str, particles: int, dtype: str) -> None:
+    """Pool initializer: map the shared block once per worker process."""
+    global _state
+    # Pool workers share the parent's resource tracker, which already owns
+    # the block: attaching re-registers the same name and the parent's
+    # unlink() releases it once
+    block = shared_memory.SharedMemory(name=name)
+    _state = block, np.ndarray((particles, 4), dtype=dtype, buffer=block.buf)
+
+def _slab(slab: int, slab_rows: int) -> np.ndarray:
+    data = _state[1]
+    return data[slab * slab_rows:(slab + 1) * slab_rows]
+
+def _init_slab(slab: int, slab_rows: int, entropy: int, scales: np.ndarray) -> None:
+    view = _slab(slab, slab_rows)
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(SHARED_STREAM, len(_state[1]), slab)))
+    np.multiply(rng.normal(0, 1, view.shape), scales, out=view)
+
+def _step_slab(slab: int, slab_rows: int, steps: int, gain: float) -> Tuple[np.ndarray, np.ndarray]:
+    """`steps` in-place sine-map steps (the last fused with the moments) and the slab's (mean, M2)."""
+    view = _slab(slab, slab_rows)
+    if steps > 1:
+        sine_step(view, steps - 1, gain=gain)
+    _, mean, m2 = block_moments(view, step=steps > 0, gain=gain)
+    return mean, m2
+
+# =============================================================================
+# PARENT SIDE
+# =============================================================================
+
+def merge_moments(counts: np.ndarray, means: np.ndarray, m2s: np.ndarray) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Chan et al. merge of per-slab moments, in order.
+
+    Args:
+        counts: (slabs,) rows per slab
+        means, m2s: (slabs, dims) per-slab means and sums of squared deviations
+
+    Returns:
+        count, mean, m2 of the whole state
+    """
+    count, mean, m2 = 0, np.zeros(means.shape[1]), np.zeros(means.shape[1])
+    for n_b, mean_b, m2_b in zip(counts, means, m2s):
+        n = count + n_b
+        delta = mean_b - mean
+        mean = mean + delta * (n_b / n)
+        m2 = m2 + m2_b + delta * delta * (count * n_b / n)
+        count = n
+    return count, mean, m2
+
+class SharedParticles:
+    """
+    (particles, 4) particle state in shared memory, stepped by a pool of
+    worker processes (see module docstring). Use as a context manager, or
+    call close() to stop the workers and release the block.
+
+    Args:
+        particles: Number of particles
+        workers: Worker processes (0 = all cores)
+        entropy: Root seed of the slab streams (None: fresh entropy, kept in .entropy)
+        scales: Per-dimension standard deviation of the initial state
+        dtype: Storage type (float32 halves memory; moments stay float64)
+        slab_rows: Rows per slab (fixes the slab grid, and so the exact result)
+        gain: Sine-map gain
+    """
+
+    def __init__(
+        self,
+        particles: int,
+        workers: int = 0,
+        entropy: Optional[int] = None,
+        scales: Optional[np.ndarray] = None,
+        dtype=np.float64,
+        slab_rows: int = SLAB_ROWS,
+        gain: float = np.pi
+    ):
+        self.particles = particles
+        self.dtype = np.dtype(dtype).name
+        self.slab_rows = max(1, slab_rows)
+        self.slabs = -(-particles // self.slab_rows)
+        self.counts = np.minimum(self.slab_rows, particles - self.slab_rows * np.arange(self.slabs))
+        self.entropy = resolve_entropy(entropy)
+        self.gain = gain
+        self.workers = min(workers or default_workers(), self.slabs)
+
+        nbytes = particles * 4 * np.dtype(self.dtype).itemsize
+        self._block = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+        self._pool = None
+        try:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_attach, initargs=(self._block.name, particles, self.dtype)
+            )
+            scales = np.ones(4) if scales is None else np.asarray(scales, dtype=np.float64)
+            with get_metrics().timer('rng'):
+                list(self._pool.map(_init_slab, range(self.slabs), *self._args(self.entropy, scales),
+                                    chunksize=self._chunksize()))
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def data(self) -> np.ndarray:
+        """Zero-copy view of the state in this process."""
+        return np.ndarray((self.particles, 4), dtype=self.dtype, buffer=self._block.buf)
+
+    def _args(self, *values):
+        return [[value] * self.slabs for value in (self.slab_rows,) + values]
+
+    def _chunksize(self) -> int:
+        return max(1, self.slabs // (4 * self.workers))
+
+    def _reduce(self, steps: int) -> Tuple[int, np.ndarray, np.ndarray]:
+        results = list(self._pool.map(_step_slab, range(self.slabs), *self._args(steps, self.gain),
+                                      chunksize=self._chunksize()))
+        means = np.array([mean for mean, _ in results])
+        m2s = np.array([m2 for _, m2 in results])
+        return merge_moments(self.counts, means, m2s)
+
+    def moments(self) -> Tuple[int, np.ndarray, np.ndarray]:
+        """Per-dimension count, mean and M2 of the current state."""
+        return self._reduce(0)
+
+    def step(self, steps: int = 1) -> Tuple[int, np.ndarray, np.ndarray]:
+        """
+        `steps` sine-map steps of every slab in place; returns the new moments.
+
+        The slabs are independent between moment reductions, so several
+        steps cost a single barrier (and a single moment pass).
+        """
+        return self._reduce(steps)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def evolve_shared(
+    particles: int,
+    iterations: int,
+    workers: int = 0,
+    entropy: Optional[int] = None,
+    converge: Optional[int] = None,
+    max_period: int = 0,
+    dtype=np.float64,
+    scales: Optional[np.ndarray] = None,
+    slab_rows: int = SLAB_ROWS
+) -> Tuple[float, int]:
+    """
+    Evolve one shared-memory state of `particles` particles across `workers`
+    processes (the multi-core counterpart of _evolve_single).
+
+    Without converge each slab runs all iterations between two barriers;
+    with converge=K the moments are reduced every iteration and the run
+    stops once the ratio has stayed within ±0.001 of 0.75 for K consecutive
+    iterations (or the moments repeat with period <= max_period).
+
+    Returns:
+        final 3D/4D ratio, iterations actually run
+    """
+    metrics = get_metrics()
+    with SharedParticles(particles, workers, entropy, scales, dtype, slab_rows) as state:
+        if not converge or not iterations:
+            # Only the final moments are needed: every slab runs all iterations in one barrier
+            count, _, m2 = state.step(iterations)
+            if metrics.enabled:
+                metrics.count('iterations', iterations)
+            return float(variance_ratio(count, m2)), iterations
+
+        tracker = ConvergenceTracker(1, converge, target=0.75, max_period=max_period)
+        for i in range(iterations):
+            count, mean, m2 = state.step()
+            ratio = float(variance_ratio(count, m2))
+            if metrics.enabled:
+                metrics.count('iterations')
+                metrics.progress('shared', i + 1, iterations)
+            if tracker.update(i, [ratio], state=np.concatenate([mean, m2])).any():
+                return ratio, i + 1
+    return ratio, iterations
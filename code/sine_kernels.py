@@ -0,0 +1,184 @@
+"""
+SINE-MAP KERNELS
+
+Shared low-level kernels for the particle engines:
+
+* sine_step          - in-place recursive sine-map update (no temporaries)
+* sine_step_moments  - fused sine-map update + per-dimension moments
+* block_moments      - per-dimension moments of an existing state
+* evolve_moments     - run N in-place steps, fusing the last with the moments
+* variance_ratio     - 3D/4D projection ratio from the accumulated moments
+
+The particle state is walked in small cache-resident tiles. Each tile is
+stepped and immediately reduced to (count, mean, M2) while it is still in
+cache, and the tiles are merged with Chan's parallel Welford update. This
+replaces the separate np.var pass (and its temporaries) of the original
+engines and stays accurate for million-particle states.
+
+Tiles always split the particle axis at the same block_rows boundaries,
+so the moments of one seed do not depend on how many seeds share a batch.
+
+The map gain (pi) may be given per seed, so a batch can hold seeds of
+different parameter points (see param_sweep.py).
+
+The state may be stored as float32 (mixed precision): the map itself then
+runs in float32, but every moment is accumulated in float64.
+"""
+
+import time
+import numpy as np
+from typing import Tuple, Union
+
+if __package__:
+    from .metrics import get_metrics
+else:
+    from metrics import get_metrics
+
+# Rows of one seed reduced together (2048 x 4 float64 = 64 KiB)
+DEFAULT_BLOCK_ROWS = 2048
+# Upper bound on one tile (seeds x block_rows x dims), sized for L2
+DEFAULT_TILE_BYTES = 1 << 20
+
+def _as_batch(data: np.ndarray) -> np.ndarray:
+    """View (particles, dims) or (..., particles, dims) state as (seeds, particles, dims)."""
+    if data.ndim < 2:
+        raise ValueError("particle state must have shape (..., particles, dims)")
+    batch = data.reshape((-1,) + data.shape[-2:])
+    if not np.shares_memory(batch, data):
+        raise ValueError("particle state must be contiguous to be updated in place")
+    return batch
+
+def _seed_gain(gain: Union[float, np.ndarray], batch: np.ndarray) -> Union[float, np.ndarray]:
+    """Scalar gain as is; per-seed gains as a (seeds, 1, 1) column in the state's dtype."""
+    if np.ndim(gain) == 0:
+        return gain
+    return np.asarray(gain, dtype=batch.dtype).reshape(-1, 1, 1)
+
+def sine_step(data: np.ndarray, steps: int = 1, gain: Union[float, np.ndarray] = np.pi) -> np.ndarray:
+    """
+    Apply data <- sin(gain * data) `steps` times in place.
+
+    Equivalent to `data = np.sin(data * np.pi)` but without allocating
+    two temporaries per iteration. `gain` is a scalar or one value per seed.
+    """
+    metrics = get_metrics()
+    if metrics.enabled:
+        started = time.perf_counter()
+    if np.ndim(gain):
+        data = _as_batch(data)
+        gain = _seed_gain(gain, data)
+    for _ in range(steps):
+        np.multiply(data, gain, out=data)
+        np.sin(data, out=data)
+    if metrics.enabled and steps > 0:
+        metrics.add_time('sine_step', time.perf_counter() - started)
+    return data
+
+def block_moments(
+    data: np.ndarray,
+    step: bool = False,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    tile_bytes: int = DEFAULT_TILE_BYTES,
+    gain: Union[float, np.ndarray] = np.pi
+) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Per-dimension moments of a particle state in one tiled pass.
+
+    Args:
+        data: (particles, dims) or (..., particles, dims) particle state
+              (float64, or float32 with float64 accumulation)
+        step: Apply one in-place sine-map update to each tile before reducing it
+        block_rows: Rows per tile along the particle axis
+        tile_bytes: Memory budget for one tile (seeds are grouped to fit)
+        gain: Map gain of the step, a scalar or one value per seed
+
+    Returns:
+        count, mean, m2 where mean and m2 have shape (..., dims) and
+        m2 / count is the population variance (np.var with ddof=0)
+    """
+    batch = _as_batch(data)
+    seeds, particles, dims = batch.shape
+    gain = _seed_gain(gain, batch)
+    per_seed = np.ndim(gain) > 0
+
+    block_rows = max(1, min(block_rows, particles))
+    group = max(1, min(seeds, tile_bytes // (block_rows * dims * 8)))
+
+    mean = np.zeros((seeds, dims))
+    m2 = np.zeros((seeds, dims))
+    scratch = np.empty((group, block_rows, dims))
+    metrics = get_metrics()
+    timed = metrics.enabled
+    stepped = reduced = 0.0
+
+    for s0 in range(0, seeds, group):
+        s1 = min(s0 + group, seeds)
+        tile_gain = gain[s0:s1] if per_seed else gain
+        count = 0
+        for r0 in range(0, particles, block_rows):
+            r1 = min(r0 + block_rows, particles)
+            tile = batch[s0:s1, r0:r1]
+            if timed:
+                t0 = time.perf_counter()
+            if step:
+                np.multiply(tile, tile_gain, out=tile)
+                np.sin(tile, out=tile)
+                if timed:
+                    t1 = time.perf_counter()
+                    stepped += t1 - t0
+                    t0 = t1
+
+            # Two-pass moments of the cache-resident tile
+            n_b = r1 - r0
+            tile_mean = tile.sum(axis=1, dtype=np.float64) / n_b
+            dev = scratch[:s1 - s0, :n_b]
+            np.subtract(tile, tile_mean[:, None, :], out=dev)
+            np.square(dev, out=dev)
+            tile_m2 = dev.sum(axis=1)
+
+            # Chan et al. parallel merge into the running moments
+            n = count + n_b
+            delta = tile_mean - mean[s0:s1]
+            mean[s0:s1] += delta * (n_b / n)
+            m2[s0:s1] += tile_m2 + delta * delta * (count * n_b / n)
+            count = n
+            if timed:
+                reduced += time.perf_counter() - t0
+
+    if timed:
+        if step:
+            metrics.add_time('sine_step', stepped)
+        metrics.add_time('moments', reduced)
+    out_shape = data.shape[:-2] + (dims,)
+    return particles, mean.reshape(out_shape), m2.reshape(out_shape)
+
+def sine_step_moments(data: np.ndarray, **kwargs) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Fused in-place sine-map step + per-dimension moments (see block_moments)."""
+    return block_moments(data, step=True, **kwargs)
+
+def evolve_moments(data: np.ndarray, iterations: int, **kwargs) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Run `iterations` sine-map steps in place and return the final moments.
+
+    The last step is fused with the moment pass, so the state is read
+    once per iteration and never copied.
+    """
+    if iterations <= 0:
+        return block_moments(data, **kwargs)
+    sine_step(data, iterations - 1, gain=kwargs.get('gain', np.pi))
+    return sine_step_moments(data, **kwargs)
+
+def variance_ratio(count: int, m2: np.ndarray, observed: int = 3, floor: float = 1e-10) -> np.ndarray:
+    """
+    3D/4D variance ratio from accumulated moments.
+
+    Args:
+        count: Number of particles the moments were gathered over
+        m2: (..., dims) sums of squared deviations
+        observed: Number of leading (observable) dimensions
+        floor: Total variance below which the state counts as converged (0.75)
+    """
+    var_total = np.sum(m2, axis=-1) / count
+    var_observed = np.sum(m2[..., :observed], axis=-1) / count
+    safe_total = np.where(var_total > floor, var_total, 1.0)
+    return np.where(var_total > floor, var_observed / safe_total, 0.75)
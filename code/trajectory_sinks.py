@@ -0,0 +1,200 @@
+"""
+TRAJECTORY SINKS
+
+Per-iteration ratio trajectories of a seed sweep are streamed into a sink
+one block at a time (a block is the (seeds, iterations) trajectories of a
+contiguous seed range, delivered in seed order). A sweep therefore never
+has to hold every trajectory in RAM as float64, let alone twice.
+
+Backends:
+    MemorySink  - one preallocated (seeds, iterations) array, float32 by default
+    MemmapSink  - the same array as a .npy file on disk, flushed block by block
+    ReduceSink  - keeps no full trajectory matrix: running per-iteration
+                  mean / variance / min / max, every final value, and the first
+                  `sample` trajectories (seeds are i.i.d., so these are an
+                  unbiased sample for quantiles and plotting)
+
+summarize() reduces any sink (or a plain trajectory array) to a
+TrajectorySummary, which is all visualize_convergence needs.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Union
+
+# Seeds per block when an existing trajectory array is reduced
+SUMMARY_BLOCK_SEEDS = 4096
+
+class TrajectorySink:
+    """
+    Destination for the trajectories of a seed sweep.
+
+    The sweep calls open(seeds, iterations) once, write(start, block) for
+    consecutive seed blocks, then close(); result() is what the sweep returns.
+    """
+
+    def open(self, seeds: int, iterations: int) -> None:
+        self.seeds = seeds
+        self.iterations = iterations
+
+    def write(self, start: int, block: np.ndarray) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def result(self) -> Any:
+        return self
+
+class MemorySink(TrajectorySink):
+    """All trajectories in one in-memory array of the given dtype."""
+
+    def __init__(self, dtype=np.float32):
+        self.dtype = np.dtype(dtype)
+        self.trajectories = None
+
+    def open(self, seeds: int, iterations: int) -> None:
+        super().open(seeds, iterations)
+        self.trajectories = np.empty((seeds, iterations), dtype=self.dtype)
+
+    def write(self, start: int, block: np.ndarray) -> None:
+        self.trajectories[start:start + len(block)] = block
+
+    def result(self) -> np.ndarray:
+        return self.trajectories
+
+class MemmapSink(TrajectorySink):
+    """
+    All trajectories in a memory-mapped .npy file.
+
+    Blocks are flushed as they arrive, so resident memory stays at about
+    one block; result() reopens the file read-only.
+    """
+
+    def __init__(self, path: str, dtype=np.float32):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.trajectories = None
+
+    def open(self, seeds: int, iterations: int) -> None:
+        super().open(seeds, iterations)
+        self.trajectories = np.lib.format.open_memmap(
+            self.path, mode='w+', dtype=self.dtype, shape=(seeds, iterations)
+        )
+
+    def write(self, start: int, block: np.ndarray) -> None:
+        self.trajectories[start:start + len(block)] = block
+        self.trajectories.flush()
+
+    def close(self) -> None:
+        if self.trajectories is not None:
+            self.trajectories.flush()
+            self.trajectories = None
+
+    def result(self) -> np.ndarray:
+        return np.load(self.path, mmap_mode='r')
+
+class ReduceSink(TrajectorySink):
+    """
+    Running per-iteration statistics instead of stored trajectories.
+
+    Memory is O(iterations * sample + seeds) regardless of the sweep size.
+
+    Args:
+        sample: Number of leading trajectories kept (plots, quantile estimates)
+        dtype: Storage type of the kept trajectories
+    """
+
+    def __init__(self, sample: int = 1000, dtype=np.float32):
+        self.sample_size = sample
+        self.dtype = np.dtype(dtype)
+
+    def open(self, seeds: int, iterations: int) -> None:
+        super().open(seeds, iterations)
+        self.count = 0
+        self.mean = np.zeros(iterations)
+        self.m2 = np.zeros(iterations)
+        self.minimum = np.full(iterations, np.inf)
+        self.maximum = np.full(iterations, -np.inf)
+        self.final = np.empty(seeds)
+        self.sample = np.empty((min(self.sample_size, seeds), iterations), dtype=self.dtype)
+
+    def write(self, start: int, block: np.ndarray) -> None:
+        block = np.asarray(block, dtype=np.float64)
+        n_b = len(block)
+        if n_b == 0:
+            return
+
+        # Chan et al. merge of the block moments into the running moments
+        block_mean = block.mean(axis=0)
+        block_m2 = np.sum((block - block_mean) ** 2, axis=0)
+        n = self.count + n_b
+        delta = block_mean - self.mean
+        self.mean += delta * (n_b / n)
+        self.m2 += block_m2 + delta * delta * (self.count * n_b / n)
+        self.count = n
+
+        np.minimum(self.minimum, block.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, block.max(axis=0), out=self.maximum)
+        if self.iterations:
+            self.final[start:start + n_b] = block[:, -1]
+        if start < len(self.sample):
+            kept = min(n_b, len(self.sample) - start)
+            self.sample[start:start + kept] = block[:kept]
+
+@dataclass
+class TrajectorySummary:
+    """Per-iteration statistics of a trajectory sweep"""
+    seeds: int
+    mean: np.ndarray
+    std: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    final: np.ndarray
+    sample: np.ndarray
+
+    def quantiles(self, q: Union[float, Sequence[float]]) -> np.ndarray:
+        """Per-iteration quantiles estimated from the sampled trajectories."""
+        return np.quantile(self.sample, q, axis=0)
+
+def summarize(source: Union[np.ndarray, TrajectorySink], sample: int = 1000) -> TrajectorySummary:
+    """
+    Reduce a trajectory array or a sink to a TrajectorySummary.
+
+    Arrays (including memmaps) are reduced block by block, so a
+    disk-backed sweep is never loaded into memory at once.
+    """
+    if isinstance(source, TrajectorySink) and not isinstance(source, ReduceSink):
+        source = source.result()
+
+    if not isinstance(source, ReduceSink):
+        trajectories = source
+        source = ReduceSink(sample=sample)
+        source.open(*trajectories.shape)
+        for start in range(0, len(trajectories), SUMMARY_BLOCK_SEEDS):
+            source.write(start, trajectories[start:start + SUMMARY_BLOCK_SEEDS])
+
+    return TrajectorySummary(
+        seeds=source.count,
+        mean=source.mean,
+        std=np.sqrt(source.m2 / source.count) if source.count else np.zeros_like(source.mean),
+        minimum=source.minimum,
+        maximum=source.maximum,
+        final=source.final,
+        sample=source.sample
+    )
+
+def make_sink(sink: Optional[Union[str, TrajectorySink]] = None) -> TrajectorySink:
+    """
+    Sink from a name: None (float64 in memory, the original behaviour),
+    'memory' (float32) or 'reduce'. Sink instances are returned unchanged.
+    """
+    if isinstance(sink, TrajectorySink):
+        return sink
+    if sink is None:
+        return MemorySink(dtype=np.float64)
+    if sink == 'memory':
+        return MemorySink()
+    if sink == 'reduce':
+        return ReduceSink()
+    raise ValueError(f"unknown trajectory sink: {sink!r}")
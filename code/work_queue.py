@@ -0,0 +1,472 @@
+"""
+FILE-BASED WORK QUEUE FOR MULTI-NODE SWEEPS
+
+Spreads a seed sweep over several machines that share a directory (NFS,
+a cluster filesystem, or just a local directory when testing on one
+box). There is no broker: every piece of coordination is a file.
+
+    coordinator:   run_fortress_test(seeds=100000, entropy=7, queue_dir='/shared/q')
+    every node:    python . worker /shared/q
+
+Layout (one directory per submitted sweep):
+
+    <root>/<sweep id>/
+        sweep.json                     task, shard bounds, code version (written last: commit marker)
+        kwargs.pkl                     task arguments
+        leases/<shard>.lease           claimed by a worker; mtime renewed while it works
+        done/<shard>.pkl               shard result (written atomically)
+        failed/<shard>.<worker>-<t>.txt  traceback of a failed attempt
+        failed/retired/                failures of earlier submissions (not counted)
+
+A shard is a contiguous seed range [start, stop), exactly a chunk of
+parallel_sweep.iter_seed_sweep. Workers claim a shard by creating its
+lease with O_CREAT | O_EXCL, so only one claim succeeds; the lease
+records its owner. A heartbeat thread touches the lease every
+lease_seconds / 4, and only while the lease is still its own. A lease
+older than lease_seconds belongs to a dead worker: it is renamed away
+(only one renamer wins), put back if it turns out to have been renewed
+in the meantime, and the shard is claimed again. Workers only ever
+delete their own leases. Shards whose task raised are retried until
+max_attempts failures are recorded; resubmitting the sweep retires the
+failures of unfinished shards, so they get max_attempts fresh tries.
+
+Every seed has its own random stream (see parallel_sweep), so a shard's
+result depends only on its seeds, never on the worker or machine that
+computed it. The coordinator reads the done files in seed order and
+merges them exactly like a single-process run, which makes the
+aggregate bit-identical. At worst a shard whose heartbeat stalled is
+computed twice; the duplicate result is identical and replaces the
+first atomically. Node clocks must roughly agree, because lease age is
+judged from file modification times.
+
+The sweep id hashes the task, its arguments and the code version. Resubmitting
+the same sweep (after a coordinator crash, say) therefore reuses every
+finished shard, and workers skip sweeps whose code differs from their own.
+
+Local worker processes started by iter_queue_sweep are stopped when the
+coordinator stops consuming (closed early, failed shard, Ctrl-C): they
+finish between shards on a stop event, and any still inside a shard are
+terminated and their leases released.
+"""
+
+import json
+import multiprocessing
+import os
+import pickle
+import shutil
+import socket
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if __package__:
+    from .checkpoint import _atomic_write
+    from .metrics import get_metrics
+    from .parallel_sweep import chunk_bounds, default_workers
+    from .result_cache import cache_key, code_version
+    from .results_store import _module_name, import_module
+else:
+    from checkpoint import _atomic_write
+    from metrics import get_metrics
+    from parallel_sweep import chunk_bounds, default_workers
+    from result_cache import cache_key, code_version
+    from results_store import _module_name, import_module
+
+# Seconds without a heartbeat after which a lease counts as abandoned
+LEASE_SECONDS = 60.0
+# Seconds between scans for claimable shards / finished results
+POLL_SECONDS = 1.0
+# Failed attempts (task exceptions) before a shard is given up
+MAX_ATTEMPTS = 3
+# Shards a sweep is cut into when the caller gives no smaller chunk size
+DEFAULT_SHARDS = 64
+
+Shard = Tuple[int, int]
+
+def worker_id(pid: Optional[int] = None) -> str:
+    """Identity of a worker process on this host (default: this process)."""
+    return f"{socket.gethostname()}-{os.getpid() if pid is None else pid}"
+
+# =============================================================================
+# SWEEPS
+# =============================================================================
+
+class Sweep:
+    """
+    One submitted sweep in a queue directory (see module docstring).
+
+    Args:
+        path: Sweep directory (contains sweep.json)
+        lease_seconds: Heartbeat timeout of a lease
+    """
+
+    def __init__(self, path: str, lease_seconds: float = LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        with open(os.path.join(path, 'sweep.json')) as f:
+            self.meta = json.load(f)
+        self.id = self.meta['id']
+        self.seeds = self.meta['seeds']
+        self.shards: List[Shard] = [tuple(bounds) for bounds in self.meta['shards']]
+        self._task = None
+
+    def _file(self, kind: str, shard: Shard, suffix: str) -> str:
+        return os.path.join(self.path, kind, f"shard-{shard[0]}-{shard[1]}{suffix}")
+
+    def task(self) -> Tuple[Callable[..., Any], Dict[str, Any]]:
+        """The shard function and its keyword arguments (loaded once)."""
+        if self._task is None:
+            fn = getattr(import_module(self.meta['module']), self.meta['function'])
+            with open(os.path.join(self.path, 'kwargs.pkl'), 'rb') as f:
+                self._task = fn, pickle.load(f)
+        return self._task
+
+    def is_done(self, shard: Shard) -> bool:
+        return os.path.exists(self._file('done', shard, '.pkl'))
+
+    def failures(self, shard: Shard) -> List[str]:
+        """Paths of the recorded failed attempts of a shard."""
+        prefix = f"shard-{shard[0]}-{shard[1]}."
+        directory = os.path.join(self.path, 'failed')
+        return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.startswith(prefix))
+
+    def is_failed(self, shard: Shard) -> bool:
+        return len(self.failures(shard)) >= self.meta['max_attempts']
+
+    def is_open(self, shard: Shard) -> bool:
+        return not self.is_done(shard) and not self.is_failed(shard)
+
+    def result(self, shard: Shard) -> Any:
+        with open(self._file('done', shard, '.pkl'), 'rb') as f:
+            return pickle.load(f)
+
+    def _expired(self, path: str) -> bool:
+        return time.time() - os.stat(path).st_mtime > self.lease_seconds
+
+    def lease_owner(self, shard: Shard) -> Optional[str]:
+        """Worker recorded in a shard's lease (None if unleased)."""
+        try:
+            with open(self._file('leases', shard, '.lease')) as f:
+                return json.load(f)['worker']
+        except (FileNotFoundError, ValueError, KeyError):
+            return None  # no lease, or one still being written
+
+    def claim(self, shard: Shard, owner: str) -> bool:
+        """Take the lease of an open shard; False if a live worker holds it."""
+        lease = self._file('leases', shard, '.lease')
+        for _ in range(2):
+            try:
+                fd = os.open(lease, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if not self._expired(lease):
+                        return False
+                    # Abandoned: move it aside (one renamer wins), then claim afresh
+                    stale = f"{lease}.stale-{owner}"
+                    os.rename(lease, stale)
+                    if not self._expired(stale):
+                        # Renewed (or freshly claimed) after we looked: put it back unless
+                        # someone claimed anew already, and leave the shard to its owner
+                        try:
+                            os.link(stale, lease)
+                        except FileExistsError:
+                            pass
+                        os.remove(stale)
+                        return False
+                    os.remove(stale)
+                except FileNotFoundError:
+                    pass  # released or taken over meanwhile; try to create it again
+                continue
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'worker': owner, 'claimed': time.time()}, f)
+            if self.is_open(shard):
+                return True
+            self.release(shard, owner)  # finished while we were claiming
+            return False
+        return False
+
+    def release(self, shard: Shard, owner: str) -> bool:
+        """Remove a shard's lease if `owner` holds it; False if it is someone else's."""
+        if self.lease_owner(shard) != owner:
+            return False
+        try:
+            os.remove(self._file('leases', shard, '.lease'))
+        except FileNotFoundError:
+            pass
+        return True
+
+    def renew(self, shard: Shard, owner: str) -> bool:
+        """Heartbeat: touch the lease if `owner` still holds it."""
+        if self.lease_owner(shard) != owner:
+            return False
+        try:
+            os.utime(self._file('leases', shard, '.lease'))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def release_all(self, owners: Sequence[str]) -> None:
+        """Release every lease held by one of `owners` (workers that were stopped)."""
+        for shard in self.shards:
+            owner = self.lease_owner(shard)
+            if owner in owners:
+                self.release(shard, owner)
+
+    def retire_failures(self) -> None:
+        """Move the failed attempts of unfinished shards out of the attempt count."""
+        directory = os.path.join(self.path, 'failed')
+        retired = os.path.join(directory, 'retired')
+        for shard in self.shards:
+            if self.is_done(shard):
+                continue
+            for path in self.failures(shard):
+                os.makedirs(retired, exist_ok=True)
+                try:
+                    shutil.move(path, os.path.join(retired, os.path.basename(path)))
+                except FileNotFoundError:
+                    pass  # retired concurrently
+
+    def run(self, shard: Shard, owner: str) -> bool:
+        """
+        Compute a claimed shard under a heartbeat and publish its result.
+
+        Returns:
+            True on success; False if the task raised (the attempt is
+            recorded under failed/ and the lease released for a retry)
+        """
+        stop = threading.Event()
+
+        def heartbeat():
+            while not stop.wait(self.lease_seconds / 4):
+                if not self.renew(shard, owner):
+                    return  # taken over after a stall: the duplicate result is identical
+
+        beat = threading.Thread(target=heartbeat, daemon=True)
+        beat.start()
+        try:
+            fn, kwargs = self.task()
+            result = fn(shard[0], shard[1], **kwargs)
+            _atomic_write(self._file('done', shard, '.pkl'), pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+            return True
+        except Exception:
+            _atomic_write(self._file('failed', shard, f".{owner}-{time.time_ns()}.txt"),
+                          traceback.format_exc().encode())
+            return False
+        finally:
+            stop.set()
+            beat.join()
+            self.release(shard, owner)
+
+    def work_once(self, owner: str) -> bool:
+        """Claim and compute the first claimable shard; False if none was claimable."""
+        for shard in self.shards:
+            if self.is_open(shard) and self.claim(shard, owner):
+                self.run(shard, owner)
+                return True
+        return False
+
+    def status(self) -> Dict[str, int]:
+        """Shard counts: done, failed, leased and waiting."""
+        counts = {'done': 0, 'failed': 0, 'leased': 0, 'waiting': 0}
+        for shard in self.shards:
+            if self.is_done(shard):
+                counts['done'] += 1
+            elif self.is_failed(shard):
+                counts['failed'] += 1
+            elif os.path.exists(self._file('leases', shard, '.lease')):
+                counts['leased'] += 1
+            else:
+                counts['waiting'] += 1
+        return counts
+
+    def finished(self) -> bool:
+        return not any(self.is_open(shard) for shard in self.shards)
+
+# =============================================================================
+# QUEUE
+# =============================================================================
+
+class WorkQueue:
+    """
+    Queue directory holding any number of sweeps.
+
+    Args:
+        root: Shared directory (created on first submit)
+        lease_seconds: Heartbeat timeout of a lease
+    """
+
+    def __init__(self, root: str, lease_seconds: float = LEASE_SECONDS):
+        self.root = root
+        self.lease_seconds = lease_seconds
+
+    def submit(
+        self,
+        task: Callable[..., Any],
+        seeds: int,
+        chunk_size: Optional[int] = None,
+        max_attempts: int = MAX_ATTEMPTS,
+        **kwargs
+    ) -> Sweep:
+        """
+        Publish a sweep of `task(start, stop, **kwargs)` over seeds 0 .. seeds - 1.
+
+        Submitting the same sweep again returns the existing one, finished
+        shards included; failed attempts of unfinished shards are retired so
+        they are retried from scratch.
+        """
+        if chunk_size is None:
+            chunk_size = -(-seeds // DEFAULT_SHARDS)
+        shards = chunk_bounds(seeds, chunk_size=chunk_size)
+        module, function = _module_name(task), task.__qualname__
+        sweep_id = cache_key(task, {'module': module, 'seeds': seeds, 'shards': shards, 'kwargs': kwargs})[:16]
+        path = os.path.join(self.root, sweep_id)
+        if not os.path.exists(os.path.join(path, 'sweep.json')):
+            for kind in ('leases', 'done', 'failed'):
+                os.makedirs(os.path.join(path, kind), exist_ok=True)
+            _atomic_write(os.path.join(path, 'kwargs.pkl'), pickle.dumps(kwargs, protocol=pickle.HIGHEST_PROTOCOL))
+            _atomic_write(os.path.join(path, 'sweep.json'), json.dumps({
+                'id': sweep_id, 'module': module, 'function': function, 'seeds': seeds,
+                'shards': shards, 'max_attempts': max_attempts, 'code': code_version(), 'created': time.time()
+            }, indent=2).encode())
+            return Sweep(path, self.lease_seconds)
+        sweep = Sweep(path, self.lease_seconds)
+        sweep.retire_failures()
+        return sweep
+
+    def sweeps(self) -> List[Sweep]:
+        """Committed sweeps, oldest first."""
+        if not os.path.isdir(self.root):
+            return []
+        sweeps = [Sweep(os.path.join(self.root, name), self.lease_seconds) for name in os.listdir(self.root)
+                  if os.path.exists(os.path.join(self.root, name, 'sweep.json'))]
+        return sorted(sweeps, key=lambda sweep: sweep.meta['created'])
+
+    def sweep(self, sweep_id: str) -> Sweep:
+        return Sweep(os.path.join(self.root, sweep_id), self.lease_seconds)
+
+def run_worker(
+    root: str,
+    sweep_id: Optional[str] = None,
+    lease_seconds: float = LEASE_SECONDS,
+    poll: float = POLL_SECONDS,
+    wait: bool = False,
+    stop=None
+) -> int:
+    """
+    Work a queue directory: claim, compute and publish shards until every
+    sweep (or just `sweep_id`) is finished. While only shards leased by
+    others remain, keep polling so abandoned leases are taken over.
+
+    Args:
+        root: Queue directory
+        sweep_id: Work only this sweep
+        lease_seconds: Heartbeat timeout of a lease (same on every node)
+        poll: Seconds between scans when nothing is claimable
+        wait: Keep polling for new sweeps instead of exiting when idle
+        stop: Event (threading or multiprocessing) that ends the worker
+              before its next claim
+
+    Returns:
+        number of shards this worker computed
+    """
+    queue = WorkQueue(root, lease_seconds)
+    owner = worker_id()
+    version = code_version()
+    skipped = set()
+    computed = 0
+    while stop is None or not stop.is_set():
+        sweeps = [queue.sweep(sweep_id)] if sweep_id else queue.sweeps()
+        pending = False
+        for sweep in sweeps:
+            if sweep.meta['code'] != version:
+                if sweep.id not in skipped:
+                    print(f"⚠ Skipping sweep {sweep.id}: submitted from different code")
+                    skipped.add(sweep.id)
+                continue
+            if sweep.finished():
+                continue
+            pending = True
+            if sweep.work_once(owner):
+                computed += 1
+                break  # rescan from the oldest sweep and its first shard
+        else:
+            if not pending and not wait:
+                return computed
+            if stop is not None:
+                stop.wait(poll)
+            else:
+                time.sleep(poll)
+    return computed
+
+def iter_queue_sweep(
+    root: str,
+    task: Callable[..., Any],
+    seeds: int,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+    shards: int = DEFAULT_SHARDS,
+    lease_seconds: float = LEASE_SECONDS,
+    poll: float = POLL_SECONDS,
+    **kwargs
+) -> Iterator[Any]:
+    """
+    Drop-in for parallel_sweep.iter_seed_sweep that runs the chunks
+    through the queue at `root`: yields (start, stop, result) in seed order.
+
+    The sweep is submitted as shards of at most chunk_size seeds (and at
+    least `shards` shards), so remote `python . worker root` processes can
+    share the work. This machine contributes too: with workers == 1 the
+    caller's process computes shards between polls, otherwise `workers`
+    local worker processes (0 = all cores) join the queue.
+
+    Raises:
+        RuntimeError: a shard failed max_attempts times (first traceback attached)
+    """
+    chunk_size = min(chunk_size or seeds, -(-seeds // max(1, shards)))
+    sweep = WorkQueue(root, lease_seconds).submit(task, seeds, chunk_size, **kwargs)
+    metrics = get_metrics()
+    engine = task.__name__.strip('_')
+    owner = worker_id()
+
+    processes, stop = [], None
+    if workers != 1 and not sweep.finished():
+        workers = min(workers or default_workers(), len(sweep.shards))
+        context = multiprocessing.get_context()
+        stop = context.Event()
+        processes = [context.Process(target=run_worker, args=(root, sweep.id, lease_seconds, poll),
+                                     kwargs={'stop': stop})
+                     for _ in range(workers)]
+        for process in processes:
+            process.start()
+    try:
+        for shard in sweep.shards:
+            while not sweep.is_done(shard):
+                if sweep.is_failed(shard):
+                    with open(sweep.failures(shard)[0]) as f:
+                        raise RuntimeError(f"shard {shard} of sweep {sweep.id} failed "
+                                           f"{sweep.meta['max_attempts']} times:\n{f.read()}")
+                for process in processes:
+                    if process.exitcode not in (None, 0):
+                        raise RuntimeError(f"local queue worker exited with code {process.exitcode}")
+                if processes or not sweep.work_once(owner):
+                    time.sleep(poll)
+            metrics.progress(engine, shard[1], seeds)
+            yield shard[0], shard[1], sweep.result(shard)
+    finally:
+        if processes:
+            _stop_workers(sweep, processes, stop, poll)
+
+def _stop_workers(sweep: Sweep, processes: List, stop, poll: float) -> None:
+    """End local workers: between shards via `stop`, inside a shard by termination."""
+    stop.set()
+    deadline = time.time() + 2 * poll
+    for process in processes:
+        process.join(max(0.0, deadline - time.time()))
+    stopped = [process for process in processes if process.is_alive()]
+    for process in stopped:
+        process.terminate()
+    for process in processes:
+        process.join()
+    if stopped:
+        sweep.release_all([worker_id(process.pid) for process in stopped])
@@ -0,0 +1,8 @@
+"""Engine modules import each other by flat name, as when run from code/."""
+
+import os
+import sys
+
+CODE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'code')
+if CODE not in sys.path:
+    sys.path.append(CODE)
@@ -0,0 +1,15 @@
+"""Module-level shard tasks for the work-queue tests (workers import them by name)."""
+
+import time
+import numpy as np
+
+def square_chunk(start, stop, delay=0.0):
+    time.sleep(delay)
+    return np.arange(start, stop) ** 2
+
+def failing_chunk(start, stop, marker):
+    """Fails until `marker` exists, like a transient OOM or NFS error."""
+    import os
+    if not os.path.exists(marker):
+        raise OSError('transient failure')
+    return np.arange(start, stop)
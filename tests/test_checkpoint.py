@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import checkpoint
+import result_cache
+from UNIVERSAL_RECURSION_ENGINE import _fortress_chunk, _seed_chunk_size, run_fortress_test
+
+SEEDS, ITERATIONS, PARTICLES = 6, 40, 200
+BATCH_BYTES = 14000  # two seeds per batch, so a resume also skips finished batches
+
+class Preempted(Exception):
+    pass
+
+def _interrupt_after(monkeypatch, saves):
+    """Make the `saves`-th committed checkpoint end the run, as a preemption would."""
+    original = checkpoint.Checkpoint.save
+    count = [0]
+
+    def save(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        count[0] += 1
+        if count[0] == saves:
+            raise Preempted
+
+    monkeypatch.setattr(checkpoint.Checkpoint, 'save', save)
+    return lambda: monkeypatch.setattr(checkpoint.Checkpoint, 'save', original)
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(result_cache, '_default_cache', None)
+    monkeypatch.setattr(result_cache, '_configured', True)
+
+@pytest.mark.parametrize('entropy', [3, None])
+@pytest.mark.parametrize('converge', [None, 5])
+@pytest.mark.parametrize('saves', [1, 4])
+def test_chunk_resume_matches_uninterrupted(tmp_path, monkeypatch, entropy, converge, saves):
+    assert _seed_chunk_size(SEEDS, PARTICLES, BATCH_BYTES, ITERATIONS) == 2
+    args = (0, SEEDS, entropy, ITERATIONS, PARTICLES, 1000.0, BATCH_BYTES, converge, 8)
+
+    np.random.seed(7)
+    reference = _fortress_chunk(*args)
+
+    restore = _interrupt_after(monkeypatch, saves)
+    np.random.seed(7)
+    with pytest.raises(Preempted):
+        _fortress_chunk(*args, checkpoint_dir=str(tmp_path), checkpoint_every=10)
+    restore()
+    np.random.seed(12345)  # the resume must not depend on the global state it finds
+    resumed = _fortress_chunk(*args, checkpoint_dir=str(tmp_path), checkpoint_every=10)
+
+    for expected, actual in zip(reference, resumed):
+        np.testing.assert_array_equal(expected, actual)
+
+def test_fortress_resume_matches_uninterrupted(tmp_path, monkeypatch):
+    # No entropy and one worker: the run draws from np.random, whose state the checkpoints carry
+    kwargs = dict(seeds=SEEDS, iterations=ITERATIONS, particles=PARTICLES, max_batch_bytes=BATCH_BYTES)
+    np.random.seed(7)
+    reference = run_fortress_test(**kwargs)
+
+    restore = _interrupt_after(monkeypatch, 3)
+    np.random.seed(7)
+    with pytest.raises(Preempted):
+        run_fortress_test(**kwargs, checkpoint_dir=str(tmp_path), checkpoint_every=10)
+    restore()
+    resumed = run_fortress_test(**kwargs, checkpoint_dir=str(tmp_path), checkpoint_every=10)
+
+    assert resumed.mean_ratio == reference.mean_ratio
+    np.testing.assert_array_equal(resumed.trajectories, reference.trajectories)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+import goldilocks_audit
+from goldilocks_audit import _goldilocks_chunk
+
+TARGET_N = [3, 4, 5]
+
+@pytest.fixture(autouse=True)
+def small_width(monkeypatch):
+    monkeypatch.setattr(goldilocks_audit, 'WIDTH', 64)
+
+@pytest.mark.parametrize('entropy', [None, 4])
+@pytest.mark.parametrize('converge', [None, 3])
+def test_jacobi_matches_sequential_update(entropy, converge):
+    args = (0, 3, entropy, TARGET_N, 60)
+    jacobi = _goldilocks_chunk(*args, converge=converge, update='jacobi')
+    sequential = _goldilocks_chunk(*args, converge=converge, update='sequential')
+    for expected, actual in zip(sequential, jacobi):
+        assert actual.shape == (3, len(TARGET_N))
+        np.testing.assert_array_equal(expected, actual)
+
+def test_jacobi_matches_sequential_with_per_seed_parameters():
+    kwargs = dict(seed_ids=np.array([5, 1, 9]), epsilon=np.array([0.1, 0.5, 0.9]), gain=np.array([2.0, 3.0, np.pi]))
+    jacobi = _goldilocks_chunk(0, 3, 2, TARGET_N, 40, update='jacobi', **kwargs)
+    sequential = _goldilocks_chunk(0, 3, 2, TARGET_N, 40, update='sequential', **kwargs)
+    for expected, actual in zip(sequential, jacobi):
+        np.testing.assert_array_equal(expected, actual)
+
+def test_unknown_update_mode():
+    with pytest.raises(ValueError, match='unknown update mode'):
+        _goldilocks_chunk(0, 1, None, TARGET_N, 1, update='gauss-seidel')
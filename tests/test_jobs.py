@@ -0,0 +1,65 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import jobs
+import result_cache
+from jobs import submit_fortress
+from UNIVERSAL_RECURSION_ENGINE import run_fortress_test
+
+SEEDS, ITERATIONS, PARTICLES, ENTROPY = 12, 40, 200, 7
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(jobs, 'STREAM_CHUNKS', 4)  # chunks of three seeds
+    monkeypatch.setattr(result_cache, '_default_cache', None)
+    monkeypatch.setattr(result_cache, '_configured', True)
+
+@pytest.fixture
+def reference():
+    result = run_fortress_test(seeds=SEEDS, iterations=ITERATIONS, particles=PARTICLES, entropy=ENTROPY)
+    return result, result.trajectories[:, -1]
+
+def _submit(**kwargs):
+    return submit_fortress(seeds=SEEDS, iterations=ITERATIONS, particles=PARTICLES, entropy=ENTROPY, **kwargs)
+
+def test_streams_one_update_per_chunk_and_matches_engine(reference):
+    expected, finals = reference
+
+    async def run():
+        job = _submit()
+        updates = [update async for update in job]
+        return updates, await job.result()
+
+    updates, result = asyncio.run(run())
+    assert [(u.start, u.stop, u.done) for u in updates] == [(0, 3, 3), (3, 6, 6), (6, 9, 9), (9, 12, 12)]
+    for update in updates:
+        np.testing.assert_array_equal(update.values, finals[update.start:update.stop])
+        assert update.mean == pytest.approx(finals[:update.done].mean(), abs=1e-15)
+    assert not result.cancelled and result.done == result.total == SEEDS
+    assert result.entropy == ENTROPY
+    np.testing.assert_array_equal(result.values, finals)
+    assert result.mean == pytest.approx(expected.mean_ratio, abs=1e-15)
+    assert result.std == pytest.approx(expected.std_dev, abs=1e-15)
+
+def test_cancel_stops_at_the_next_chunk(reference):
+    _, finals = reference
+
+    async def run():
+        release = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(release.wait)  # hold the sweep back until it has been cancelled
+            job = _submit(executor=executor)
+            job.cancel()
+            release.set()
+            updates = [update async for update in job]
+            return updates, await job.result()
+
+    updates, result = asyncio.run(run())
+    assert len(updates) == 1
+    assert result.cancelled and result.done == 3 and result.total == SEEDS
+    np.testing.assert_array_equal(result.values, finals[:3])
+    assert result.mean == pytest.approx(finals[:3].mean(), abs=1e-15)
@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SERVER = os.path.join(os.path.dirname(__file__), '..', 'code', 'mcp_server.py')
+
+def _session(*messages, timeout=120):
+    """Run the stdio server on `messages` until stdin closes; replies keyed by request id."""
+    proc = subprocess.run(
+        [sys.executable, SERVER, '--workers', '1'],
+        input=''.join(json.dumps(m) + '\n' for m in messages),
+        capture_output=True, text=True, timeout=timeout, env=dict(os.environ, URFE_CACHE='0')
+    )
+    assert proc.returncode == 0, proc.stderr
+    replies = [json.loads(line) for line in proc.stdout.splitlines()]
+    for reply in replies:
+        assert reply['jsonrpc'] == '2.0'
+    return {reply['id']: reply for reply in replies}
+
+@pytest.fixture(scope='module')
+def replies():
+    return _session(
+        {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize',
+         'params': {'protocolVersion': '2025-03-26', 'capabilities': {}, 'clientInfo': {'name': 'test'}}},
+        {'jsonrpc': '2.0', 'method': 'notifications/initialized'},
+        {'jsonrpc': '2.0', 'id': 2, 'method': 'tools/list'},
+        {'jsonrpc': '2.0', 'id': 3, 'method': 'tools/call', 'params': {'name': 'mirror', 'arguments': {'scale_L': 1.0}}},
+        {'jsonrpc': '2.0', 'id': 4, 'method': 'tools/call', 'params': {'name': 'mirror', 'arguments': {'scale': 1.0}}},
+        {'jsonrpc': '2.0', 'id': 5, 'method': 'resources/list'},
+    )
+
+def test_initialize(replies):
+    result = replies[1]['result']
+    assert result['protocolVersion'] == '2025-03-26'
+    assert result['capabilities'] == {'tools': {'listChanged': False}}
+    assert result['serverInfo']['name']
+    assert set(replies) == {1, 2, 3, 4, 5}  # the notification got no reply
+
+def test_tools_list(replies):
+    tools = {tool['name']: tool for tool in replies[2]['result']['tools']}
+    assert {'fortress', 'null_hypothesis', 'mirror', 'mirror_grid', 'suite'} <= set(tools)
+    schema = tools['mirror']['inputSchema']
+    assert schema['type'] == 'object' and schema['additionalProperties'] is False
+    assert schema['properties']['scale_L']['default'] == 1.0
+
+def test_tools_call(replies):
+    result = replies[3]['result']
+    assert result['isError'] is False
+    structured = result['structuredContent']
+    assert structured['regime'] == 'fixed point' and structured['period'] == 1
+    assert abs(structured['mean'] - 0.7497031775454851) < 1e-12
+    assert result['content'][0] == {'type': 'text', 'text': json.dumps(structured)}
+
+def test_errors(replies):
+    assert replies[4]['error']['code'] == -32602
+    assert 'scale' in replies[4]['error']['message']
+    assert replies[5]['error']['code'] == -32601
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from bare_urfe_sub_planck_mirror import AUDIT_SCALES, bare_urfe_sub_planck_mirror, mirror_scale_grid
+
+ITERATIONS = 2000
+
+def _scalar_grid(scales, trace_floor=0.75, matter_bias=0.03):
+    """The original per-scale loop with its stored history."""
+    return np.array([bare_urfe_sub_planck_mirror(L, ITERATIONS, trace_floor, matter_bias) for L in scales])
+
+def _assert_matches(grid, expected):
+    # Same operations in the same order; only the tail mean/std are accumulated differently
+    np.testing.assert_array_equal(grid['max'], expected[..., 1])
+    np.testing.assert_allclose(grid['mean'], expected[..., 0], rtol=0, atol=1e-15)
+    np.testing.assert_allclose(grid['std'], expected[..., 2], rtol=0, atol=1e-15)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_numpy_grid_matches_scalar_mirror(workers):
+    scales = np.array(AUDIT_SCALES)
+    grid = mirror_scale_grid.uncached(scales, iterations=ITERATIONS, workers=workers, backend='numpy')
+    _assert_matches(grid, _scalar_grid(scales))
+
+def test_numpy_outer_grid_matches_scalar_mirror():
+    scales, floors, biases = [100.0, 1.0, 0.01], [0.7, 0.8], [0.0, 0.05]
+    grid = mirror_scale_grid.uncached(scales, floors, biases, iterations=ITERATIONS, outer=True, backend='numpy')
+    assert grid['mean'].shape == (3, 2, 2)
+    expected = np.array([[[bare_urfe_sub_planck_mirror(L, ITERATIONS, f, b) for b in biases] for f in floors]
+                         for L in scales])
+    _assert_matches(grid, expected)
+
+def test_numba_grid_matches_scalar_mirror():
+    pytest.importorskip('numba')
+    scales = np.array(AUDIT_SCALES)
+    grid = mirror_scale_grid.uncached(scales, iterations=ITERATIONS, backend='numba')
+    _assert_matches(grid, _scalar_grid(scales))
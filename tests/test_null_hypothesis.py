@@ -0,0 +1,39 @@
+import math
+
+import pytest
+
+import result_cache
+import UNIVERSAL_RECURSION_ENGINE as engine  # not `from`: pytest would collect test_null_hypothesis itself
+from UNIVERSAL_RECURSION_ENGINE import _null_chisquare_chunk, _null_chunk, check_null_distribution, null_ratio_moments
+
+PARTICLES = 500
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(result_cache, '_default_cache', None)
+    monkeypatch.setattr(result_cache, '_configured', True)
+
+def test_exact_moments():
+    mean, std = null_ratio_moments(PARTICLES)
+    assert mean == 0.75
+    assert math.isclose(std ** 2, 3 / (16 * (2 * PARTICLES - 1)), rel_tol=1e-12)
+
+@pytest.mark.parametrize('entropy', [1, 2, 3])
+def test_three_nulls_agree_within_sampling_error(entropy):
+    seeds, z = 2000, 4.0
+    exact_mean, exact_std = null_ratio_moments(PARTICLES)
+    montecarlo = _null_chunk(0, seeds, entropy, PARTICLES)
+    chisquare = _null_chisquare_chunk(0, seeds, entropy, PARTICLES)
+    for ratios in (montecarlo, chisquare):
+        assert abs(ratios.mean() - exact_mean) <= z * exact_std / math.sqrt(seeds)
+        assert abs(ratios.std() - exact_std) <= z * exact_std / math.sqrt(2 * (seeds - 1))
+    # And against each other (two independent samples)
+    assert abs(montecarlo.mean() - chisquare.mean()) <= z * exact_std * math.sqrt(2 / seeds)
+    assert check_null_distribution(seeds, PARTICLES, entropy, z)['passed']
+
+def test_fast_null_is_the_default():
+    kwargs = dict(seeds=20, iterations=20, particles=PARTICLES, entropy=5)
+    assert engine.test_null_hypothesis(**kwargs) == engine.test_null_hypothesis(**kwargs, null_method='chisquare')
+    assert engine.test_null_hypothesis(**kwargs, null_method='exact') > 0
+    with pytest.raises(ValueError, match='unknown null_method'):
+        engine.test_null_hypothesis(**kwargs, null_method='montecarlo')
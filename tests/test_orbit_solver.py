@@ -0,0 +1,49 @@
+import math
+
+import numpy as np
+import pytest
+
+from bare_urfe import classify_sine_map
+from bare_urfe_sub_planck_mirror import bare_urfe_sub_planck_mirror, mirror_attractor
+from orbit_solver import CHAOTIC, CYCLE, FIXED_POINT, find_orbit
+
+def _logistic(r):
+    return lambda x: r * x * (1 - x), lambda x: r * (1 - 2 * x)
+
+def test_stable_fixed_point():
+    r = 2.8
+    orbit = find_orbit(*_logistic(r), 0.3)
+    assert orbit.regime == FIXED_POINT and orbit.period == 1
+    assert orbit.mean == pytest.approx(1 - 1 / r, abs=1e-14)
+    assert orbit.std == 0.0
+    assert orbit.lyapunov == pytest.approx(math.log(abs(2 - r)), abs=1e-12)
+    assert orbit.steps < 200
+
+def test_two_cycle():
+    r = 3.2
+    orbit = find_orbit(*_logistic(r), 0.3)
+    assert orbit.regime == CYCLE and orbit.period == 2
+    root = math.sqrt((r - 3) * (r + 1))
+    np.testing.assert_allclose(sorted(orbit.points), [(r + 1 - root) / (2 * r), (r + 1 + root) / (2 * r)],
+                               rtol=0, atol=1e-14)
+    # lambda = log|f'(x-) f'(x+)| / 2 with f'(x-) f'(x+) = 4 + 2r - r^2
+    assert orbit.lyapunov == pytest.approx(0.5 * math.log(abs(4 + 2 * r - r * r)), abs=1e-12)
+
+def test_chaotic_parameter_falls_back_to_the_tail():
+    orbit = find_orbit(*_logistic(4.0), 0.3, max_steps=2000, tail=500)
+    assert orbit.regime == CHAOTIC and orbit.period == 0
+    assert orbit.steps == 2000 and len(orbit.points) == 500
+    assert orbit.lyapunov == pytest.approx(math.log(2), abs=0.05)
+
+def test_classify_sine_map_is_chaotic():
+    orbit = classify_sine_map()
+    assert orbit.regime == CHAOTIC
+    assert orbit.lyapunov > 0.5
+
+def test_mirror_fixed_point_matches_brute_force():
+    orbit = mirror_attractor(1.0)
+    assert orbit.regime == FIXED_POINT and orbit.steps < 2000
+    mean, peak, std = bare_urfe_sub_planck_mirror(1.0)
+    assert orbit.mean == pytest.approx(mean, abs=1e-15)
+    assert orbit.max == pytest.approx(peak, abs=1e-15)
+    assert std < 1e-15
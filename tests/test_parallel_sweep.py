@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import result_cache
+from UNIVERSAL_RECURSION_ENGINE import run_fortress_test
+
+SEEDS, ITERATIONS, PARTICLES = 6, 40, 200
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(result_cache, '_default_cache', None)
+    monkeypatch.setattr(result_cache, '_configured', True)
+
+def _baseline_fortress(seeds, iterations, particles, max_imbalance=1000.0):
+    """The original one-seed-at-a-time loop, drawing from the global np.random stream."""
+    ratios = []
+    trajectories = []
+    for run in range(seeds):
+        imbalance = np.random.uniform(1.0, max_imbalance)
+        dim_to_spike = np.random.randint(0, 4)
+        scales = np.ones(4)
+        scales[dim_to_spike] = imbalance
+        data = np.random.normal(0, 1, (particles, 4)) * scales
+        trajectory = np.zeros(iterations)
+        for i in range(iterations):
+            data = np.sin(data * np.pi)
+            current_vars = np.var(data, axis=0)
+            trajectory[i] = np.sum(current_vars[:3]) / np.sum(current_vars)
+        trajectories.append(trajectory)
+        final_vars = np.var(data, axis=0)
+        ratios.append(np.sum(final_vars[:3]) / np.sum(final_vars))
+    return np.array(ratios), np.array(trajectories)
+
+def _assert_same(a, b):
+    for name in ('mean_ratio', 'std_dev', 'converged', 'stability_passes', 'mean_stability_window'):
+        assert getattr(a, name) == getattr(b, name), name
+    np.testing.assert_array_equal(a.trajectories, b.trajectories)
+
+def test_identical_for_any_worker_count():
+    kwargs = dict(seeds=SEEDS, iterations=ITERATIONS, particles=PARTICLES, entropy=3)
+    single = run_fortress_test(**kwargs, workers=1)
+    pooled = run_fortress_test(**kwargs, workers=3)
+    _assert_same(single, pooled)
+    assert single.entropy == pooled.entropy == 3
+
+def test_no_entropy_matches_baseline_loop():
+    np.random.seed(11)
+    ratios, trajectories = _baseline_fortress(SEEDS, ITERATIONS, PARTICLES)
+    np.random.seed(11)
+    result = run_fortress_test(seeds=SEEDS, iterations=ITERATIONS, particles=PARTICLES, max_batch_bytes=14000)
+    assert result.entropy is None
+    np.testing.assert_allclose(result.trajectories, trajectories, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(result.mean_ratio, ratios.mean(), rtol=0, atol=1e-12)
+    np.testing.assert_allclose(result.std_dev, ratios.std(), rtol=0, atol=1e-12)
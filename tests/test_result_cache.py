@@ -0,0 +1,118 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+
+import result_cache
+from result_cache import ResultCache, cache_key, cached, set_cache
+
+calls = []
+
+@cached(ignore=('workers',), bypass=lambda params: params['n'] < 0)
+def draw(n, entropy=None, workers=1):
+    calls.append(n)
+    print(f"drew {n}")
+    return np.random.default_rng(entropy).random(abs(n))
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(result_cache, '_default_cache', None)
+    monkeypatch.setattr(result_cache, '_configured', False)
+    calls.clear()
+    cache = ResultCache()
+    set_cache(cache)
+    return cache
+
+def test_hit_replays_result_and_stdout(cache, capsys):
+    first = draw(5, entropy=1)
+    assert capsys.readouterr().out == "drew 5\n"
+    second = draw(5, entropy=1)
+    assert capsys.readouterr().out == "drew 5\n"
+    assert calls == [5]
+    np.testing.assert_array_equal(first, second)
+
+def test_miss_on_changed_arguments(cache):
+    draw(5, entropy=1)
+    draw(5, entropy=2)
+    draw(6, entropy=1)
+    draw(5, entropy=1, workers=4)  # ignored argument: still a hit
+    assert calls == [5, 5, 6]
+
+def test_bypass(cache):
+    draw(5, entropy=None)  # no seed: nondeterministic, never cached
+    draw(5, entropy=None)
+    draw(-5, entropy=1)    # bypass predicate
+    draw(-5, entropy=1)
+    assert calls == [5, 5, -5, -5]
+    set_cache(None)
+    draw(5, entropy=1)
+    draw(5, entropy=1)
+    assert calls[-2:] == [5, 5]
+
+def test_key_stability():
+    params = {'n': 5, 'scales': np.logspace(-2, 2, 7), 'axes': {'b': 1.0, 'a': [1, 2]}}
+    key = cache_key(draw.uncached, params)
+    assert key == cache_key(draw.uncached, dict(reversed(list(params.items()))))
+    assert key == cache_key(draw.uncached, dict(params, scales=np.logspace(-2, 2, 7).copy()))
+    assert key == cache_key(draw.uncached, dict(params, axes={'a': (1, 2), 'b': 1.0}))
+    assert key != cache_key(draw.uncached, dict(params, scales=np.logspace(-2, 2, 8)))
+    assert key != cache_key(draw.uncached, dict(params, n=6))
+    assert key != cache_key(draw.uncached, dict(params, axes={'b': 1, 'a': [1, 2]}))  # int vs float
+
+def test_memory_tier_evicts_least_recent():
+    cache = ResultCache(memory_entries=2)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    assert cache.get('a') == b'1'  # a is now the most recent
+    cache.put('c', b'3')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1' and cache.get('c') == b'3'
+
+    cache = ResultCache(memory_bytes=10)
+    cache.put('a', b'x' * 6)
+    cache.put('b', b'y' * 6)
+    assert cache.get('a') is None and cache.get('b') == b'y' * 6
+
+def test_disk_tier_persists_and_evicts(tmp_path):
+    directory = str(tmp_path)
+    cache = ResultCache(directory=directory, max_bytes=250)
+    for i, key in enumerate(('aa', 'bb', 'cc')):
+        cache.put(key, bytes(100))
+        os.utime(cache._path(key), (i, i))  # distinct last-use times
+    assert not os.path.exists(cache._path('aa'))
+    fresh = ResultCache(directory=directory)
+    assert fresh.get('aa') is None
+    assert fresh.get('cc') == bytes(100)
+
+def test_large_results_are_not_stored(cache, tmp_path):
+    limited = ResultCache(directory=str(tmp_path), max_entry_bytes=4096)
+    set_cache(limited)
+    draw(10000, entropy=1)  # ~80 KB
+    draw(10000, entropy=1)
+    draw(10, entropy=1)
+    draw(10, entropy=1)
+    assert calls == [10000, 10000, 10]
+    assert len(limited._entries()) == 1
+
+def test_memory_tier_is_thread_safe():
+    cache = ResultCache(memory_entries=8)
+    errors = []
+
+    def hammer(worker):
+        try:
+            for i in range(2000):
+                key = f"k{(worker * 7 + i) % 20}"
+                if cache.get(key) is None:
+                    cache.put(key, bytes(i % 50 + 1))
+        except Exception as exc:  # noqa: BLE001 - any error is a failure
+            errors.append(exc)
+
+    threads = [threading.Thread(target=hammer, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert len(cache._memory) <= 8
+    assert cache._memory_size == sum(len(v) for v in cache._memory.values())
@@ -0,0 +1,77 @@
+import os
+
+import numpy as np
+
+from results_store import ResultsStore, record
+from UNIVERSAL_RECURSION_ENGINE import FortressTestResult, SequentialFortressResult
+
+@record
+class Profile:
+    """Record with an array field of varying shape and an optional scalar."""
+    name: str
+    values: np.ndarray
+    weight: float = None
+
+def _fortress(mean, entropy=None):
+    return FortressTestResult(
+        mean_ratio=mean, std_dev=0.01, convergence_rate=0.5, converged=3, stability_passes=2,
+        mean_stability_window=1.5, seeds=6, iterations=40, particles=200, max_imbalance=1000.0,
+        entropy=entropy, trajectories=np.ones((6, 40))
+    )
+
+def _sequential(mean, entropy=None):
+    return SequentialFortressResult(
+        mean=mean, std=0.02, sem=0.001, ci=np.array([mean - 0.002, mean + 0.002]), seeds=32, batches=2,
+        resolved=True, target_sem=0.001, entropy=entropy
+    )
+
+def _same(original, rebuilt):
+    assert type(original) is type(rebuilt)
+    for name in type(original).__slots__:
+        if name == 'trajectories':
+            assert rebuilt.trajectories is None  # not a stored field
+            continue
+        x, y = getattr(original, name), getattr(rebuilt, name)
+        if isinstance(x, np.ndarray) or isinstance(y, np.ndarray):
+            np.testing.assert_array_equal(x, y)
+        else:
+            assert x == y, name
+
+def test_round_trip_with_nulls_mixed_types_and_compaction(tmp_path):
+    store = ResultsStore(str(tmp_path))
+    assert store.types() == [] and store.latest(FortressTestResult) is None
+
+    appended = [
+        (_fortress(0.751), _sequential(0.749), Profile('a', np.arange(3.0))),
+        (_fortress(0.752, entropy=7), Profile('b', np.arange(6.0).reshape(2, 3), weight=2.5)),
+        (_sequential(0.748, entropy=9), Profile('c', np.float64(4.0)), _fortress(0.753), Profile('d', None)),
+    ]
+    for batch in appended:
+        store.append(*batch)
+    expected = {}
+    for batch in appended:
+        for result in batch:
+            expected.setdefault(type(result).__name__, []).append(result)
+    assert store.types() == sorted(expected)
+
+    def check():
+        for name, results in expected.items():
+            loaded = store.records(name)
+            assert len(loaded) == len(results)
+            for original, rebuilt in zip(results, loaded):
+                _same(original, rebuilt)
+            _same(results[-1], store.latest(name))
+
+    check()
+    assert store.latest(FortressTestResult).entropy is None
+    assert list(store.columns(FortressTestResult)['entropy']) == [None, 7, None]
+    assert list(store.columns('Profile')['weight']) == [None, 2.5, None, None]
+    assert store.latest('Profile').values is None
+
+    store.compact()
+    for name in expected:
+        assert len([n for n in os.listdir(tmp_path / name) if n.endswith('.npz')]) == 1
+    check()
+
+    store.append(_fortress(0.754, entropy=1))  # appending after compaction adds a part
+    assert store.latest(FortressTestResult).mean_ratio == 0.754
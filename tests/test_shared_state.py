@@ -0,0 +1,55 @@
+import numpy as np
+
+from shared_state import SHARED_STREAM, SharedParticles, evolve_shared, merge_moments
+from sine_kernels import variance_ratio
+
+PARTICLES = 1000
+SLAB_ROWS = 96  # 11 slabs, the last one short
+
+def _serial_state(entropy, scales, steps):
+    """The slab-seeded initial state stepped in this process."""
+    slabs = []
+    for slab, start in enumerate(range(0, PARTICLES, SLAB_ROWS)):
+        rows = min(SLAB_ROWS, PARTICLES - start)
+        rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(SHARED_STREAM, PARTICLES, slab)))
+        slabs.append(rng.normal(0, 1, (rows, 4)) * scales)
+    data = np.concatenate(slabs)
+    for _ in range(steps):
+        data = np.sin(np.pi * data)
+    return data
+
+def test_merge_matches_whole_array_moments():
+    rng = np.random.default_rng(0)
+    data = rng.normal(0, [1, 2, 3, 40], (1000, 4))
+    bounds = [0, 7, 300, 301, 1000]
+    parts = [data[a:b] for a, b in zip(bounds, bounds[1:])]
+    count, mean, m2 = merge_moments(
+        np.array([len(p) for p in parts]),
+        np.array([p.mean(axis=0) for p in parts]),
+        np.array([((p - p.mean(axis=0)) ** 2).sum(axis=0) for p in parts])
+    )
+    assert count == len(data)
+    np.testing.assert_allclose(mean, data.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(m2, ((data - data.mean(axis=0)) ** 2).sum(axis=0), rtol=1e-12)
+
+def test_slab_merge_matches_serial_evolution():
+    scales = np.array([1.0, 1.0, 1.0, 10.0])
+    with SharedParticles(PARTICLES, workers=2, entropy=11, scales=scales, slab_rows=SLAB_ROWS) as state:
+        assert state.slabs == 11
+        np.testing.assert_array_equal(state.data, _serial_state(11, scales, 0))
+        count, mean, m2 = state.step(5)
+        reference = _serial_state(11, scales, 5)
+        np.testing.assert_allclose(state.data, reference, rtol=0, atol=1e-12)
+    assert count == PARTICLES
+    np.testing.assert_allclose(mean, reference.mean(axis=0), rtol=0, atol=1e-12)
+    np.testing.assert_allclose(m2, ((reference - reference.mean(axis=0)) ** 2).sum(axis=0), rtol=1e-10)
+
+def test_bit_identical_across_worker_counts():
+    runs = [evolve_shared(PARTICLES, 30, workers=w, entropy=5, slab_rows=SLAB_ROWS) for w in (1, 2, 3)]
+    assert runs[0] == runs[1] == runs[2]
+    converged = [evolve_shared(PARTICLES, 200, workers=w, entropy=5, converge=5, slab_rows=SLAB_ROWS) for w in (1, 3)]
+    assert converged[0] == converged[1]
+    reference = _serial_state(5, np.ones(4), 30)
+    count = len(reference)
+    m2 = ((reference - reference.mean(axis=0)) ** 2).sum(axis=0)
+    assert abs(runs[0][0] - float(variance_ratio(count, m2))) < 1e-12
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from sine_kernels import evolve_moments, sine_step, sine_step_moments, variance_ratio
+
+SEEDS, PARTICLES, ITERATIONS = 5, 300, 50
+
+def _initial_state(seed=0):
+    rng = np.random.default_rng(seed)
+    scales = np.ones((SEEDS, 1, 4))
+    scales[np.arange(SEEDS), 0, rng.integers(0, 4, SEEDS)] = rng.uniform(1, 1000, SEEDS)
+    return rng.normal(0, 1, (SEEDS, PARTICLES, 4)) * scales
+
+def _reference(state, iterations, gain=np.pi):
+    """Per-seed loop of the original engine: fresh arrays and np.var every iteration."""
+    gains = np.broadcast_to(gain, (len(state),))
+    finals, ratios, variances = [], [], []
+    for data, g in zip(state, gains):
+        trajectory = np.zeros(iterations)
+        for i in range(iterations):
+            data = np.sin(data * g)
+            current_vars = np.var(data, axis=0)
+            trajectory[i] = np.sum(current_vars[:3]) / np.sum(current_vars)
+        finals.append(data)
+        ratios.append(trajectory)
+        variances.append(np.var(data, axis=0))
+    return np.array(finals), np.array(ratios), np.array(variances)
+
+@pytest.mark.parametrize('block_rows, tile_bytes', [(2048, 1 << 20), (64, 64 * 4 * 8 * 2)])
+def test_batched_fused_step_matches_per_seed_loop(block_rows, tile_bytes):
+    state = _initial_state()
+    finals, trajectories, variances = _reference(state, ITERATIONS)
+
+    batch = state.copy()
+    ratios = np.zeros((SEEDS, ITERATIONS))
+    for i in range(ITERATIONS):
+        count, mean, m2 = sine_step_moments(batch, block_rows=block_rows, tile_bytes=tile_bytes)
+        ratios[:, i] = variance_ratio(count, m2)
+
+    np.testing.assert_array_equal(batch, finals)  # the fused step is the same arithmetic
+    assert count == PARTICLES
+    np.testing.assert_allclose(mean, finals.mean(axis=1), rtol=0, atol=1e-14)
+    np.testing.assert_allclose(m2 / count, variances, rtol=1e-12)
+    np.testing.assert_allclose(ratios, trajectories, rtol=0, atol=1e-12)
+
+def test_per_seed_gain_and_evolve_moments():
+    state = _initial_state(1)
+    gains = np.linspace(2.5, np.pi, SEEDS)
+    finals, _, variances = _reference(state, ITERATIONS, gains)
+
+    batch = state.copy()
+    count, mean, m2 = evolve_moments(batch, ITERATIONS, gain=gains, block_rows=128)
+    np.testing.assert_array_equal(batch, finals)
+    np.testing.assert_allclose(m2 / count, variances, rtol=1e-12)
+
+    single = state[2].copy()
+    sine_step(single, ITERATIONS, gain=gains[2])
+    np.testing.assert_array_equal(single, finals[2])
@@ -0,0 +1,27 @@
+import pytest
+
+import plotting
+import result_cache
+import UNIVERSAL_RECURSION_ENGINE as engine
+
+class Interrupted(Exception):
+    pass
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(result_cache, '_default_cache', None)
+    monkeypatch.setattr(result_cache, '_configured', True)
+
+def test_background_renderer_stops_when_a_later_test_fails(tmp_path, monkeypatch):
+    small = engine.run_fortress_test.uncached(seeds=4, iterations=120, particles=200, entropy=1)
+    monkeypatch.setattr(engine, 'run_fortress_test', lambda **kwargs: small)
+
+    def fail(**kwargs):
+        assert plotting._executor is not None  # the render is running alongside
+        raise Interrupted
+
+    monkeypatch.setattr(engine, 'test_perturbation_resilience', fail)
+    with pytest.raises(Interrupted):
+        engine.run_complete_fortress_suite(report=None, plot=str(tmp_path / 'convergence.png'))
+    assert plotting._executor is None
+    assert (tmp_path / 'convergence.npz').exists()
@@ -0,0 +1,85 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+import result_cache
+from goldilocks_audit import _goldilocks_sweep
+from queue_tasks import failing_chunk, square_chunk
+from UNIVERSAL_RECURSION_ENGINE import run_fortress_test
+from work_queue import WorkQueue, iter_queue_sweep
+
+def test_claim_takeover_release_two_owners(tmp_path):
+    sweep = WorkQueue(str(tmp_path), lease_seconds=0.5).submit(square_chunk, 4, 2)
+    shard = sweep.shards[0]
+
+    assert sweep.claim(shard, 'a')
+    assert not sweep.claim(shard, 'b')  # live lease
+    assert sweep.lease_owner(shard) == 'a'
+
+    time.sleep(0.7)  # a stalls past the lease timeout
+    assert sweep.claim(shard, 'b')
+    assert sweep.lease_owner(shard) == 'b'
+
+    # The stalled owner can neither renew nor release b's lease
+    assert not sweep.renew(shard, 'a')
+    assert not sweep.release(shard, 'a')
+    assert sweep.lease_owner(shard) == 'b'
+    assert not sweep.claim(shard, 'c')
+
+    assert sweep.release(shard, 'b')
+    assert sweep.lease_owner(shard) is None
+    assert sweep.claim(shard, 'c')
+
+def test_fresh_lease_survives_takeover_race(tmp_path):
+    sweep = WorkQueue(str(tmp_path), lease_seconds=0.5).submit(square_chunk, 4, 2)
+    shard = sweep.shards[0]
+    assert sweep.claim(shard, 'a')
+    time.sleep(0.7)
+    # b saw the stale lease, but a renewed it before b's rename: b must back off
+    lease = sweep._file('leases', shard, '.lease')
+    expired = sweep._expired
+    sweep._expired = lambda path: path == lease or expired(path)
+    assert sweep.renew(shard, 'a')
+    assert not sweep.claim(shard, 'b')
+    assert sweep.lease_owner(shard) == 'a'
+
+def test_queue_matches_in_process(tmp_path):
+    results = list(iter_queue_sweep(str(tmp_path), square_chunk, 23, chunk_size=5, shards=1, poll=0.01))
+    assert [(start, stop) for start, stop, _ in results] == [(0, 5), (5, 10), (10, 15), (15, 20), (20, 23)]
+    np.testing.assert_array_equal(np.concatenate([r for _, _, r in results]), np.arange(23) ** 2)
+
+def test_engine_sweeps_match_in_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, '_default_cache', None)
+    monkeypatch.setattr(result_cache, '_configured', True)
+    kwargs = dict(seeds=5, iterations=30, particles=200, entropy=4, converge=5)
+    local = run_fortress_test(**kwargs)
+    queued = run_fortress_test(**kwargs, queue_dir=str(tmp_path / 'fortress'))
+    assert queued.mean_ratio == local.mean_ratio
+    np.testing.assert_array_equal(queued.trajectories, local.trajectories)
+    assert WorkQueue(str(tmp_path / 'fortress')).sweeps()[0].status()['done'] == 5
+
+    args = ([3, 4], 4, 50, 1, 9, 10, 'jacobi', None, 50)
+    for expected, actual in zip(_goldilocks_sweep.uncached(*args),
+                                _goldilocks_sweep.uncached(*args, queue_dir=str(tmp_path / 'goldilocks'))):
+        np.testing.assert_array_equal(expected, actual)
+
+def test_resubmit_retries_failed_shards(tmp_path):
+    marker = str(tmp_path / 'healthy')
+    root = str(tmp_path / 'queue')
+    with pytest.raises(RuntimeError, match='transient failure'):
+        list(iter_queue_sweep(root, failing_chunk, 4, chunk_size=2, poll=0.01, marker=marker))
+    open(marker, 'w').close()
+    results = list(iter_queue_sweep(root, failing_chunk, 4, chunk_size=2, poll=0.01, marker=marker))
+    np.testing.assert_array_equal(np.concatenate([r for _, _, r in results]), np.arange(4))
+
+def test_closing_early_stops_local_workers(tmp_path):
+    sweep = iter_queue_sweep(str(tmp_path), square_chunk, 40, workers=2, chunk_size=1, poll=0.05, delay=0.5)
+    t = time.time()
+    next(sweep)
+    sweep.close()
+    assert time.time() - t < 5
+    queue_sweep = WorkQueue(str(tmp_path)).sweeps()[0]
+    assert queue_sweep.status()['done'] < 10
+    assert queue_sweep.status()['leased'] == 0